@@ -291,7 +291,7 @@ async def get_dependencies(current_user: str = Depends(verify_token)):
                     "fastapi", "uvicorn", "pydantic", "starlette", "requests", 
                     "bs4", "dotenv", "pandas", "numpy",  # Updated to use import names
                     "matplotlib", "seaborn", "plotly", "scipy", "statsmodels",
-                    "dash", "streamlit", "pytest", "httpx", "jose", "passlib"
+                    "dash", "streamlit", "pytest", "httpx", "PyJWT", "passlib"
                 ]
                 
                 for package_name in common_packages:
@@ -10,11 +10,13 @@ O decorator principal `cache_result` suporta:
 - Suporte para múltiplos provedores de cache
 """
 
-from functools import wraps
+from functools import lru_cache, wraps
 import hashlib
-from datetime import datetime, timedelta
 import logging
+import time
 import asyncio
+from typing import Any, Dict, Tuple
+from wsgiref.handlers import format_date_time
 
 # Re-exportar classes e funções principais
 from app.core.cache.interface import CacheProvider, TaggedCacheProvider, CacheInfo
@@ -22,16 +24,18 @@ from app.core.cache.factory import CacheFactory
 from app.core.cache.memory_provider import MemoryCacheProvider
 from app.core.cache.file_provider import FileCacheProvider
 from app.core.cache.decorator import cache_result, invalidate_cache_tag
+from app.core.cache.request_cache import REQ_CACHE
 
 logger = logging.getLogger(__name__)
 
-# Dicionário global para armazenar o cache (mantido para backward compatibility)
-CACHE = {}
+# Dicionário global para armazenar o cache (mantido para backward compatibility):
+# {chave: (valor, expiração em time.monotonic_ns())}
+CACHE: Dict[str, Tuple[Any, int]] = {}
 
 async def clear_cache():
     """Limpa todo o cache"""
-    global CACHE
-    CACHE = {}
+    # Limpar no lugar: loaders guardam referência ao dicionário
+    CACHE.clear()
     logger.info("Cache cleared")
     
     # Also clear cache in providers
@@ -46,8 +50,7 @@ async def clear_cache():
 
 def clear_cache_sync():
     """Versão síncrona de clear_cache para compatibilidade com código existente"""
-    global CACHE
-    CACHE = {}
+    CACHE.clear()
     logger.info("Cache cleared (sync)")
     
     # For synchronous code that can't use await
@@ -76,7 +79,7 @@ def clear_cache_sync():
 
 def get_cache_info():
     """Retorna informações sobre o cache atual"""
-    current_time = datetime.utcnow()
+    current_time = time.monotonic_ns()
     cache_info = {
         "total_entries": len(CACHE),
         "valid_entries": sum(1 for _, expiry in CACHE.values() if current_time < expiry),
@@ -84,7 +87,7 @@ def get_cache_info():
         "entries": [
             {
                 "key": key,
-                "expires_in": (expiry - current_time).total_seconds() if expiry > current_time else "expirado",
+                "expires_in": (expiry - current_time) / 1e9 if expiry > current_time else "expirado",
                 "is_valid": expiry > current_time
             }
             for key, (_, expiry) in CACHE.items()
@@ -92,17 +95,33 @@ def get_cache_info():
     }
     return cache_info
 
+@lru_cache(maxsize=256)
+def _expires_header(now: int, max_age: int) -> str:
+    """
+    Formata o header Expires (data HTTP em GMT).
+    
+    Cacheado por (segundo atual, max_age): cada combinação é formatada
+    uma única vez por segundo. Usado também pelo CacheControlMiddleware.
+    
+    Args:
+        now: Timestamp atual em segundos inteiros
+        max_age: Tempo de cache em segundos
+        
+    Returns:
+        Data de expiração no formato "Wed, 21 Oct 2015 07:28:00 GMT"
+    """
+    return format_date_time(now + max_age)
+
 def add_cache_headers(response, max_age=3600):
     """
     Adiciona headers de cache HTTP à resposta.
     """
-    expiry_time = (datetime.utcnow() + timedelta(seconds=max_age)).strftime("%a, %d %b %Y %H:%M:%S GMT")
     response.headers["Cache-Control"] = f"max-age={max_age}, public"
-    response.headers["Expires"] = expiry_time
+    response.headers["Expires"] = _expires_header(int(time.time()), max_age)
     
     # Gerar um ETag simples baseado no conteúdo da resposta
     if hasattr(response, "body") and response.body:
-        etag = hashlib.md5(response.body).hexdigest()
+        etag = hashlib.blake2b(response.body, digest_size=16).hexdigest()
         response.headers["ETag"] = f'"{etag}"'
 
 # Exportar decorator de cache para compatibilidade com código existente
@@ -119,5 +138,6 @@ __all__ = [
     'clear_cache_sync',
     'get_cache_info',
     'add_cache_headers',
+    'REQ_CACHE',
     'CACHE'
 ]
@@ -10,7 +10,6 @@ import json
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TypeVar, cast, overload
 from functools import wraps
-from datetime import datetime, timedelta
 
 from app.core.cache.factory import CacheFactory
 from app.core.cache.interface import TaggedCacheProvider
@@ -153,8 +152,8 @@ def _cache_decorator(
                 from app.core.cache import CACHE
                 # Ensure ttl_seconds is not None before using it
                 seconds_value = ttl_seconds if ttl_seconds is not None else 3600
-                expiry_time = datetime.utcnow() + timedelta(seconds=float(seconds_value))
-                CACHE[cache_key] = (result, expiry_time)
+                expiry_ns = time.monotonic_ns() + int(seconds_value * 1_000_000_000)
+                CACHE[cache_key] = (result, expiry_ns)
             except ImportError:
                 pass
             
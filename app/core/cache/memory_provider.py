@@ -3,18 +3,70 @@ Implementação de cache em memória.
 
 Fornece um provedor de cache que armazena dados na memória do processo.
 """
-import logging
+import array
 import time
 from typing import Any, Dict, List, Optional, Set, Union, TypeVar, Generic
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from app.core.cache.interface import CacheProvider, TaggedCacheProvider, CacheInfo
+from app.core.cache.request_cache import REQ_CACHE
+
+# Sentinela para distinguir chave ausente de valor None armazenado
+_MISSING = object()
+
+class _SetPool:
+    """
+    Pool de objetos set reutilizáveis para os índices de tags.
+    
+    Sets liberados são limpos e guardados para reaproveitamento, evitando
+    uma nova alocação a cada tag criada ou invalidada.
+    """
+    
+    def __init__(self, max_pooled: int = 256, max_set_size: int = 1024):
+        """
+        Inicializa o pool.
+        
+        Args:
+            max_pooled: Número máximo de sets mantidos no pool
+            max_set_size: Sets maiores que este limite não são reaproveitados
+        """
+        self._pool: List[Set[str]] = []
+        self._max_pooled = max_pooled
+        self._max_set_size = max_set_size
+    
+    def acquire(self) -> Set[str]:
+        """
+        Obtém um set vazio, reaproveitando um do pool se houver.
+        
+        Returns:
+            Set vazio
+        """
+        return self._pool.pop() if self._pool else set()
+    
+    def release(self, items: Set[str]) -> None:
+        """
+        Devolve um set ao pool.
+        
+        Args:
+            items: Set que não será mais utilizado pelo chamador
+        """
+        # Sets grandes mantêm a tabela interna alocada mesmo após clear()
+        if len(items) > self._max_set_size or len(self._pool) >= self._max_pooled:
+            return
+        items.clear()
+        self._pool.append(items)
 
-logger = logging.getLogger(__name__)
+_set_pool = _SetPool()
 
 class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
     """
     Implementação de cache em memória com suporte a tags.
+    
+    Como nenhuma operação faz I/O, cada método assíncrono delega para uma
+    versão síncrona (sufixo `_sync`), que pode ser chamada diretamente em
+    código síncrono sem criar corrotinas.
     """
     
     def __init__(self, max_size: Optional[int] = None):
@@ -24,14 +76,91 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         Args:
             max_size: Tamanho máximo do cache (opcional)
         """
+        # Os dicts não são pré-dimensionados por max_size: o CPython não oferece
+        # dica de capacidade para dicts vazios (dict.clear() libera a tabela) e
+        # o crescimento incremental já tem custo amortizado O(1)
         self._cache: Dict[str, Any] = {}
-        self._expiry: Dict[str, int] = {}  # timestamp de expiração
+        # Timestamps de expiração em um buffer int64 contíguo; _exp_keys[i]
+        # é a chave cujo timestamp está em _exp_arr[i]
+        self._exp_arr = array.array('q')
+        self._exp_keys: List[str] = []
+        self._key_to_idx: Dict[str, int] = {}  # key -> índice em _exp_arr
         self._tags: Dict[str, List[str]] = {}  # key -> [tags]
         self._tag_keys: Dict[str, Set[str]] = {}  # tag -> {keys}
         self._max_size = max_size
+        # Contadores simples, sem lock: incrementos concorrentes de threads
+        # diferentes podem se perder, então os valores são aproximados
         self._hits = 0
         self._misses = 0
     
+    def _request_cache(self) -> Optional[Dict[str, Any]]:
+        """Obtém o cache desta instância na requisição atual, se houver."""
+        scope = REQ_CACHE.get()
+        if scope is None:
+            return None
+        req_cache = scope.get(self)
+        if req_cache is None:
+            req_cache = scope[self] = {}
+        return req_cache
+    
+    def _get_expiry(self, key: str) -> Optional[int]:
+        """Obtém o timestamp de expiração de uma chave, se houver."""
+        idx = self._key_to_idx.get(key)
+        return None if idx is None else self._exp_arr[idx]
+    
+    def _set_expiry(self, key: str, expiry: int) -> None:
+        """Define o timestamp de expiração de uma chave."""
+        idx = self._key_to_idx.get(key)
+        if idx is None:
+            self._key_to_idx[key] = len(self._exp_keys)
+            self._exp_keys.append(key)
+            self._exp_arr.append(expiry)
+        else:
+            self._exp_arr[idx] = expiry
+    
+    def _remove_expiry(self, key: str) -> None:
+        """Remove a expiração de uma chave mantendo o buffer contíguo."""
+        idx = self._key_to_idx.pop(key, None)
+        if idx is None:
+            return
+        # Mover o último item para a posição removida (O(1))
+        last_key = self._exp_keys.pop()
+        last_expiry = self._exp_arr.pop()
+        if last_key != key:
+            self._exp_keys[idx] = last_key
+            self._exp_arr[idx] = last_expiry
+            self._key_to_idx[last_key] = idx
+    
+    def get_sync(self, key: str) -> Optional[Any]:
+        """Versão síncrona de get."""
+        # Consultar primeiro o cache da requisição atual, se houver
+        req_cache = self._request_cache()
+        if req_cache is not None:
+            value = req_cache.get(key, _MISSING)
+            if value is not _MISSING:
+                self._hits += 1
+                return value
+        
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            # Chave não encontrada
+            self._misses += 1
+            return None
+        
+        # Verificar expiração
+        expiry = self._get_expiry(key)
+        if expiry is not None and expiry < int(time.time()):
+            # Expirado, remover e retornar None
+            self.delete_sync(key)
+            self._misses += 1
+            return None
+        
+        # Chave válida
+        self._hits += 1
+        if req_cache is not None:
+            req_cache[key] = value
+        return value
+    
     async def get(self, key: str) -> Optional[Any]:
         """
         Obtém um valor do cache.
@@ -42,22 +171,32 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         Returns:
             Valor associado à chave ou None se não encontrado
         """
-        # Verificar se a chave existe e não expirou
-        if key in self._cache:
-            # Verificar expiração
-            if key in self._expiry and self._expiry[key] < int(time.time()):
-                # Expirado, remover e retornar None
-                await self.delete(key)
-                self._misses += 1
-                return None
-            
-            # Chave válida
-            self._hits += 1
-            return self._cache[key]
+        return self.get_sync(key)
+    
+    def set_sync(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Versão síncrona de set."""
+        # Verificar limite de tamanho
+        if self._max_size and len(self._cache) >= self._max_size and key not in self._cache:
+            # Remover a chave mais antiga (FIFO)
+            oldest_key = next(iter(self._cache))
+            self.delete_sync(oldest_key)
+        
+        # Armazenar valor
+        self._cache[key] = value
         
-        # Chave não encontrada
-        self._misses += 1
-        return None
+        # Descartar valor antigo visto pela requisição atual
+        req_cache = self._request_cache()
+        if req_cache is not None:
+            req_cache.pop(key, None)
+        
+        # Definir expiração se ttl for fornecido
+        if ttl is not None:
+            self._set_expiry(key, int(time.time()) + ttl)
+        else:
+            # Remover expiração se ttl for None
+            self._remove_expiry(key)
+        
+        return True
     
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
@@ -71,21 +210,28 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         Returns:
             True se o valor foi armazenado com sucesso, False caso contrário
         """
-        # Verificar limite de tamanho
-        if self._max_size and len(self._cache) >= self._max_size and key not in self._cache:
-            # Remover a chave mais antiga (FIFO)
-            oldest_key = next(iter(self._cache))
-            await self.delete(oldest_key)
+        return self.set_sync(key, value, ttl)
+    
+    def delete_sync(self, key: str) -> bool:
+        """Versão síncrona de delete."""
+        req_cache = self._request_cache()
+        if req_cache is not None:
+            req_cache.pop(key, None)
         
-        # Armazenar valor
-        self._cache[key] = value
+        # Remover valor
+        if self._cache.pop(key, _MISSING) is _MISSING:
+            return False
         
-        # Definir expiração se ttl for fornecido
-        if ttl is not None:
-            self._expiry[key] = int(time.time()) + ttl
-        elif key in self._expiry:
-            # Remover expiração se ttl for None
-            del self._expiry[key]
+        # Remover expiração
+        self._remove_expiry(key)
+        
+        # Remover tags e a chave de todas as listas de tag_keys
+        tags = self._tags.pop(key, None)
+        if tags is not None:
+            for tag in tags:
+                tag_keys = self._tag_keys.get(tag)
+                if tag_keys is not None:
+                    tag_keys.discard(key)
         
         return True
     
@@ -99,27 +245,22 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         Returns:
             True se o valor foi removido com sucesso, False caso contrário
         """
-        if key in self._cache:
-            # Remover valor
-            del self._cache[key]
-            
-            # Remover expiração
-            if key in self._expiry:
-                del self._expiry[key]
-            
-            # Remover tags
-            if key in self._tags:
-                # Remover chave de todas as listas de tag_keys
-                for tag in self._tags[key]:
-                    if tag in self._tag_keys and key in self._tag_keys[tag]:
-                        self._tag_keys[tag].remove(key)
-                
-                # Remover lista de tags da chave
-                del self._tags[key]
-            
-            return True
-        
-        return False
+        return self.delete_sync(key)
+    
+    def clear_sync(self) -> bool:
+        """Versão síncrona de clear, usada por clear_cache_sync."""
+        req_cache = self._request_cache()
+        if req_cache is not None:
+            req_cache.clear()
+        self._cache.clear()
+        del self._exp_arr[:]
+        self._exp_keys.clear()
+        self._key_to_idx.clear()
+        self._tags.clear()
+        for keys in self._tag_keys.values():
+            _set_pool.release(keys)
+        self._tag_keys.clear()
+        return True
     
     async def clear(self) -> bool:
         """
@@ -128,10 +269,22 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         Returns:
             True se o cache foi limpo com sucesso, False caso contrário
         """
-        self._cache.clear()
-        self._expiry.clear()
-        self._tags.clear()
-        self._tag_keys.clear()
+        return self.clear_sync()
+    
+    def has_sync(self, key: str) -> bool:
+        """Versão síncrona de has."""
+        if key not in self._cache:
+            # Chave não encontrada
+            return False
+        
+        # Verificar expiração
+        expiry = self._get_expiry(key)
+        if expiry is not None and expiry < int(time.time()):
+            # Expirado, remover e retornar False
+            self.delete_sync(key)
+            return False
+        
+        # Chave válida
         return True
     
     async def has(self, key: str) -> bool:
@@ -144,19 +297,15 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         Returns:
             True se a chave existe, False caso contrário
         """
-        # Verificar se a chave existe e não expirou
-        if key in self._cache:
-            # Verificar expiração
-            if key in self._expiry and self._expiry[key] < int(time.time()):
-                # Expirado, remover e retornar False
-                await self.delete(key)
-                return False
-            
-            # Chave válida
-            return True
-        
-        # Chave não encontrada
-        return False
+        return self.has_sync(key)
+    
+    def ttl_sync(self, key: str) -> Optional[int]:
+        """Versão síncrona de ttl."""
+        # Só existem expirações para chaves presentes em _cache
+        expiry = self._get_expiry(key)
+        if expiry is None:
+            return None
+        return max(0, expiry - int(time.time()))
     
     async def ttl(self, key: str) -> Optional[int]:
         """
@@ -168,26 +317,12 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         Returns:
             Tempo de vida restante em segundos ou None se a chave não existe ou não tem TTL
         """
-        if key in self._cache and key in self._expiry:
-            ttl = self._expiry[key] - int(time.time())
-            return max(0, ttl)
-        return None
+        return self.ttl_sync(key)
     
-    async def set_with_tags(self, key: str, value: Any, tags: List[str], ttl: Optional[int] = None) -> bool:
-        """
-        Define um valor no cache com tags associadas.
-        
-        Args:
-            key: Chave para armazenar
-            value: Valor a ser armazenado
-            tags: Lista de tags a serem associadas à chave
-            ttl: Tempo de vida em segundos (opcional)
-            
-        Returns:
-            True se o valor foi armazenado com sucesso, False caso contrário
-        """
+    def set_with_tags_sync(self, key: str, value: Any, tags: List[str], ttl: Optional[int] = None) -> bool:
+        """Versão síncrona de set_with_tags."""
         # Armazenar valor
-        await self.set(key, value, ttl)
+        self.set_sync(key, value, ttl)
         
         # Associar tags
         self._tags[key] = list(set(tags))  # Remover duplicatas
@@ -195,43 +330,54 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         # Atualizar tag_keys
         for tag in self._tags[key]:
             if tag not in self._tag_keys:
-                self._tag_keys[tag] = set()
+                self._tag_keys[tag] = _set_pool.acquire()
             self._tag_keys[tag].add(key)
         
         return True
     
-    async def get_by_tag(self, tag: str) -> Dict[str, Any]:
+    async def set_with_tags(self, key: str, value: Any, tags: List[str], ttl: Optional[int] = None) -> bool:
         """
-        Obtém todos os valores associados a uma tag.
+        Define um valor no cache com tags associadas.
         
         Args:
-            tag: Tag para buscar
+            key: Chave para armazenar
+            value: Valor a ser armazenado
+            tags: Lista de tags a serem associadas à chave
+            ttl: Tempo de vida em segundos (opcional)
             
         Returns:
-            Dicionário de chaves e valores associados à tag
+            True se o valor foi armazenado com sucesso, False caso contrário
         """
+        return self.set_with_tags_sync(key, value, tags, ttl)
+    
+    def get_by_tag_sync(self, tag: str) -> Dict[str, Any]:
+        """Versão síncrona de get_by_tag."""
         result = {}
         
         if tag in self._tag_keys:
             # Obter todas as chaves associadas à tag
             for key in list(self._tag_keys[tag]):
                 # Verificar se a chave ainda existe e não expirou
-                value = await self.get(key)
+                value = self.get_sync(key)
                 if value is not None:
                     result[key] = value
         
         return result
     
-    async def invalidate_tag(self, tag: str) -> int:
+    async def get_by_tag(self, tag: str) -> Dict[str, Any]:
         """
-        Invalida todas as chaves associadas a uma tag.
+        Obtém todos os valores associados a uma tag.
         
         Args:
-            tag: Tag a ser invalidada
+            tag: Tag para buscar
             
         Returns:
-            Número de chaves invalidadas
+            Dicionário de chaves e valores associados à tag
         """
+        return self.get_by_tag_sync(tag)
+    
+    def invalidate_tag_sync(self, tag: str) -> int:
+        """Versão síncrona de invalidate_tag."""
         count = 0
         
         if tag in self._tag_keys:
@@ -240,14 +386,28 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
             
             # Remover todas as chaves
             for key in keys:
-                if await self.delete(key):
+                if self.delete_sync(key):
                     count += 1
             
-            # Limpar a tag
-            self._tag_keys[tag] = set()
+            # Remover a tag e devolver o set ao pool
+            tag_keys = self._tag_keys.pop(tag, None)
+            if tag_keys is not None:
+                _set_pool.release(tag_keys)
         
         return count
     
+    async def invalidate_tag(self, tag: str) -> int:
+        """
+        Invalida todas as chaves associadas a uma tag.
+        
+        Args:
+            tag: Tag a ser invalidada
+            
+        Returns:
+            Número de chaves invalidadas
+        """
+        return self.invalidate_tag_sync(tag)
+    
     async def get_tags(self, key: str) -> List[str]:
         """
         Obtém todas as tags associadas a uma chave.
@@ -260,24 +420,24 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
         """
         return self._tags.get(key, [])
     
-    async def get_info(self) -> CacheInfo:
-        """
-        Obtém informações sobre o cache.
-        
-        Returns:
-            Objeto CacheInfo com informações sobre o cache
-        """
+    def get_info_sync(self) -> CacheInfo:
+        """Versão síncrona de get_info."""
         # Verificar e remover chaves expiradas
         now = int(time.time())
-        expired_keys = [key for key, exp_time in self._expiry.items() if exp_time < now]
+        expired_keys: List[str] = []
+        if self._exp_keys:
+            expiries = np.frombuffer(self._exp_arr, dtype=np.int64)
+            expired_keys = [self._exp_keys[i] for i in np.flatnonzero(expiries < now)]
+            # Liberar a view antes de remover itens do buffer
+            del expiries
         for key in expired_keys:
-            await self.delete(key)
+            self.delete_sync(key)
         
         # Coletar estatísticas
         stats = {
             "expired_keys_removed": len(expired_keys),
             "tag_count": len(self._tag_keys),
-            "keys_with_ttl": len(self._expiry)
+            "keys_with_ttl": len(self._exp_keys)
         }
         
         return CacheInfo(
@@ -289,3 +449,12 @@ class MemoryCacheProvider(TaggedCacheProvider[str, Any]):
             tags=list(self._tag_keys.keys()),
             stats=stats
         )
+    
+    async def get_info(self) -> CacheInfo:
+        """
+        Obtém informações sobre o cache.
+        
+        Returns:
+            Objeto CacheInfo com informações sobre o cache
+        """
+        return self.get_info_sync()
@@ -0,0 +1,12 @@
+"""
+Cache com escopo de requisição.
+
+Mantém dicionários que vivem apenas durante uma requisição e são consultados
+antes do cache do processo, evitando repetir buscas e verificações de TTL
+quando a mesma chave é lida várias vezes na mesma requisição.
+"""
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# Escopo da requisição atual (provider -> {chave: valor}); None fora de uma requisição
+REQ_CACHE: ContextVar[Optional[Dict[Any, Dict[str, Any]]]] = ContextVar("req_cache", default=None)
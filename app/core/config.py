@@ -1,18 +1,21 @@
 import os
+from dataclasses import dataclass, field
+from typing import Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "VitiBrasil API"
-    
+
     # JWT Config
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "sua_chave_secreta_aqui")
+    SECRET_KEY: str = field(default_factory=lambda: os.getenv("SECRET_KEY", "sua_chave_secreta_aqui"))
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
-    # CORS
-    BACKEND_CORS_ORIGINS: list = ["*"]
-    
+
+    # CORS (tupla para que a configuração não possa ser alterada em tempo de execução)
+    BACKEND_CORS_ORIGINS: Tuple[str, ...] = ("*",)
+
 settings = Settings()
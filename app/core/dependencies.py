@@ -13,9 +13,10 @@ from app.repositories.scraping_repository import BaseScrapingRepository
 from app.services.interfaces import DataService, BaseService, DataTransformerService
 from app.services.data_transformer import DataTransformerServiceImpl
 
-# Cache de instâncias de repositórios para evitar recriação desnecessária
-_repositories = {}
-_services = {}
+# Instâncias únicas criadas na importação do módulo e compartilhadas entre requisições
+_CSV_REPO = CSVFileRepository()
+_SCRAPING_REPO = BaseScrapingRepository()
+_DATA_TRANSFORMER = DataTransformerServiceImpl()
 
 # Dependências para repositórios
 
@@ -26,9 +27,7 @@ async def get_file_repository() -> FileRepository:
     Returns:
         Uma instância de CSVFileRepository
     """
-    if "csv_file_repository" not in _repositories:
-        _repositories["csv_file_repository"] = CSVFileRepository()
-    return _repositories["csv_file_repository"]
+    return _CSV_REPO
 
 async def get_scraping_repository() -> ScrapingRepository:
     """
@@ -37,12 +36,7 @@ async def get_scraping_repository() -> ScrapingRepository:
     Returns:
         Uma instância de BaseScrapingRepository
     """
-    if "base_scraping_repository" not in _repositories:
-        _repositories["base_scraping_repository"] = BaseScrapingRepository()
-    return _repositories["base_scraping_repository"]
-
-# Instâncias de serviços
-_services = {}
+    return _SCRAPING_REPO
 
 # Dependências para serviços
 async def get_data_transformer_service() -> DataTransformerService:
@@ -52,9 +46,7 @@ async def get_data_transformer_service() -> DataTransformerService:
     Returns:
         Uma instância de DataTransformerServiceImpl
     """
-    if "data_transformer" not in _services:
-        _services["data_transformer"] = DataTransformerServiceImpl()
-    return _services["data_transformer"]
+    return _DATA_TRANSFORMER
 
 async def get_production_service():
     """
@@ -4,81 +4,177 @@ Sistema centralizado de exceções.
 Define exceções personalizadas para a aplicação, permitindo um tratamento
 mais granular e específico de erros em diferentes componentes.
 """
-from typing import Any, Dict, Optional, List, Type, Union
+from typing import Any, Callable, Dict, Optional, List, Tuple, Type, Union
 import traceback
 import sys
-import inspect
 import logging
 
 logger = logging.getLogger(__name__)
 
+# sys._getframe é específico do CPython; sem ele a origem só vem do próprio logging
+_getframe = getattr(sys, "_getframe", None)
+
+# Tracebacks já formatados, por assinatura da exceção (tipo, mensagem e frames)
+_TRACEBACK_CACHE: Dict[Tuple[Any, ...], str] = {}
+_TRACEBACK_CACHE_SIZE = 256
+
+def _traceback_key(exc: Optional[BaseException]) -> Tuple[Any, ...]:
+    """
+    Gera a assinatura de uma exceção e de sua cadeia de causas.
+    
+    Usa o código e a linha de cada frame em vez de id() do traceback, que
+    pode ser reutilizado por outro objeto depois de liberado.
+    
+    Args:
+        exc: Exceção em tratamento
+        
+    Returns:
+        Tupla que identifica o texto formatado do traceback
+    """
+    parts = []
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        frames = []
+        tb = exc.__traceback__
+        while tb is not None:
+            frames.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+        parts.append((type(exc), str(exc), tuple(frames)))
+        exc = exc.__cause__ or (None if exc.__suppress_context__ else exc.__context__)
+    return tuple(parts)
+
+def _format_traceback(exc: BaseException) -> str:
+    """
+    Formata o traceback de uma exceção, reaproveitando o texto de erros repetidos.
+    
+    Args:
+        exc: Exceção em tratamento
+        
+    Returns:
+        Traceback formatado, equivalente a traceback.format_exc()
+    """
+    key = _traceback_key(exc)
+    text = _TRACEBACK_CACHE.get(key)
+    if text is None:
+        text = "".join(traceback.TracebackException.from_exception(exc).format())
+        if len(_TRACEBACK_CACHE) >= _TRACEBACK_CACHE_SIZE:
+            _TRACEBACK_CACHE.clear()
+        _TRACEBACK_CACHE[key] = text
+    return text
+
 class BaseAppException(Exception):
     """Exceção base para todas as exceções da aplicação."""
     
+    # Atributos em slots evitam o __dict__ por instância (traceback_info é uma property)
+    __slots__ = ("message", "details", "status_code", "error_code", "original_exception", "_traceback_text")
+    
+    # Nome da classe e valores padrão, resolvidos uma vez por classe; as
+    # subclasses só sobrescrevem estes atributos em vez de redefinir __init__
+    _cls_name: str = "BaseAppException"
+    _default_message: str = "Erro na aplicação"
+    _default_status_code: int = 500
+    _default_error_code: Optional[str] = None
+    
+    # Frames entre logger.log e quem criou a exceção (_log_exception + cada __init__)
+    _log_stacklevel: int = 3
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = cls.__name__
+        cls._log_stacklevel = 2 + sum(
+            1 for klass in cls.__mro__
+            if issubclass(klass, BaseAppException) and "__init__" in vars(klass)
+        )
+    
     def __init__(
         self, 
-        message: str = "Erro na aplicação", 
+        message: Optional[str] = None, 
         details: Optional[Dict[str, Any]] = None,
-        status_code: int = 500,
+        status_code: Optional[int] = None,
         error_code: Optional[str] = None,
         original_exception: Optional[Exception] = None
     ):
-        self.message = message
+        self.message = message if message is not None else self._default_message
         self.details = details or {}
-        self.status_code = status_code
-        self.error_code = error_code
+        self.status_code = status_code if status_code is not None else self._default_status_code
+        self.error_code = error_code or self._default_error_code
         self.original_exception = original_exception
-        
-        # Capturar informações adicionais sobre o erro
-        self.traceback_info = self._get_traceback_info()
-        self.caller_info = self._get_caller_info()
+        # Texto guardado por release_traceback; até lá o traceback é formatado sob demanda
+        self._traceback_text: Optional[str] = None
         
         # Registrar automaticamente o erro
         self._log_exception()
         
-        super().__init__(message)
+        super().__init__(self.message)
+    
+    def release_traceback(self) -> None:
+        """
+        Libera os frames retidos por esta exceção e pela exceção original.
+        
+        Para exceções guardadas além do seu tratamento (caches, filas, respostas
+        assíncronas). O traceback é formatado antes, e traceback_info continua
+        retornando o texto completo depois da liberação. Não deve ser chamado
+        enquanto a exceção ainda estiver em tratamento, pois sys.exc_info() e os
+        logs com exc_info=True passariam a não ter os frames.
+        """
+        if self._traceback_text is None:
+            self._traceback_text = self._get_traceback_info()
+        if self.original_exception is not None:
+            self.original_exception.__traceback__ = None
+        self.__traceback__ = None
     
     def _get_traceback_info(self) -> str:
         """Obtém informações do traceback."""
-        return traceback.format_exc()
-    
-    def _get_caller_info(self) -> Dict[str, Any]:
-        """Obtém informações sobre quem chamou a exceção."""
-        frame = inspect.currentframe()
-        if frame:
-            # Pular 2 frames (este método e __init__)
-            caller_frame = inspect.getouterframes(frame)[2]
-            return {
-                "file": caller_frame.filename,
-                "line": caller_frame.lineno,
-                "function": caller_frame.function,
-                "code": caller_frame.code_context[0].strip() if caller_frame.code_context else None
-            }
-        return {}
+        if self._traceback_text is not None:
+            return self._traceback_text
+        exc = sys.exc_info()[1] or self.original_exception
+        if exc is None:
+            return traceback.format_exc()
+        return _format_traceback(exc)
+    
+    @property
+    def traceback_info(self) -> str:
+        """Traceback da exceção em tratamento, formatado apenas quando acessado."""
+        return self._get_traceback_info()
     
     def _log_exception(self) -> None:
         """Registra a exceção no sistema de log."""
-        log_message = f"{self.__class__.__name__}: {self.message}"
-        
-        if self.original_exception:
-            log_message += f" | Original exception: {str(self.original_exception)}"
-        
-        if self.error_code:
-            log_message += f" | Error code: {self.error_code}"
-        
-        # Incluir informações do caller
-        caller_info = f"{self.caller_info.get('file', 'unknown')}:{self.caller_info.get('line', 'unknown')}"
-        log_message += f" | Called from: {caller_info}"
-        
         # Usar o nível de log apropriado com base no status code
         if self.status_code >= 500:
-            logger.error(log_message)
-            # Registrar traceback completo apenas para erros 5xx
-            logger.debug(f"Traceback:\n{self.traceback_info}")
+            level = logging.ERROR
         elif self.status_code >= 400:
-            logger.warning(log_message)
+            level = logging.WARNING
         else:
-            logger.info(log_message)
+            level = logging.INFO
+        
+        # Não montar a mensagem se o nível estiver desabilitado
+        if not logger.isEnabledFor(level):
+            return
+        
+        # O próprio logging registra arquivo/linha de quem criou a exceção; com
+        # include_source_info=False (logging._srcfile = None) ele não consulta a
+        # pilha, então a origem vai como atributos extras, lida de um único frame
+        extra = None
+        if logging._srcfile is None and _getframe is not None:
+            frame = _getframe(self._log_stacklevel - 1)
+            code = frame.f_code
+            extra = {"_extras": {"file": code.co_filename, "line": frame.f_lineno, "function": code.co_name}}
+        
+        logger.log(
+            level,
+            "%s: %s | Original exception: %s | Error code: %s",
+            self._cls_name,
+            self.message,
+            self.original_exception,
+            self.error_code,
+            stacklevel=self._log_stacklevel,
+            extra=extra
+        )
+        
+        # Registrar traceback completo apenas para erros 5xx
+        if level == logging.ERROR and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Traceback:\n%s", self.traceback_info)
     
     def to_dict(self) -> Dict[str, Any]:
         """Converte a exceção para um dicionário."""
@@ -98,118 +194,79 @@ class BaseAppException(Exception):
 # Exceções HTTP (4xx)
 class HTTPException(BaseAppException):
     """Base para exceções HTTP."""
-    pass
+    
+    __slots__ = ()
 
 class BadRequestException(HTTPException):
     """Erro 400 - Bad Request."""
     
-    def __init__(
-        self, 
-        message: str = "Requisição inválida", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=400,
-            error_code=error_code or "BAD_REQUEST",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Requisição inválida"
+    _default_status_code = 400
+    _default_error_code = "BAD_REQUEST"
 
 class UnauthorizedException(HTTPException):
     """Erro 401 - Unauthorized."""
     
-    def __init__(
-        self, 
-        message: str = "Não autorizado", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=401,
-            error_code=error_code or "UNAUTHORIZED",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Não autorizado"
+    _default_status_code = 401
+    _default_error_code = "UNAUTHORIZED"
 
 class ForbiddenException(HTTPException):
     """Erro 403 - Forbidden."""
     
-    def __init__(
-        self, 
-        message: str = "Acesso proibido", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=403,
-            error_code=error_code or "FORBIDDEN",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Acesso proibido"
+    _default_status_code = 403
+    _default_error_code = "FORBIDDEN"
 
 class NotFoundException(HTTPException):
     """Erro 404 - Not Found."""
     
-    def __init__(
-        self, 
-        message: str = "Recurso não encontrado", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=404,
-            error_code=error_code or "NOT_FOUND",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Recurso não encontrado"
+    _default_status_code = 404
+    _default_error_code = "NOT_FOUND"
 
 class ConflictException(HTTPException):
     """Erro 409 - Conflict."""
     
-    def __init__(
-        self, 
-        message: str = "Conflito de recursos", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=409,
-            error_code=error_code or "CONFLICT",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Conflito de recursos"
+    _default_status_code = 409
+    _default_error_code = "CONFLICT"
 
 class TooManyRequestsException(HTTPException):
     """Erro 429 - Too Many Requests."""
     
+    __slots__ = ()
+    
+    _default_message = "Muitas requisições"
+    _default_status_code = 429
+    _default_error_code = "TOO_MANY_REQUESTS"
+    
     def __init__(
         self, 
-        message: str = "Muitas requisições", 
+        message: Optional[str] = None, 
         details: Optional[Dict[str, Any]] = None,
         error_code: Optional[str] = None,
         original_exception: Optional[Exception] = None,
         retry_after: Optional[int] = None
     ):
-        details = details or {}
+        # Copiar details em vez de alterar o dicionário recebido do chamador
         if retry_after:
-            details["retry_after"] = retry_after
+            details = {**(details or {}), "retry_after": retry_after}
             
         super().__init__(
             message=message,
             details=details,
-            status_code=429,
-            error_code=error_code or "TOO_MANY_REQUESTS",
+            error_code=error_code,
             original_exception=original_exception
         )
 
@@ -217,197 +274,192 @@ class TooManyRequestsException(HTTPException):
 class InternalServerException(BaseAppException):
     """Erro 500 - Internal Server Error."""
     
-    def __init__(
-        self, 
-        message: str = "Erro interno do servidor", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=500,
-            error_code=error_code or "INTERNAL_SERVER_ERROR",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Erro interno do servidor"
+    _default_status_code = 500
+    _default_error_code = "INTERNAL_SERVER_ERROR"
 
 class ServiceUnavailableException(BaseAppException):
     """Erro 503 - Service Unavailable."""
     
-    def __init__(
-        self, 
-        message: str = "Serviço indisponível", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=503,
-            error_code=error_code or "SERVICE_UNAVAILABLE",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Serviço indisponível"
+    _default_status_code = 503
+    _default_error_code = "SERVICE_UNAVAILABLE"
 
 # Exceções de Domínio (específicas da aplicação)
 class DomainException(BaseAppException):
     """Base para exceções de domínio."""
     
-    def __init__(
-        self, 
-        message: str, 
-        details: Optional[Dict[str, Any]] = None,
-        status_code: int = 400,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=status_code,
-            error_code=error_code,
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_status_code = 400
 
 class ScraperException(DomainException):
     """Exceção para erros de scraping."""
     
+    __slots__ = ()
+    
+    _default_message = "Erro ao fazer scraping dos dados"
+    _default_error_code = "SCRAPER_ERROR"
+    
     def __init__(
         self, 
-        message: str = "Erro ao fazer scraping dos dados", 
+        message: Optional[str] = None, 
         details: Optional[Dict[str, Any]] = None,
         error_code: Optional[str] = None,
         original_exception: Optional[Exception] = None,
         fallback_attempted: bool = False
     ):
-        details = details or {}
-        details["fallback_attempted"] = fallback_attempted
+        details = {**(details or {}), "fallback_attempted": fallback_attempted}
         
         super().__init__(
             message=message,
             details=details,
             status_code=503 if not fallback_attempted else 500,
-            error_code=error_code or "SCRAPER_ERROR",
+            error_code=error_code,
             original_exception=original_exception
         )
 
 class DataProcessingException(DomainException):
     """Exceção para erros de processamento de dados."""
     
-    def __init__(
-        self, 
-        message: str = "Erro ao processar dados", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=500,
-            error_code=error_code or "DATA_PROCESSING_ERROR",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Erro ao processar dados"
+    _default_status_code = 500
+    _default_error_code = "DATA_PROCESSING_ERROR"
 
 class ValidationException(DomainException):
     """Exceção para erros de validação."""
     
+    __slots__ = ()
+    
+    _default_message = "Erro de validação"
+    _default_error_code = "VALIDATION_ERROR"
+    
     def __init__(
         self, 
-        message: str = "Erro de validação", 
+        message: Optional[str] = None, 
         details: Optional[Dict[str, Any]] = None,
         field_errors: Optional[Dict[str, List[str]]] = None,
         error_code: Optional[str] = None,
         original_exception: Optional[Exception] = None
     ):
-        details = details or {}
         if field_errors:
-            details["field_errors"] = field_errors
+            details = {**(details or {}), "field_errors": field_errors}
             
         super().__init__(
             message=message,
             details=details,
-            status_code=400,
-            error_code=error_code or "VALIDATION_ERROR",
+            error_code=error_code,
             original_exception=original_exception
         )
 
 # Exceções de Infraestrutura
 class InfrastructureException(BaseAppException):
     """Base para exceções de infraestrutura."""
-    pass
+    
+    __slots__ = ()
 
 class DatabaseException(InfrastructureException):
     """Exceção para erros de banco de dados."""
     
-    def __init__(
-        self, 
-        message: str = "Erro de banco de dados", 
-        details: Optional[Dict[str, Any]] = None,
-        error_code: Optional[str] = None,
-        original_exception: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            details=details,
-            status_code=500,
-            error_code=error_code or "DATABASE_ERROR",
-            original_exception=original_exception
-        )
+    __slots__ = ()
+    
+    _default_message = "Erro de banco de dados"
+    _default_status_code = 500
+    _default_error_code = "DATABASE_ERROR"
 
 class CacheException(InfrastructureException):
     """Exceção para erros de cache."""
     
+    __slots__ = ()
+    
+    _default_message = "Erro no sistema de cache"
+    _default_error_code = "CACHE_ERROR"
+    
     def __init__(
         self, 
-        message: str = "Erro no sistema de cache", 
+        message: Optional[str] = None, 
         details: Optional[Dict[str, Any]] = None,
         error_code: Optional[str] = None,
         original_exception: Optional[Exception] = None,
         cache_key: Optional[str] = None,
         provider: Optional[str] = None
     ):
-        details = details or {}
-        if cache_key:
-            details["cache_key"] = cache_key
-        if provider:
-            details["provider"] = provider
+        if cache_key or provider:
+            details = dict(details) if details else {}
+            if cache_key:
+                details["cache_key"] = cache_key
+            if provider:
+                details["provider"] = provider
             
         super().__init__(
             message=message,
             details=details,
-            status_code=500,
-            error_code=error_code or "CACHE_ERROR",
+            error_code=error_code,
             original_exception=original_exception
         )
 
 class ExternalServiceException(InfrastructureException):
     """Exceção para erros em serviços externos."""
     
+    __slots__ = ()
+    
+    _default_message = "Erro em serviço externo"
+    _default_status_code = 502  # Bad Gateway
+    _default_error_code = "EXTERNAL_SERVICE_ERROR"
+    
     def __init__(
         self, 
-        message: str = "Erro em serviço externo", 
+        message: Optional[str] = None, 
         details: Optional[Dict[str, Any]] = None,
         error_code: Optional[str] = None,
         original_exception: Optional[Exception] = None,
         service_name: Optional[str] = None,
         status_code_from_service: Optional[int] = None
     ):
-        details = details or {}
-        if service_name:
-            details["service_name"] = service_name
-        if status_code_from_service:
-            details["status_code_from_service"] = status_code_from_service
+        if service_name or status_code_from_service:
+            details = dict(details) if details else {}
+            if service_name:
+                details["service_name"] = service_name
+            if status_code_from_service:
+                details["status_code_from_service"] = status_code_from_service
             
         super().__init__(
             message=message,
             details=details,
-            status_code=502,  # Bad Gateway
-            error_code=error_code or "EXTERNAL_SERVICE_ERROR",
+            error_code=error_code,
             original_exception=original_exception
         )
 
+# Conversores de exceções padrão, consultados pela MRO da exceção recebida
+_EXCEPTION_MAP: Dict[Type[BaseException], Callable[[Exception], BaseAppException]] = {
+    ValueError: lambda e: ValidationException(
+        message=str(e) or "Valor inválido",
+        original_exception=e
+    ),
+    KeyError: lambda e: NotFoundException(
+        message=f"Chave não encontrada: {str(e)}",
+        original_exception=e
+    ),
+    FileNotFoundError: lambda e: NotFoundException(
+        message=f"Arquivo não encontrado: {str(e)}",
+        original_exception=e
+    ),
+    PermissionError: lambda e: ForbiddenException(
+        message=f"Permissão negada: {str(e)}",
+        original_exception=e
+    ),
+    TimeoutError: lambda e: ServiceUnavailableException(
+        message=f"Tempo limite excedido: {str(e)}",
+        original_exception=e
+    ),
+}
+
 # Handler para converter exceções padrão em exceções da aplicação
 def handle_exception(exception: Exception) -> BaseAppException:
     """
@@ -422,36 +474,11 @@ def handle_exception(exception: Exception) -> BaseAppException:
     if isinstance(exception, BaseAppException):
         return exception
     
-    # Mapear exceções comuns para exceções da aplicação
-    if isinstance(exception, ValueError):
-        return ValidationException(
-            message=str(exception) or "Valor inválido",
-            original_exception=exception
-        )
-    
-    if isinstance(exception, KeyError):
-        return NotFoundException(
-            message=f"Chave não encontrada: {str(exception)}",
-            original_exception=exception
-        )
-    
-    if isinstance(exception, FileNotFoundError):
-        return NotFoundException(
-            message=f"Arquivo não encontrado: {str(exception)}",
-            original_exception=exception
-        )
-    
-    if isinstance(exception, PermissionError):
-        return ForbiddenException(
-            message=f"Permissão negada: {str(exception)}",
-            original_exception=exception
-        )
-    
-    if isinstance(exception, TimeoutError):
-        return ServiceUnavailableException(
-            message=f"Tempo limite excedido: {str(exception)}",
-            original_exception=exception
-        )
+    # Mapear exceções comuns para exceções da aplicação (a classe mais específica vence)
+    for cls in type(exception).__mro__:
+        converter = _EXCEPTION_MAP.get(cls)
+        if converter is not None:
+            return converter(exception)
     
     # Exceção genérica para outros casos
     return InternalServerException(
@@ -4,80 +4,156 @@ Utilitários para implementação de HATEOAS.
 Este módulo fornece funções para adicionar links hypermedia às respostas da API,
 seguindo o princípio HATEOAS (Hypermedia as the Engine of Application State).
 """
-from typing import Dict, List, Any, Optional, Union, cast
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Union, cast
 
-def add_links(response: Dict[str, Any], resource_path: str, year: Optional[int] = None) -> Dict[str, Any]:
+# Chaves usadas em todos os dicionários de links, internadas para que
+# comparações de chave sejam feitas por identidade
+_HREF = sys.intern("href")
+_SELF = sys.intern("self")
+_RELATED = sys.intern("related")
+_PREV_YEAR = sys.intern("prev_year")
+_NEXT_YEAR = sys.intern("next_year")
+
+# Partes fixas dos hrefs, concatenadas sem formatação
+_API_PREFIX = "/api/v1/"
+_YEAR_QUERY = "?year="
+
+# Sufixos dos links específicos de cada tipo de recurso
+_RESOURCE_LINKS: Dict[str, Dict[str, str]] = {
+    "production": {
+        "wine": "/wine",
+        "grape": "/grape",
+        "derivative": "/derivative",
+    },
+    "imports": {
+        "wine": "/vinhos",
+        "sparkling": "/espumantes",
+        "fresh": "/uvas-frescas",
+        "raisins": "/passas",
+        "juice": "/suco",
+    },
+    "exports": {
+        "wine": "/vinhos",
+        "sparkling": "/espumantes",
+        "fresh": "/uvas-frescas",
+        "juice": "/suco",
+    },
+    "processing": {
+        "vinifera": "/vinifera",
+        "american": "/american",
+        "table": "/table",
+        "unclassified": "/unclassified",
+    },
+}
+
+# Recursos relacionados incluídos em todas as respostas
+_RELATED_RESOURCES = tuple(map(sys.intern, ("production", "imports", "exports", "processing")))
+
+# Bloco "related" sem filtro de ano, montado uma única vez e compartilhado
+# entre as respostas (somente leitura: não deve ser alterado por quem o recebe)
+_RELATED_LINKS: Dict[str, Dict[str, str]] = {
+    name: {_HREF: sys.intern(_API_PREFIX + name)} for name in _RELATED_RESOURCES
+}
+
+@dataclass(frozen=True, slots=True)
+class LinkSet:
     """
-    Adiciona links HATEOAS a uma resposta.
+    Conjunto imutável de links de um recurso.
+    
+    Os nomes e hrefs ficam em tuplas paralelas (nomes[i] -> hrefs[i]),
+    separadas entre links diretos e links relacionados; os links de ano
+    anterior/posterior só existem quando há filtro de ano.
+    """
+    rels: Tuple[str, ...]
+    hrefs: Tuple[str, ...]
+    related_rels: Tuple[str, ...]
+    related_hrefs: Tuple[str, ...]
+    prev_year_href: Optional[str] = None
+    next_year_href: Optional[str] = None
+    
+    # Dicionário de links montado uma vez por conjunto (ver __post_init__)
+    template: Dict[str, Any] = field(init=False, repr=False, compare=False, hash=False)
+    
+    def __post_init__(self) -> None:
+        # Montar o template em uma única expressão; sem filtro de ano, o bloco
+        # "related" é o dicionário compartilhado _RELATED_LINKS
+        direct_links = {rel: {_HREF: href} for rel, href in zip(self.rels, self.hrefs)}
+        if self.prev_year_href is None:
+            template = {**direct_links, _RELATED: _RELATED_LINKS}
+        else:
+            template = {
+                **direct_links,
+                _RELATED: {rel: {_HREF: href} for rel, href in zip(self.related_rels, self.related_hrefs)},
+                _PREV_YEAR: {_HREF: self.prev_year_href},
+                _NEXT_YEAR: {_HREF: self.next_year_href},
+            }
+        object.__setattr__(self, "template", template)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converte o conjunto no formato de links enviado na resposta.
+        
+        Returns:
+            Cópia rasa do template; os links internos são compartilhados
+            entre as respostas e não devem ser alterados
+        """
+        return {**self.template}
+
+@lru_cache(maxsize=512)
+def _build_link_set(resource_path: str, year: Optional[int]) -> LinkSet:
+    """
+    Monta os links de um recurso para um ano.
+    
+    O resultado é cacheado por (resource_path, year), de modo que cada
+    combinação só tem seus hrefs interpolados uma vez.
     
     Args:
-        response: Resposta a ser enriquecida com links
         resource_path: Caminho do recurso (ex: "production")
         year: Ano do filtro, se aplicável
         
     Returns:
-        Resposta com links adicionados
+        Conjunto de links do recurso
     """
-    base_path = f"/api/v1/{resource_path}"
+    base_path = sys.intern(_API_PREFIX + resource_path)
+    suffix = "" if year is None else _YEAR_QUERY + str(year)
     
-    # Links básicos - use simple dictionary without complex type annotations
-    links: Dict[str, Any] = {
-        "self": {"href": base_path}
-    }
+    resource_links = _RESOURCE_LINKS.get(resource_path, {})
     
-    # Links específicos por tipo de recurso
-    if resource_path == "production":
-        links["wine"] = {"href": f"{base_path}/wine"}
-        links["grape"] = {"href": f"{base_path}/grape"}
-        links["derivative"] = {"href": f"{base_path}/derivative"}
-    elif resource_path == "imports":
-        links["wine"] = {"href": f"{base_path}/vinhos"}
-        links["sparkling"] = {"href": f"{base_path}/espumantes"}
-        links["fresh"] = {"href": f"{base_path}/uvas-frescas"}
-        links["raisins"] = {"href": f"{base_path}/passas"}
-        links["juice"] = {"href": f"{base_path}/suco"}
-    elif resource_path == "exports":
-        links["wine"] = {"href": f"{base_path}/vinhos"}
-        links["sparkling"] = {"href": f"{base_path}/espumantes"}
-        links["fresh"] = {"href": f"{base_path}/uvas-frescas"}
-        links["juice"] = {"href": f"{base_path}/suco"}
-    elif resource_path == "processing":
-        links["vinifera"] = {"href": f"{base_path}/vinifera"}
-        links["american"] = {"href": f"{base_path}/american"}
-        links["table"] = {"href": f"{base_path}/table"}
-        links["unclassified"] = {"href": f"{base_path}/unclassified"}
+    # Adicionar ano anterior e posterior se aplicável
+    prev_year_href = next_year_href = None
+    if year is not None:
+        prev_year_href = "".join((base_path, _YEAR_QUERY, str(year - 1)))
+        next_year_href = "".join((base_path, _YEAR_QUERY, str(year + 1)))
     
-    # Add related resource links
-    links["related"] = {
-        "production": {"href": "/api/v1/production"},
-        "imports": {"href": "/api/v1/imports"},
-        "exports": {"href": "/api/v1/exports"},
-        "processing": {"href": "/api/v1/processing"},
-    }
+    # Montar cada href já com o filtro de ano, em uma única passada; os hrefs
+    # são internados para que conjuntos cacheados compartilhem strings iguais
+    return LinkSet(
+        rels=(_SELF, *map(sys.intern, resource_links)),
+        hrefs=(
+            sys.intern(base_path + suffix),
+            *(sys.intern("".join((base_path, path, suffix))) for path in resource_links.values())
+        ),
+        related_rels=_RELATED_RESOURCES,
+        related_hrefs=tuple(sys.intern("".join((_API_PREFIX, name, suffix))) for name in _RELATED_RESOURCES),
+        prev_year_href=prev_year_href,
+        next_year_href=next_year_href
+    )
+
+def add_links(response: Dict[str, Any], resource_path: str, year: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Adiciona links HATEOAS a uma resposta.
     
-    # Adicionar parâmetro de ano se fornecido
-    if year is not None:
-        # Modify direct links
-        for key, link in list(links.items()):
-            if key != "related" and isinstance(link, dict) and "href" in link:
-                href_value = str(link["href"])
-                if "?" in href_value:
-                    link["href"] = f"{href_value}&year={year}"
-                else:
-                    link["href"] = f"{href_value}?year={year}"
-        
-        # Modify related links
-        related = links.get("related")
-        if isinstance(related, dict):
-            for rel_key, rel_link in related.items():
-                if isinstance(rel_link, dict) and "href" in rel_link:
-                    href_value = str(rel_link["href"])
-                    rel_link["href"] = f"{href_value}?year={year}"
+    Args:
+        response: Resposta a ser enriquecida com links
+        resource_path: Caminho do recurso (ex: "production")
+        year: Ano do filtro, se aplicável
         
-        # Adicionar ano anterior e posterior se aplicável
-        links["prev_year"] = {"href": f"{base_path}?year={year-1}"}
-        links["next_year"] = {"href": f"{base_path}?year={year+1}"}
-    
+    Returns:
+        Resposta com links adicionados
+    """
     # Adicionar os links à resposta
-    response["_links"] = links
+    response["_links"] = _build_link_set(resource_path, year).to_dict()
     return response
@@ -9,9 +9,37 @@ import json
 import time
 import os
 import sys
+import atexit
+import queue
+import threading
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Dict, Any, Optional, Union, List
 
+# orjson é opcional; sem ele os logs JSON usam o encoder da biblioteca padrão
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Tipos que o encoder JSON serializa diretamente, sem conversão para string
+_JSON_NATIVE_TYPES = (str, int, float, bool, type(None), list, dict, tuple)
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """
+    Serializa um registro de log para JSON.
+    
+    Args:
+        data: Dados do registro
+        
+    Returns:
+        String JSON; valores não serializáveis são convertidos com str()
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str)
+
 # Formatar mensagens de log como JSON
 class JsonFormatter(logging.Formatter):
     """
@@ -55,15 +83,17 @@ class JsonFormatter(logging.Formatter):
         if self.include_timestamp:
             log_data["timestamp"] = datetime.fromtimestamp(record.created).isoformat()
         
-        # Adicionar informações de arquivo e linha
-        log_data["location"] = {
-            "file": record.pathname,
-            "line": record.lineno,
-            "function": record.funcName
-        }
+        # Adicionar informações de arquivo e linha (ausentes se include_source_info=False),
+        # no nível raiz do registro para não alocar um dicionário aninhado
+        if record.lineno:
+            log_data.update(file=record.pathname, line=record.lineno, function=record.funcName)
         
         # Adicionar exceção se disponível
         if record.exc_info:
+            # Reaproveitar o traceback já formatado por outro handler para o mesmo registro
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            
             try:
                 # Verificar se não estamos tentando acessar atributos em None
                 if record.exc_info[0] is not None:
@@ -74,36 +104,165 @@ class JsonFormatter(logging.Formatter):
                 log_data["exception"] = {
                     "type": exc_type_name,
                     "message": str(record.exc_info[1]) if record.exc_info[1] else "",
-                    "traceback": self.formatException(record.exc_info)
+                    "traceback": record.exc_text
                 }
             except Exception as e:
                 # Fallback para uma representação simplificada em caso de erro
                 log_data["exception"] = {
                     "type": "UnknownExceptionType",
                     "message": f"Erro ao processar exceção: {str(e)}",
-                    "traceback": self.formatException(record.exc_info) if hasattr(self, "formatException") else ""
+                    "traceback": record.exc_text
                 }
         
-        # Adicionar atributos extras
-        for key, value in record.__dict__.items():
-            if key.startswith("_") and key != "_":
-                try:
-                    # Tentar converter para JSON
-                    json.dumps(value)
-                    log_data[key[1:]] = value
-                except (TypeError, OverflowError):
-                    # Se não for serializável, converter para string
-                    log_data[key[1:]] = str(value)
+        # Adicionar atributos extras (AppLogger) e do contexto (ContextFilter); o
+        # contexto prevalece em caso de chave repetida
+        for extras in (getattr(record, "_extras", None), getattr(record, "_context", None)):
+            if not extras:
+                continue
+            for key, value in extras.items():
+                # Tipos nativos do JSON vão direto; os demais são convertidos para string
+                if isinstance(value, _JSON_NATIVE_TYPES):
+                    log_data[key] = value
+                else:
+                    log_data[key] = str(value)
         
         # Serializar para JSON
-        return json.dumps(log_data)
+        return _json_dumps(log_data)
+
+class TextFormatter(logging.Formatter):
+    """
+    Formatter para logs em texto.
+    
+    Acrescenta à mensagem os atributos extras do registro (AppLogger) em
+    JSON, para que os dados passados como extras não se percam quando os
+    logs não estão em formato JSON.
+    """
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """
+        Formata a linha do registro, sem a exceção.
+        
+        Args:
+            record: Registro de log
+            
+        Returns:
+            Linha formatada, seguida dos atributos extras, se houver
+        """
+        message = super().formatMessage(record)
+        extras = getattr(record, "_extras", None)
+        if extras:
+            message = f"{message} {_json_dumps(extras)}"
+        return message
+
+# Intervalo máximo (em segundos) que uma linha de log fica no buffer antes de ser gravada
+_FLUSH_INTERVAL = 0.05
+
+# Tamanho do buffer do arquivo de log
+_FILE_BUFFER_SIZE = 65536
+
+class _DeferredFlushMixin:
+    """
+    Adia o flush do handler, que passa a ser feito pelo _BufferedQueueListener.
+    
+    Assim várias linhas são gravadas em uma única chamada de write() em vez
+    de um write() por registro.
+    """
+    
+    def flush(self) -> None:
+        """Não faz nada; o flush é feito por flush_buffer()."""
+    
+    def flush_buffer(self) -> None:
+        """Grava no destino as linhas acumuladas no buffer."""
+        super().flush()
+
+class _BufferedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    """StreamHandler com flush adiado."""
+
+class _BufferedFileHandler(_DeferredFlushMixin, logging.FileHandler):
+    """FileHandler com flush adiado e buffer de escrita maior."""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+class _LogQueueHandler(QueueHandler):
+    """
+    QueueHandler que preserva o registro original.
+    
+    O QueueHandler padrão formata a mensagem e descarta exc_info antes de
+    enfileirar (pensando em filas entre processos); como o listener roda no
+    mesmo processo, basta fixar a mensagem para que o JsonFormatter ainda
+    receba a exceção estruturada.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+class _BufferedQueueListener(QueueListener):
+    """
+    QueueListener que grava os handlers em lote.
+    
+    Os registros são apenas escritos nos buffers; o flush acontece sempre
+    que _FLUSH_INTERVAL segundos se passaram desde o anterior, mesmo com a
+    fila ocupada, e ao parar o listener.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._last_flush = time.monotonic()
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            if time.monotonic() - self._last_flush >= _FLUSH_INTERVAL:
+                self.flush_handlers()
+            try:
+                return self.queue.get(block, _FLUSH_INTERVAL)
+            except queue.Empty:
+                self.flush_handlers()
+    
+    def flush_handlers(self) -> None:
+        """Grava as linhas pendentes de todos os handlers."""
+        for handler in self.handlers:
+            handler.flush_buffer()
+        self._last_flush = time.monotonic()
+    
+    def stop(self) -> None:
+        super().stop()
+        self.flush_handlers()
+
+# Valores dos ajustes globais do logging (_srcfile, logThreads, logProcesses e
+# logMultiprocessing) guardados ao desligá-los com include_source_info=False;
+# None enquanto eles não foram alterados
+_saved_source_info: Optional[tuple] = None
+
+# Listener ativo, substituído a cada chamada de setup_logging
+_queue_listener: Optional[_BufferedQueueListener] = None
+
+# Argumentos da configuração ativa (setup_logging repetido com os mesmos
+# argumentos, como no hot reload, não faz nada) e lock que serializa as trocas
+_configured_args: Optional[tuple] = None
+_setup_lock = threading.Lock()
+
+def _stop_queue_listener() -> None:
+    """Para o listener ativo, gravando os logs pendentes e fechando seus handlers."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
 
 # Configurador de log
 def setup_logging(
     level: Union[int, str] = logging.INFO,
     log_file: Optional[str] = None,
     log_json: bool = False,
-    app_name: str = "viticultureapi"
+    app_name: str = "viticultureapi",
+    include_source_info: bool = True
 ) -> None:
     """
     Configura o sistema de logging.
@@ -113,28 +272,79 @@ def setup_logging(
         log_file: Caminho para arquivo de log
         log_json: Se True, usa formato JSON
         app_name: Nome da aplicação
+        include_source_info: Se True (padrão), registra arquivo/linha de origem
+            e informações de thread/processo em cada registro de log; False
+            desliga essa coleta em todo o processo (inclusive para loggers de
+            terceiros) em troca de registros mais baratos
     """
     # Converter level para int se for string
     if isinstance(level, str):
         level = getattr(logging, level.upper(), logging.INFO)
     
+    with _setup_lock:
+        args = (level, log_file, log_json, app_name, include_source_info)
+        if args == _configured_args:
+            return
+        _configure_logging(*args)
+
+def _apply_source_info(include_source_info: bool) -> None:
+    """
+    Liga ou desliga a coleta de origem, thread e processo nos registros de log.
+    
+    Os ajustes globais do módulo logging só são alterados com
+    include_source_info=False; com True, os valores anteriores são
+    restaurados, se tiverem sido alterados.
+    
+    Args:
+        include_source_info: Se False, desliga a coleta
+    """
+    global _saved_source_info
+    if include_source_info:
+        if _saved_source_info is not None:
+            logging._srcfile, logging.logThreads, logging.logProcesses, logging.logMultiprocessing = (
+                _saved_source_info
+            )
+            _saved_source_info = None
+        return
+    
+    if _saved_source_info is None:
+        _saved_source_info = (logging._srcfile, logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+    # Sem _srcfile, Logger.findCaller não percorre a pilha a cada chamada;
+    # os flags abaixo evitam consultar thread e processo em cada LogRecord
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+def _configure_logging(
+    level: int,
+    log_file: Optional[str],
+    log_json: bool,
+    app_name: str,
+    include_source_info: bool
+) -> None:
+    """Aplica a configuração de setup_logging (chamada com _setup_lock adquirido)."""
+    global _queue_listener, _configured_args
+    
+    _apply_source_info(include_source_info)
+    
     # Criar handlers
     handlers = []
     
     # Handler de console
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = _BufferedStreamHandler(sys.stdout)
     handlers.append(console_handler)
     
     # Handler de arquivo
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _BufferedFileHandler(log_file)
         handlers.append(file_handler)
     
     # Configurar formatters
     if log_json:
         formatter = JsonFormatter(app_name=app_name)
     else:
-        formatter = logging.Formatter(
+        formatter = TextFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
     
@@ -142,17 +352,27 @@ def setup_logging(
     for handler in handlers:
         handler.setFormatter(formatter)
     
-    # Configurar logger raiz
+    # Os handlers reais rodam em uma thread do listener; o logger raiz só
+    # enfileira os registros, tirando a escrita do caminho das requisições
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _LogQueueHandler(log_queue)
+    
+    # Um único filter de contexto, no handler do logger raiz: vale para os
+    # registros de todos os loggers e roda na thread/task que gerou o log
+    queue_handler.addFilter(ContextFilter())
+    new_listener = _BufferedQueueListener(log_queue, *handlers)
+    new_listener.start()
+    
+    # Configurar logger raiz, trocando os handlers em uma única atribuição
+    # (sem um intervalo em que o logger fica sem handlers)
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
+    root_logger.handlers[:] = [queue_handler]
     
-    # Remover handlers existentes
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-    
-    # Adicionar handlers
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    # Só então parar o listener anterior, que grava o que ainda estava na fila dele
+    _stop_queue_listener()
+    _queue_listener = new_listener
+    _configured_args = (level, log_file, log_json, app_name, include_source_info)
     
     # Configurar loggers específicos
     logging.getLogger("uvicorn").setLevel(level)
@@ -169,30 +389,37 @@ class LogContext:
     
     Permite adicionar atributos extras a todas as mensagens de log
     dentro de um determinado contexto, como um ID de requisição.
+    
+    Os valores ficam em uma ContextVar, isolados por task/thread: cada
+    requisição vê apenas o próprio contexto. O dicionário armazenado nunca
+    é alterado; toda modificação cria um novo dicionário.
     """
     
-    # Alterar a anotação de tipo para permitir qualquer tipo de valor serializado como string
-    _context_data: Dict[str, str] = {}
+    _context_var: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
     
     @classmethod
-    def set(cls, key: str, value: Any) -> None:
+    def set(cls, key: str, value: Any) -> Token:
         """
-        Define um valor no contexto. Converte valores complexos para string.
+        Define um valor no contexto.
         
         Args:
             key: Chave
-            value: Valor
+            value: Valor (serializado pelo formatter na hora de registrar)
+            
+        Returns:
+            Token para restaurar o contexto anterior com reset()
         """
-        # Sempre converter qualquer valor para string para garantir compatibilidade com o tipo
-        if value is None:
-            cls._context_data[key] = ""
-        elif isinstance(value, (dict, list, set, tuple, bool, int, float)):
-            try:
-                cls._context_data[key] = json.dumps(value)
-            except (TypeError, ValueError):
-                cls._context_data[key] = str(value)
-        else:
-            cls._context_data[key] = str(value)
+        return cls._context_var.set({**cls._context_var.get(), key: value})
+    
+    @classmethod
+    def reset(cls, token: Token) -> None:
+        """
+        Restaura o contexto anterior a uma chamada de set().
+        
+        Args:
+            token: Token retornado por set()
+        """
+        cls._context_var.reset(token)
     
     @classmethod
     def get(cls, key: str, default: Any = None) -> Any:
@@ -206,7 +433,7 @@ class LogContext:
         Returns:
             Valor associado à chave
         """
-        return cls._context_data.get(key, default)
+        return cls._context_var.get().get(key, default)
     
     @classmethod
     def remove(cls, key: str) -> None:
@@ -216,23 +443,24 @@ class LogContext:
         Args:
             key: Chave
         """
-        if key in cls._context_data:
-            del cls._context_data[key]
+        context_data = cls._context_var.get()
+        if key in context_data:
+            cls._context_var.set({k: v for k, v in context_data.items() if k != key})
     
     @classmethod
     def clear(cls) -> None:
         """Limpa todo o contexto."""
-        cls._context_data.clear()
+        cls._context_var.set({})
     
     @classmethod
-    def get_all(cls) -> Dict[str, str]:
+    def get_all(cls) -> Dict[str, Any]:
         """
         Obtém todos os valores do contexto.
         
         Returns:
-            Dicionário com todos os valores
+            Dicionário com todos os valores (não deve ser alterado)
         """
-        return cls._context_data.copy()
+        return cls._context_var.get()
 
 # Filter para adicionar contexto
 class ContextFilter(logging.Filter):
@@ -252,10 +480,12 @@ class ContextFilter(logging.Filter):
         Returns:
             True se o registro deve ser processado, False caso contrário
         """
-        # Adicionar contexto ao registro como atributos
-        for key, value in LogContext.get_all().items():
-            # Atributos começando com _ para evitar conflitos com atributos padrão
-            setattr(record, f"_{key}", value)
+        # Adicionar o contexto ao registro em um único atributo (com _ para
+        # evitar conflitos com atributos padrão); o valor da ContextVar é um
+        # snapshot imutável, então é usado sem cópia
+        context = LogContext._context_var.get()
+        if context:
+            record._context = context
         
         return True
 
@@ -278,47 +508,58 @@ class AppLogger:
             name: Nome do logger
         """
         self._logger = logging.getLogger(name)
+    
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Verifica se mensagens do nível informado seriam registradas.
         
-        # Adicionar filter de contexto
-        self._context_filter = ContextFilter()
-        self._logger.addFilter(self._context_filter)
+        Args:
+            level: Nível de log
+            
+        Returns:
+            True se o nível está habilitado
+        """
+        return self._logger.isEnabledFor(level)
     
-    def debug(self, msg: str, **kwargs: Any) -> None:
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível DEBUG."""
-        self._log(logging.DEBUG, msg, **kwargs)
+        self._log(logging.DEBUG, msg, *args, **kwargs)
     
-    def info(self, msg: str, **kwargs: Any) -> None:
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível INFO."""
-        self._log(logging.INFO, msg, **kwargs)
+        self._log(logging.INFO, msg, *args, **kwargs)
     
-    def warning(self, msg: str, **kwargs: Any) -> None:
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível WARNING."""
-        self._log(logging.WARNING, msg, **kwargs)
+        self._log(logging.WARNING, msg, *args, **kwargs)
     
-    def error(self, msg: str, **kwargs: Any) -> None:
+    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível ERROR."""
-        self._log(logging.ERROR, msg, **kwargs)
+        self._log(logging.ERROR, msg, *args, **kwargs)
     
-    def critical(self, msg: str, **kwargs: Any) -> None:
+    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível CRITICAL."""
-        self._log(logging.CRITICAL, msg, **kwargs)
+        self._log(logging.CRITICAL, msg, *args, **kwargs)
     
-    def _log(self, level: int, msg: str, **kwargs: Any) -> None:
+    def _log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Registra uma mensagem de log.
         
         Args:
             level: Nível de log
-            msg: Mensagem
+            msg: Mensagem (com placeholders %s, formatada só se for registrada)
+            *args: Argumentos da mensagem
             **kwargs: Atributos extras
         """
-        # Adicionar atributos extras
-        extra = {}
-        for key, value in kwargs.items():
-            extra[f"_{key}"] = value
+        # Não montar os extras se o nível estiver desabilitado
+        if not self._logger.isEnabledFor(level):
+            return
+        
+        # Agrupar os atributos extras em um único atributo do registro
+        extra = {"_extras": kwargs} if kwargs else None
         
         # Registrar mensagem
-        self._logger.log(level, msg, extra=extra)
+        self._logger.log(level, msg, *args, extra=extra)
     
     def timing(self, operation_name: str) -> "TimingContext":
         """
@@ -378,11 +619,12 @@ class TimingContext:
         """
         self.logger = logger
         self.operation_name = operation_name
-        self.start_time = 0
+        self.start_time: Optional[int] = None
     
     def __enter__(self) -> "TimingContext":
         """Inicia o timer."""
-        self.start_time = time.time()
+        # Sem ERROR habilitado nada será registrado (INFO implica ERROR)
+        self.start_time = time.perf_counter_ns() if self.logger.is_enabled_for(logging.ERROR) else None
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -394,8 +636,12 @@ class TimingContext:
             exc_val: Valor da exceção
             exc_tb: Traceback da exceção
         """
-        elapsed_time = time.time() - self.start_time
-        elapsed_ms = round(elapsed_time * 1000)
+        # Registrar apenas se o nível da mensagem estiver habilitado
+        if self.start_time is None or not self.logger.is_enabled_for(logging.ERROR if exc_type else logging.INFO):
+            return
+        
+        # Relógio monotônico em nanossegundos inteiros: sem saltos de NTP nem arredondamento de float
+        elapsed_ms = (time.perf_counter_ns() - self.start_time) // 1_000_000
         
         # Registrar mensagem diferente dependendo do resultado
         if exc_type:
@@ -485,41 +731,50 @@ class ContextualLogger:
         """
         self.logger = logger
         self.context = context
+        
+        # Logger padrão e extras do contexto resolvidos uma vez (o contexto é fixo)
+        self._logger = logger._logger
+        self._context_extra = {"_extras": context} if context else None
     
-    def debug(self, msg: str, **kwargs: Any) -> None:
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível DEBUG."""
-        self._log(logging.DEBUG, msg, **kwargs)
+        self._log(logging.DEBUG, msg, *args, **kwargs)
     
-    def info(self, msg: str, **kwargs: Any) -> None:
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível INFO."""
-        self._log(logging.INFO, msg, **kwargs)
+        self._log(logging.INFO, msg, *args, **kwargs)
     
-    def warning(self, msg: str, **kwargs: Any) -> None:
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível WARNING."""
-        self._log(logging.WARNING, msg, **kwargs)
+        self._log(logging.WARNING, msg, *args, **kwargs)
     
-    def error(self, msg: str, **kwargs: Any) -> None:
+    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível ERROR."""
-        self._log(logging.ERROR, msg, **kwargs)
+        self._log(logging.ERROR, msg, *args, **kwargs)
     
-    def critical(self, msg: str, **kwargs: Any) -> None:
+    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log de nível CRITICAL."""
-        self._log(logging.CRITICAL, msg, **kwargs)
+        self._log(logging.CRITICAL, msg, *args, **kwargs)
     
-    def _log(self, level: int, msg: str, **kwargs: Any) -> None:
+    def _log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
         """
         Registra uma mensagem de log.
         
         Args:
             level: Nível de log
-            msg: Mensagem
+            msg: Mensagem (com placeholders %s, formatada só se for registrada)
+            *args: Argumentos da mensagem
             **kwargs: Atributos extras
         """
-        # Mesclar contexto com atributos extras
-        all_kwargs = {**self.context, **kwargs}
+        # Não mesclar o contexto se o nível estiver desabilitado
+        if not self._logger.isEnabledFor(level):
+            return
         
-        # Registrar mensagem
-        getattr(self.logger, logging.getLevelName(level).lower())(msg, **all_kwargs)
+        # Mesclar contexto com atributos extras apenas se houver extras na chamada
+        extra = {"_extras": {**self.context, **kwargs}} if kwargs else self._context_extra
+        
+        # Registrar mensagem diretamente no logger padrão
+        self._logger.log(level, msg, *args, extra=extra)
     
     def with_context(self, **kwargs: Any) -> "ContextualLogger":
         """
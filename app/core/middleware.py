@@ -7,19 +7,44 @@ exceções, logging de requisições, etc.
 import time
 from typing import Callable, Dict, Any, Optional, List, Union
 from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
-import json
 import hashlib
-from datetime import datetime, timedelta
+import re
+import secrets
 
 from app.core.exceptions import BaseAppException, handle_exception
 from app.models.base import ErrorResponse
 from app.core.logging import get_logger, LogContext
+from app.core.cache import _expires_header
+from app.core.cache.request_cache import REQ_CACHE
 
 logger = get_logger(__name__)
 
+# Cache-Control de respostas que não devem ser cacheadas
+_NO_CACHE_HEADER = "no-store, no-cache, must-revalidate, max-age=0"
+
+# Status cacheáveis por padrão segundo a RFC 7234 (seção 4.2.2)
+_CACHEABLE_STATUS_CODES = frozenset((200, 203, 300, 301, 404, 410))
+
+def _compile_prefixes(prefixes: List[str]) -> Optional["re.Pattern[str]"]:
+    """
+    Compila uma lista de prefixos de caminho em uma única regex.
+    
+    A alternância é testada na ordem da lista, então o primeiro prefixo que
+    casar é o retornado em match.group(0), como em um loop de startswith.
+    
+    Args:
+        prefixes: Prefixos de caminho
+        
+    Returns:
+        Regex ancorada no início do caminho, ou None se não houver prefixos
+    """
+    if not prefixes:
+        return None
+    return re.compile("|".join(map(re.escape, prefixes)))
+
 class CacheControlMiddleware(BaseHTTPMiddleware):
     """
     Middleware para adicionar headers de cache-control às respostas.
@@ -30,7 +55,8 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
         app: ASGIApp, 
         default_max_age: int = 3600, 
         cache_paths: Optional[Dict[str, int]] = None,
-        no_cache_paths: Optional[List[str]] = None
+        no_cache_paths: Optional[List[str]] = None,
+        etag_max_body_size: int = 1024 * 1024
     ):
         """
         Inicializa o middleware.
@@ -40,11 +66,23 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
             default_max_age: Tempo padrão de cache em segundos
             cache_paths: Dicionário mapeando caminhos para tempos de cache
             no_cache_paths: Lista de caminhos que não devem ser cacheados
+            etag_max_body_size: Tamanho máximo (em bytes) do body para gerar ETag
         """
         super().__init__(app)
         self.default_max_age = default_max_age
         self.cache_paths = cache_paths or {}
         self.no_cache_paths = no_cache_paths or ["/api/v1/auth/", "/docs", "/redoc"]
+        self.etag_max_body_size = etag_max_body_size
+        
+        # Valores de Cache-Control montados uma vez, por prefixo de caminho
+        self._cache_control_default = f"public, max-age={default_max_age}"
+        self._cache_control_by_path = {
+            cache_path: f"public, max-age={age}" for cache_path, age in self.cache_paths.items()
+        }
+        
+        # Prefixos compilados uma vez; cada requisição faz um único match
+        self._no_cache_re = _compile_prefixes(self.no_cache_paths)
+        self._cache_paths_re = _compile_prefixes(list(self.cache_paths))
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -60,18 +98,27 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
         # Processar requisição
         response = await call_next(request)
         
+        # A resposta já define todos os headers de cache: nada a fazer
+        headers = response.headers
+        if "Cache-Control" in headers and "Expires" in headers and "ETag" in headers:
+            return response
+        
         # Verificar se o caminho deve ter cache
         path = request.url.path
         
         # Verificar se o caminho está na lista de no_cache
-        for no_cache_path in self.no_cache_paths:
-            if path.startswith(no_cache_path):
-                response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-                return response
+        if self._no_cache_re is not None and self._no_cache_re.match(path):
+            response.headers["Cache-Control"] = _NO_CACHE_HEADER
+            return response
         
         # Verificar se é uma requisição GET (apenas GETs são cacheados)
         if request.method != "GET":
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+            response.headers["Cache-Control"] = _NO_CACHE_HEADER
+            return response
+        
+        # Respostas com status não cacheável por padrão (RFC 7234) ou que definem
+        # cookies não recebem headers de cache
+        if response.status_code not in _CACHEABLE_STATUS_CODES or "set-cookie" in headers:
             return response
         
         # Define a default max_age value first to avoid UnboundLocalError
@@ -80,25 +127,30 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
         # Check if Cache-Control header already exists and should be preserved
         if "Cache-Control" not in response.headers:
             # Determinar max-age com base no caminho
-            for cache_path, age in self.cache_paths.items():
-                if path.startswith(cache_path):
-                    max_age = age
-                    break
+            match = self._cache_paths_re.match(path) if self._cache_paths_re is not None else None
+            if match:
+                cache_path = match.group(0)
+                max_age = self.cache_paths[cache_path]
+                cache_control = self._cache_control_by_path[cache_path]
+            else:
+                cache_control = self._cache_control_default
             
             # Set the Cache-Control header using the determined max_age
-            response.headers["Cache-Control"] = f"public, max-age={max_age}"
+            response.headers["Cache-Control"] = cache_control
         
         # Add Expires header if it doesn't exist
         if "Expires" not in response.headers:
-            expiry_time = (datetime.utcnow() + timedelta(seconds=max_age)).strftime("%a, %d %b %Y %H:%M:%S GMT")
-            response.headers["Expires"] = expiry_time
+            response.headers["Expires"] = _expires_header(int(time.time()), max_age)
         
-        # Try to add ETag header if it doesn't exist and response has a body
-        if "ETag" not in response.headers and hasattr(response, "body"):
+        # Try to add ETag header if it doesn't exist and response has a body;
+        # respostas em streaming não têm body em memória e ficam sem ETag
+        if "ETag" not in response.headers and not isinstance(response, StreamingResponse):
             try:
-                # Garantir que o body existe e não é vazio antes de calcular o ETag
-                if response.body:
-                    etag = hashlib.md5(response.body).hexdigest()
+                # Garantir que o body existe, não é vazio e não é grande demais para o hash
+                body = getattr(response, "body", None)
+                if body and len(body) <= self.etag_max_body_size:
+                    # ETag é só um validador de cache: blake2b é mais rápido que md5
+                    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
                     response.headers["ETag"] = f'"{etag}"'
             except Exception as e:
                 logger.warning(f"Erro ao gerar ETag: {str(e)}")
@@ -195,32 +247,42 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             Resposta
         """
         # Registrar início da requisição
-        start_time = time.time()
-        request_id = request.headers.get("X-Request-ID", "-")
+        start_time = time.perf_counter_ns()
+        scope = request.scope
         
-        # Adicionar request_id ao contexto de logging
-        LogContext.set("request_id", request_id)
+        # Ler os headers usados no log em uma única passada pela lista crua do ASGI
+        # (nomes já em minúsculas), sem o wrapper case-insensitive do Starlette
+        request_id = user_agent = "-"
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+            elif name == b"user-agent":
+                user_agent = value.decode("latin-1")
+        
+        # Adicionar request_id ao contexto de logging (isolado por requisição)
+        log_context_token = LogContext.set("request_id", request_id)
         
         # Registrar detalhes da requisição
-        client_host = request.client.host if request.client else "unknown"
+        client = scope.get("client")
         request_info = {
             "id": request_id,
             "method": request.method,
             "path": request.url.path,
             "query": str(request.query_params),
-            "client_ip": client_host,
-            "user_agent": request.headers.get("User-Agent", "-")
+            "client_ip": client[0] if client else "unknown",
+            "user_agent": user_agent
         }
         
-        logger.info(f"Request received: {json.dumps(request_info)}")
+        # Os dados vão como atributos extras, serializados uma única vez pelo formatter
+        # (JsonFormatter ou TextFormatter)
+        logger.info("Request received: %s %s", request.method, request_info["path"], **request_info)
         
         # Processar requisição
         try:
             response = await call_next(request)
             
             # Calcular tempo de resposta
-            process_time = time.time() - start_time
-            response_time_ms = round(process_time * 1000)
+            response_time_ms = (time.perf_counter_ns() - start_time) // 1_000_000
             
             # Adicionar header com tempo de resposta
             response.headers["X-Process-Time"] = f"{response_time_ms} ms"
@@ -238,13 +300,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             }
             
             log_method = logger.info if response.status_code < 400 else logger.warning
-            log_method(f"Response sent: {json.dumps(response_info)}")
+            log_method("Response sent: %s", response.status_code, **response_info)
             
             return response
         except Exception as e:
             # Calcular tempo até erro
-            process_time = time.time() - start_time
-            response_time_ms = round(process_time * 1000)
+            response_time_ms = (time.perf_counter_ns() - start_time) // 1_000_000
             
             # Registrar erro
             error_info = {
@@ -253,13 +314,13 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 "process_time_ms": response_time_ms
             }
             
-            logger.error(f"Error processing request: {json.dumps(error_info)}")
+            logger.error("Error processing request: %s", error_info["error"], **error_info)
             
             # Re-lançar exceção para ser tratada pelo próximo middleware
             raise
         finally:
-            # Limpar o contexto de logging
-            LogContext.remove("request_id")
+            # Restaurar o contexto de logging anterior à requisição
+            LogContext.reset(log_context_token)
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
     """
@@ -284,8 +345,8 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         
         # Se não tiver, gerar um
         if not request_id:
-            import uuid
-            request_id = str(uuid.uuid4())
+            # 128 bits aleatórios em hexadecimal, sem montar um objeto UUID
+            request_id = secrets.token_hex(16)
             # Não é possível modificar os headers da requisição diretamente,
             # mas podemos adicionar ao contexto para uso posterior
             request.state.request_id = request_id
@@ -298,6 +359,31 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         
         return response
 
+class RequestCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware que abre um cache com escopo de requisição.
+    
+    Valores lidos do cache em memória ficam disponíveis para leituras
+    repetidas da mesma chave até o fim da requisição.
+    """
+    
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Processa a requisição.
+        
+        Args:
+            request: Requisição
+            call_next: Callback para próximo middleware
+            
+        Returns:
+            Resposta
+        """
+        token = REQ_CACHE.set({})
+        try:
+            return await call_next(request)
+        finally:
+            REQ_CACHE.reset(token)
+
 def setup_middlewares(app: FastAPI) -> None:
     """
     Configura todos os middlewares da aplicação.
@@ -311,6 +397,9 @@ def setup_middlewares(app: FastAPI) -> None:
     # Adicionar middleware de logging de requisições
     app.add_middleware(RequestLoggingMiddleware)
     
+    # Adicionar middleware de cache com escopo de requisição
+    app.add_middleware(RequestCacheMiddleware)
+    
     # Adicionar middleware de tratamento de exceções
     app.add_middleware(
         ErrorHandlerMiddleware,
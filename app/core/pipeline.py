@@ -6,15 +6,42 @@ em pipeline, permitindo encadear operações de extração,
 transformação e carregamento de forma flexível.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Generic, TypeVar, Callable, Optional, Union, Iterator, Iterable
+from collections import OrderedDict
+from typing import Any, Dict, List, Generic, TypeVar, Callable, Optional, Union, Iterator, Iterable, Tuple
+import asyncio
+import atexit
+import csv
+import importlib.util
+import inspect
+import json
 import logging
-from datetime import datetime
+import os
+import threading
+import time
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import pandas as pd
 import numpy as np
-from pydantic import BaseModel
+import httpx
+from pydantic import BaseModel, TypeAdapter
 
+from app.core.cache.factory import CacheFactory
 from app.core.logging import get_logger
 
+# orjson é opcional; sem ele JsonExtractor e JsonFileLoader usam o json padrão
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# pyarrow é opcional; sem ele o CSVExtractor usa o engine C padrão do pandas
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# h2 é opcional; sem ele os clientes HTTP do APIExtractor usam HTTP/1.1
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
 # Tipos genéricos para os dados
 T = TypeVar('T')  # Tipo de entrada
 U = TypeVar('U')  # Tipo de saída
@@ -33,6 +60,8 @@ class Extractor(Generic[T], ABC):
     a próxima etapa do pipeline.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def extract(self) -> T:
         """
@@ -42,6 +71,18 @@ class Extractor(Generic[T], ABC):
             Dados extraídos
         """
         pass
+    
+    async def aextract(self) -> T:
+        """
+        Extrai dados da fonte sem bloquear o event loop.
+        
+        A implementação padrão executa extract em uma thread; extratores
+        com I/O assíncrono nativo podem sobrescrevê-la.
+        
+        Returns:
+            Dados extraídos
+        """
+        return await asyncio.to_thread(self.extract)
 
 class Transformer(Generic[T, U], ABC):
     """
@@ -51,6 +92,8 @@ class Transformer(Generic[T, U], ABC):
     para outro, realizando limpeza, filtragem, agregação, etc.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def transform(self, data: T) -> U:
         """
@@ -72,6 +115,8 @@ class Loader(Generic[T], ABC):
     (banco de dados, arquivo, cache, etc.).
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def load(self, data: T) -> Any:
         """
@@ -87,6 +132,33 @@ class Loader(Generic[T], ABC):
 
 # ----- IMPLEMENTAÇÃO DO PIPELINE -----
 
+async def _arun_first_step(first_step: Callable) -> Any:
+    """
+    Executa o primeiro passo de um pipeline dentro do event loop atual.
+    
+    Extratores são executados com aextract e extratores paralelos têm suas
+    extrações aguardadas diretamente; os demais passos são chamados e, se
+    retornarem um awaitable, aguardados.
+    
+    Args:
+        first_step: Primeiro passo do pipeline
+        
+    Returns:
+        Dados produzidos pelo passo
+    """
+    owner = getattr(first_step, "__self__", None)
+    if isinstance(owner, Extractor):
+        return await owner.aextract()
+    
+    agather = getattr(first_step, "agather", None)
+    if agather is not None:
+        return await agather()
+    
+    data = first_step()
+    if inspect.isawaitable(data):
+        data = await data
+    return data
+
 class Pipeline:
     """
     Pipeline de processamento de dados ETL.
@@ -95,6 +167,8 @@ class Pipeline:
     de dados, permitindo construir fluxos de processamento flexíveis.
     """
     
+    __slots__ = ("name", "steps", "logger", "_compiled", "_compiled_steps", "_debug")
+    
     def __init__(self, name: str = "pipeline"):
         """
         Inicializa o pipeline.
@@ -104,10 +178,77 @@ class Pipeline:
         """
         self.name = name
         self.steps: List[Callable] = []
-        self.extractors: List[Extractor] = []
-        self.transformers: List[Transformer] = []
-        self.loaders: List[Loader] = []
         self.logger = get_logger(f"pipeline.{name}")
+        
+        # Cadeia de passos compilada (ver compile) e os passos usados nela
+        self._compiled: Optional[Callable[[Any], Any]] = None
+        self._compiled_steps: Tuple[Callable, ...] = ()
+        self._debug = False
+    
+    @classmethod
+    def from_steps(
+        cls,
+        name: str = "pipeline",
+        extractors: Iterable[Extractor] = (),
+        transformers: Iterable[Transformer] = (),
+        loaders: Iterable[Loader] = ()
+    ) -> 'Pipeline':
+        """
+        Cria um pipeline com todos os componentes de uma vez.
+        
+        Equivale a chamar add_extractor, add_transformer e add_loader para cada
+        componente, nessa ordem, mas monta a lista de passos em uma única passada.
+        
+        Args:
+            name: Nome do pipeline para identificação em logs
+            extractors: Extratores, na ordem de execução
+            transformers: Transformadores, na ordem de execução
+            loaders: Carregadores, na ordem de execução
+            
+        Returns:
+            Pipeline configurado
+        """
+        pipeline = cls(name)
+        pipeline.steps = [
+            *(extractor.extract for extractor in extractors),
+            *(transformer.transform for transformer in transformers),
+            *(loader.load for loader in loaders),
+        ]
+        return pipeline
+    
+    def _step_owners(self, kind: type) -> List[Any]:
+        """
+        Obtém os componentes de um tipo a partir dos passos do pipeline.
+        
+        Args:
+            kind: Extractor, Transformer ou Loader
+            
+        Returns:
+            Componentes na ordem em que foram adicionados
+        """
+        owners = []
+        for step in self.steps:
+            owner = getattr(step, "__self__", None)
+            if isinstance(owner, kind):
+                owners.append(owner)
+            elif kind is Extractor:
+                owners.extend(getattr(step, "extractors", ()))
+        return owners
+    
+    @property
+    def extractors(self) -> List[Extractor]:
+        """Extratores do pipeline."""
+        return self._step_owners(Extractor)
+    
+    @property
+    def transformers(self) -> List[Transformer]:
+        """Transformadores do pipeline."""
+        return self._step_owners(Transformer)
+    
+    @property
+    def loaders(self) -> List[Loader]:
+        """Carregadores do pipeline."""
+        return self._step_owners(Loader)
     
     def add_extractor(self, extractor: Extractor) -> 'Pipeline':
         """
@@ -119,10 +260,49 @@ class Pipeline:
         Returns:
             Pipeline atualizado para encadeamento de métodos
         """
-        self.extractors.append(extractor)
         self.steps.append(extractor.extract)
         return self
     
+    def add_parallel_extractors(self, *extractors: Extractor, max_concurrency: int = 8) -> 'Pipeline':
+        """
+        Adiciona extratores independentes executados concorrentemente.
+        
+        Os extratores formam um único passo, cujo resultado é a lista com
+        os dados de cada um, na ordem em que foram informados.
+        
+        Args:
+            *extractors: Extratores a serem executados
+            max_concurrency: Número máximo de extrações simultâneas
+            
+        Returns:
+            Pipeline atualizado para encadeamento de métodos
+        """
+        async def gather_extractors() -> List[Any]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def run(extractor: Extractor) -> Any:
+                async with semaphore:
+                    return await extractor.aextract()
+            
+            return list(await asyncio.gather(*(run(extractor) for extractor in extractors)))
+        
+        def parallel_extract() -> List[Any]:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return _run_in_new_loop(gather_extractors())
+            # Chamado de forma síncrona dentro de um event loop: o loop atual não
+            # pode esperar por si mesmo, então as extrações rodam em outra thread
+            # com um loop próprio (em código assíncrono, prefira aexecute)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(_run_in_new_loop, gather_extractors()).result()
+        
+        parallel_extract.extractors = extractors
+        # aexecute aguarda as extrações no próprio event loop
+        parallel_extract.agather = gather_extractors
+        self.steps.append(parallel_extract)
+        return self
+    
     def add_transformer(self, transformer: Transformer) -> 'Pipeline':
         """
         Adiciona um transformador ao pipeline.
@@ -133,7 +313,6 @@ class Pipeline:
         Returns:
             Pipeline atualizado para encadeamento de métodos
         """
-        self.transformers.append(transformer)
         self.steps.append(transformer.transform)
         return self
     
@@ -147,7 +326,6 @@ class Pipeline:
         Returns:
             Pipeline atualizado para encadeamento de métodos
         """
-        self.loaders.append(loader)
         self.steps.append(loader.load)
         return self
     
@@ -168,9 +346,9 @@ class Pipeline:
             
             def named_step(data: Any) -> Any:
                 self.logger.info(f"Executando passo '{name}'")
-                start_time = datetime.now()
+                start_time = time.perf_counter()
                 result = original_step(data)
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
                 self.logger.info(f"Passo '{name}' concluído em {duration:.2f}s")
                 return result
             
@@ -180,10 +358,47 @@ class Pipeline:
         
         return self
     
+    def compile(self) -> 'Pipeline':
+        """
+        Compila os passos após o primeiro em uma única função.
+        
+        Passos LazyDataFrameStep consecutivos são fundidos em uma única
+        passada sobre o DataFrame. O log de cada passo só é feito se o
+        nível DEBUG estiver habilitado no momento da compilação.
+        
+        Returns:
+            Pipeline atualizado para encadeamento de métodos
+        """
+        steps = tuple(_fuse_lazy_steps(self.steps[1:]))
+        self._debug = self.logger.is_enabled_for(logging.DEBUG)
+        
+        if self._debug:
+            def run(data: Any) -> Any:
+                for i, step in enumerate(steps, 1):
+                    try:
+                        self.logger.debug(f"Executando passo {i}")
+                        data = step(data)
+                    except Exception as e:
+                        self.logger.error(f"Erro no passo {i}: {str(e)}")
+                        raise
+                return data
+        else:
+            def run(data: Any) -> Any:
+                for step in steps:
+                    data = step(data)
+                return data
+        
+        self._compiled = run
+        self._compiled_steps = tuple(self.steps)
+        return self
+    
     def execute(self) -> Any:
         """
         Executa o pipeline completo.
         
+        O pipeline é compilado na primeira execução e recompilado apenas
+        quando seus passos mudam.
+        
         Returns:
             Resultado da execução do pipeline
         """
@@ -191,26 +406,172 @@ class Pipeline:
             self.logger.warning("Pipeline vazio, nada a executar")
             return None
         
+        if self._compiled is None or self._compiled_steps != tuple(self.steps):
+            self.compile()
+        
         self.logger.info(f"Iniciando execução do pipeline '{self.name}' com {len(self.steps)} passos")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        
+        try:
+            data = self._compiled(self.steps[0]())
+        except Exception as e:
+            if not self._debug:
+                self.logger.error(f"Erro no pipeline '{self.name}': {str(e)}")
+            raise
+        
+        duration = time.perf_counter() - start_time
+        self.logger.info(f"Pipeline '{self.name}' concluído em {duration:.2f}s")
+        
+        return data
+    
+    async def aexecute(self) -> Any:
+        """
+        Executa o pipeline completo de forma assíncrona.
+        
+        O primeiro passo, se for um extrator, é executado com aextract;
+        passos que retornam awaitables são aguardados.
+        
+        Returns:
+            Resultado da execução do pipeline
+        """
+        if not self.steps:
+            self.logger.warning("Pipeline vazio, nada a executar")
+            return None
+        
+        self.logger.info(f"Iniciando execução assíncrona do pipeline '{self.name}' com {len(self.steps)} passos")
+        start_time = time.perf_counter()
         
         # Inicia com o primeiro passo
-        data = self.steps[0]()
+        data = await _arun_first_step(self.steps[0])
         
         # Executa os passos seguintes
-        for i, step in enumerate(self.steps[1:], 1):
+        for i, step in enumerate(_fuse_lazy_steps(self.steps[1:]), 1):
             try:
                 self.logger.debug(f"Executando passo {i}")
                 data = step(data)
+                if inspect.isawaitable(data):
+                    data = await data
             except Exception as e:
                 self.logger.error(f"Erro no passo {i}: {str(e)}")
                 raise
         
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         self.logger.info(f"Pipeline '{self.name}' concluído em {duration:.2f}s")
         
         return data
 
+# Marca o fim dos blocos na fila do StreamingPipeline
+_END_OF_STREAM = object()
+
+class StreamingPipeline(Pipeline):
+    """
+    Pipeline produtor/consumidor para dados extraídos em blocos.
+    
+    O primeiro passo produz os blocos (ex: CSVExtractor com streaming=True)
+    e os coloca em uma fila limitada; os demais passos, incluindo os
+    loaders, são aplicados a cada bloco enquanto o próximo é lido.
+    """
+    
+    __slots__ = ("max_queue_size",)
+    
+    def __init__(self, name: str = "streaming_pipeline", max_queue_size: int = 4):
+        """
+        Inicializa o pipeline.
+        
+        Args:
+            name: Nome do pipeline para identificação em logs
+            max_queue_size: Número máximo de blocos aguardando processamento
+        """
+        super().__init__(name)
+        self.max_queue_size = max_queue_size
+    
+    def execute(self) -> Any:
+        """
+        Executa o pipeline completo em um novo event loop.
+        
+        Returns:
+            Lista com o resultado de cada bloco
+        """
+        return _run_in_new_loop(self.aexecute())
+    
+    async def aexecute(self) -> Any:
+        """
+        Executa o pipeline completo de forma assíncrona.
+        
+        Returns:
+            Lista com o resultado de cada bloco
+        """
+        if not self.steps:
+            self.logger.warning("Pipeline vazio, nada a executar")
+            return None
+        
+        if self._compiled is None or self._compiled_steps != tuple(self.steps):
+            self.compile()
+        
+        self.logger.info(f"Iniciando execução em blocos do pipeline '{self.name}' com {len(self.steps)} passos")
+        start_time = time.perf_counter()
+        
+        # Inicia com o primeiro passo, que fornece os blocos
+        source = await _arun_first_step(self.steps[0])
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        producer = asyncio.create_task(self._produce(source, queue))
+        try:
+            results = await self._consume(queue)
+        except BaseException:
+            producer.cancel()
+            raise
+        await producer
+        
+        duration = time.perf_counter() - start_time
+        self.logger.info(f"Pipeline '{self.name}' concluído em {duration:.2f}s ({len(results)} blocos)")
+        
+        return results
+    
+    async def _produce(self, source: Any, queue: asyncio.Queue) -> None:
+        """
+        Lê os blocos da fonte e os coloca na fila.
+        
+        Args:
+            source: Iterador (síncrono ou assíncrono) de blocos; qualquer
+                outro valor é tratado como um único bloco
+            queue: Fila de blocos
+        """
+        try:
+            if hasattr(source, "__aiter__"):
+                async for chunk in source:
+                    await queue.put(chunk)
+            else:
+                iterator = source if isinstance(source, Iterator) else iter((source,))
+                while True:
+                    # A leitura do bloco é feita em uma thread para não bloquear o consumidor
+                    chunk = await asyncio.to_thread(next, iterator, _END_OF_STREAM)
+                    if chunk is _END_OF_STREAM:
+                        break
+                    await queue.put(chunk)
+        except Exception as e:
+            self.logger.error(f"Erro ao ler blocos: {str(e)}")
+            await queue.put(_END_OF_STREAM)
+            raise
+        await queue.put(_END_OF_STREAM)
+    
+    async def _consume(self, queue: asyncio.Queue) -> List[Any]:
+        """
+        Aplica os passos compilados a cada bloco da fila.
+        
+        Args:
+            queue: Fila de blocos
+            
+        Returns:
+            Lista com o resultado de cada bloco
+        """
+        results = []
+        while True:
+            chunk = await queue.get()
+            if chunk is _END_OF_STREAM:
+                return results
+            results.append(await asyncio.to_thread(self._compiled, chunk))
+
 # ----- TRANSFORMADORES GENÉRICOS -----
 
 class DataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
@@ -220,6 +581,8 @@ class DataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
     Fornece métodos utilitários para transformações comuns em DataFrames.
     """
     
+    __slots__ = ("name", "logger")
+    
     def __init__(self, name: str = "dataframe_transformer"):
         """
         Inicializa o transformador.
@@ -255,18 +618,38 @@ class DataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
         """
         return df.rename(columns=mapping)
     
-    def filter_rows(self, df: pd.DataFrame, condition: Callable[[pd.Series], bool]) -> pd.DataFrame:
+    def filter_rows(self, df: pd.DataFrame, mask: Union[pd.Series, Callable[[pd.DataFrame], pd.Series]]) -> pd.DataFrame:
         """
-        Filtra linhas do DataFrame.
+        Filtra linhas do DataFrame com uma máscara booleana vetorizada.
         
         Args:
             df: DataFrame
-            condition: Função que recebe uma linha e retorna True/False
+            mask: Série booleana, ou função que recebe o DataFrame inteiro
+                e retorna a série booleana (ex: lambda df: df["ano"] > 2000)
             
         Returns:
             DataFrame filtrado
         """
-        return df[df.apply(condition, axis=1)]
+        if not callable(mask):
+            return df[mask]
+        
+        # A função é avaliada uma única vez sobre o DataFrame inteiro
+        try:
+            m = mask(df)
+        except (TypeError, ValueError, KeyError, AttributeError):
+            m = None
+        
+        if isinstance(m, pd.Series) and m.dtype == bool and m.index.equals(df.index):
+            return df[m]
+        
+        # Condições linha a linha (API antiga): mantidas por compatibilidade
+        warnings.warn(
+            "filter_rows com função aplicada linha a linha está obsoleto; "
+            "passe uma função que recebe o DataFrame e retorna uma série booleana",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return df[df.apply(mask, axis=1).astype(bool)]
     
     def select_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
         """
@@ -281,26 +664,44 @@ class DataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
         """
         return df[columns]
     
-    def apply_function(self, df: pd.DataFrame, func: Callable, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    def apply_function(self, df: pd.DataFrame, func: Optional[Callable] = None, columns: Optional[List[str]] = None,
+                       mapping: Optional[Dict[Any, Any]] = None) -> pd.DataFrame:
         """
         Aplica uma função às colunas especificadas.
         
+        Ufuncs do NumPy recebem a coluna inteira como array; demais funções
+        são aplicadas elemento a elemento com Series.map.
+        
         Args:
             df: DataFrame
             func: Função a aplicar
             columns: Colunas onde aplicar (None = todas)
+            mapping: Dicionário {valor: novo_valor} usado no lugar de func
+                (valores ausentes do dicionário viram NaN, como em Series.map)
             
         Returns:
             DataFrame transformado
         """
-        result = df.copy()
+        if mapping is not None:
+            # O dicionário é sempre aplicado elemento a elemento
+            func = mapping
+            columns = columns or list(df.columns)
+        elif func is None:
+            raise ValueError("É necessário informar func ou mapping")
+        
+        vectorized = isinstance(func, np.ufunc) or hasattr(func, "__array_ufunc__")
+        
         if columns:
+            # Cópia rasa: apenas as colunas alteradas são recriadas, as demais são reaproveitadas
+            result = df.copy(deep=False)
             for col in columns:
-                if col in result.columns:
-                    result[col] = result[col].apply(func)
+                if col in df.columns:
+                    result[col] = func(df[col].to_numpy()) if vectorized else df[col].map(func)
+            return result
+        elif vectorized:
+            return func(df)
         else:
-            result = result.apply(func)
-        return result
+            return df.apply(func)
     
     def fill_na(self, df: pd.DataFrame, value: Any = 0, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
@@ -315,10 +716,10 @@ class DataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
             DataFrame sem valores NA
         """
         if columns:
-            result = df.copy()
+            result = df.copy(deep=False)
             for col in columns:
-                if col in result.columns:
-                    result[col] = result[col].fillna(value)
+                if col in df.columns:
+                    result[col] = df[col].fillna(value)
             return result
         else:
             return df.fillna(value)
@@ -327,6 +728,9 @@ class DataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
         """
         Remove linhas duplicadas.
         
+        Em colunas com dtype Arrow (ver arrow_dtypes no CSVExtractor), o pandas
+        já faz a fatoração com os kernels do Arrow, preservando ordem e índice.
+        
         Args:
             df: DataFrame
             subset: Colunas a considerar (None = todas)
@@ -336,6 +740,164 @@ class DataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
         """
         return df.drop_duplicates(subset=subset)
 
+class LazyDataFrameStep(Transformer[pd.DataFrame, pd.DataFrame]):
+    """
+    Passo de DataFrame registrado como (operação, argumentos).
+    
+    Passos consecutivos deste tipo são fundidos pelo Pipeline em uma única
+    passada, sem materializar o DataFrame entre cada operação. Use os
+    construtores filter, select e assign.
+    """
+    
+    _OPERATIONS = ("filter", "select", "assign")
+    
+    def __init__(self, op: str, args: Any):
+        """
+        Inicializa o passo.
+        
+        Args:
+            op: Operação ("filter", "select" ou "assign")
+            args: Argumentos da operação
+        """
+        if op not in self._OPERATIONS:
+            raise ValueError(f"Operação desconhecida: {op}")
+        self.op = op
+        self.args = args
+    
+    @classmethod
+    def filter(cls, expr: str) -> 'LazyDataFrameStep':
+        """
+        Cria um filtro de linhas.
+        
+        Args:
+            expr: Expressão booleana no formato de DataFrame.query (ex: "ano > 2000")
+            
+        Returns:
+            Passo de filtro
+        """
+        return cls("filter", expr)
+    
+    @classmethod
+    def select(cls, columns: List[str]) -> 'LazyDataFrameStep':
+        """
+        Cria uma seleção de colunas.
+        
+        Args:
+            columns: Colunas a manter
+            
+        Returns:
+            Passo de seleção
+        """
+        return cls("select", tuple(columns))
+    
+    @classmethod
+    def assign(cls, **expressions: str) -> 'LazyDataFrameStep':
+        """
+        Cria colunas a partir de expressões.
+        
+        Args:
+            **expressions: {coluna: expressão no formato de DataFrame.eval}
+            
+        Returns:
+            Passo de atribuição
+        """
+        return cls("assign", tuple(expressions.items()))
+    
+    def transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Executa o passo isoladamente.
+        
+        Args:
+            data: DataFrame de entrada
+            
+        Returns:
+            DataFrame transformado
+        """
+        return _apply_lazy_plan(data, [(self.op, self.args)])
+
+def _coalesce_lazy_ops(ops: List[tuple]) -> List[tuple]:
+    """
+    Junta operações consecutivas do mesmo tipo.
+    
+    Filtros viram uma única expressão (a) & (b), atribuições viram uma única
+    chamada a eval com várias linhas e, em seleções seguidas, vale a última.
+    
+    Args:
+        ops: Lista de (operação, argumentos) na ordem do pipeline
+        
+    Returns:
+        Plano com as operações coalescidas
+    """
+    plan: List[tuple] = []
+    for op, args in ops:
+        if plan and plan[-1][0] == op:
+            previous = plan[-1][1]
+            if op == "filter":
+                args = f"({previous}) & ({args})"
+            elif op == "assign":
+                args = previous + args
+            plan[-1] = (op, args)
+        else:
+            plan.append((op, args))
+    return plan
+
+def _apply_lazy_plan(df: pd.DataFrame, plan: List[tuple]) -> pd.DataFrame:
+    """
+    Executa um plano de operações sobre o DataFrame.
+    
+    As expressões são avaliadas por DataFrame.eval, que usa o numexpr
+    quando ele está instalado.
+    
+    Args:
+        df: DataFrame de entrada
+        plan: Plano gerado por _coalesce_lazy_ops
+        
+    Returns:
+        DataFrame resultante
+    """
+    i = 0
+    while i < len(plan):
+        op, args = plan[i]
+        if op == "filter":
+            mask = df.eval(args)
+            # Filtro seguido de seleção: linhas e colunas em uma única indexação
+            if i + 1 < len(plan) and plan[i + 1][0] == "select":
+                i += 1
+                df = df.loc[mask, list(plan[i][1])]
+            else:
+                df = df.loc[mask]
+        elif op == "select":
+            df = df[list(args)]
+        else:
+            df = df.eval("\n".join(f"{column} = {expr}" for column, expr in args))
+        i += 1
+    return df
+
+def _fuse_lazy_steps(steps: List[Callable]) -> List[Callable]:
+    """
+    Substitui sequências de LazyDataFrameStep por um único passo fundido.
+    
+    Args:
+        steps: Passos do pipeline
+        
+    Returns:
+        Passos com as sequências de LazyDataFrameStep fundidas
+    """
+    fused: List[Callable] = []
+    pending: List[tuple] = []
+    for step in steps:
+        owner = getattr(step, "__self__", None)
+        if isinstance(owner, LazyDataFrameStep):
+            pending.append((owner.op, owner.args))
+            continue
+        if pending:
+            fused.append(partial(_apply_lazy_plan, plan=_coalesce_lazy_ops(pending)))
+            pending = []
+        fused.append(step)
+    if pending:
+        fused.append(partial(_apply_lazy_plan, plan=_coalesce_lazy_ops(pending)))
+    return fused
+
 class DictTransformer(Transformer[Dict[str, Any], Dict[str, Any]]):
     """
     Transformador base para operações com dicionários.
@@ -343,6 +905,8 @@ class DictTransformer(Transformer[Dict[str, Any], Dict[str, Any]]):
     Fornece métodos utilitários para transformações comuns em dicionários.
     """
     
+    __slots__ = ("name", "logger")
+    
     def __init__(self, name: str = "dict_transformer"):
         """
         Inicializa o transformador.
@@ -376,11 +940,7 @@ class DictTransformer(Transformer[Dict[str, Any], Dict[str, Any]]):
         Returns:
             Dicionário com chaves renomeadas
         """
-        result = {}
-        for key, value in data.items():
-            new_key = mapping.get(key, key)
-            result[new_key] = value
-        return result
+        return {mapping.get(key, key): value for key, value in data.items()}
     
     def filter_keys(self, data: Dict[str, Any], keys: List[str]) -> Dict[str, Any]:
         """
@@ -393,7 +953,8 @@ class DictTransformer(Transformer[Dict[str, Any], Dict[str, Any]]):
         Returns:
             Dicionário apenas com as chaves especificadas
         """
-        return {k: v for k, v in data.items() if k in keys}
+        keyset = keys if isinstance(keys, (set, frozenset)) else frozenset(keys)
+        return {k: v for k, v in data.items() if k in keyset}
     
     def apply_function(self, data: Dict[str, Any], func: Callable, keys: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -418,44 +979,200 @@ class DictTransformer(Transformer[Dict[str, Any], Dict[str, Any]]):
 
 # ----- IMPLEMENTAÇÕES DE EXTRATORES -----
 
-class CSVExtractor(Extractor[pd.DataFrame]):
+# Formatos colunares lidos por _read_any no lugar do CSV (exigem pyarrow)
+_COLUMNAR_READERS: Dict[str, Callable[..., pd.DataFrame]] = {
+    ".parquet": partial(pd.read_parquet, engine="pyarrow"),
+    ".feather": pd.read_feather,
+}
+
+# Argumentos do pandas.read_csv aceitos pelo engine pyarrow (thousands, skipfooter,
+# nrows, converters, comment etc. só existem nos engines C e Python)
+_PYARROW_CSV_OPTIONS = frozenset({
+    "sep", "delimiter", "header", "names", "index_col", "usecols", "dtype",
+    "true_values", "false_values", "skiprows", "na_values", "keep_default_na",
+    "na_filter", "parse_dates", "date_format", "encoding", "encoding_errors",
+    "quotechar", "escapechar", "dtype_backend", "compression", "storage_options",
+})
+
+def _pyarrow_csv_supported(read_csv_kwargs: Dict[str, Any]) -> bool:
+    """
+    Verifica se uma leitura de CSV pode usar o engine pyarrow.
+    
+    Args:
+        read_csv_kwargs: Argumentos para pandas.read_csv
+        
+    Returns:
+        True se todos os argumentos (e seus valores) são aceitos pelo engine pyarrow
+    """
+    if not read_csv_kwargs.keys() <= _PYARROW_CSV_OPTIONS:
+        return False
+    # Separadores com mais de um caractere são expressões regulares (engine Python)
+    for key in ("sep", "delimiter"):
+        value = read_csv_kwargs.get(key)
+        if value is not None and len(value) != 1:
+            return False
+    # usecols como função e skiprows como lista de linhas não são suportados
+    return (
+        not callable(read_csv_kwargs.get("usecols"))
+        and isinstance(read_csv_kwargs.get("skiprows", 0), int)
+    )
+
+def _read_any(path: str, **read_csv_kwargs) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Lê um arquivo tabular escolhendo o leitor pela extensão.
+    
+    Arquivos .parquet e .feather já guardam os tipos das colunas e são lidos
+    sem conversão de texto; os argumentos do CSV são ignorados para eles, e
+    com chunksize o arquivo inteiro vira um único bloco.
+    
+    Args:
+        path: Caminho do arquivo
+        **read_csv_kwargs: Argumentos para pandas.read_csv
+        
+    Returns:
+        DataFrame com os dados, ou iterador de DataFrames se houver chunksize
+    """
+    reader = _COLUMNAR_READERS.get(os.path.splitext(path)[1].lower())
+    if reader is not None:
+        df = reader(path)
+        return iter((df,)) if read_csv_kwargs.get("chunksize") else df
+    return pd.read_csv(path, **read_csv_kwargs)
+
+def materialize_parquet(csv_path: str, parquet_path: Optional[str] = None,
+                        compression: str = "snappy", **read_csv_kwargs) -> str:
+    """
+    Converte um CSV em Parquet, para que execuções seguintes leiam o Parquet.
+    
+    Args:
+        csv_path: Caminho do arquivo CSV
+        parquet_path: Caminho do arquivo Parquet (padrão: o do CSV com extensão .parquet)
+        compression: Compressão do Parquet
+        **read_csv_kwargs: Argumentos para pandas.read_csv
+        
+    Returns:
+        Caminho do arquivo Parquet
+    """
+    parquet_path = parquet_path or os.path.splitext(csv_path)[0] + ".parquet"
+    pd.read_csv(csv_path, **read_csv_kwargs).to_parquet(parquet_path, compression=compression)
+    logger.info(f"CSV materializado em Parquet: {csv_path} -> {parquet_path}")
+    return parquet_path
+
+class CSVExtractor(Extractor[Union[pd.DataFrame, Iterator[pd.DataFrame]]]):
     """
     Extrai dados de um arquivo CSV.
     """
     
-    def __init__(self, file_path: str, **read_csv_kwargs):
+    # Logger único da classe; cada instância só acrescenta o alvo como extra
+    _logger = get_logger("extractor.csv")
+    
+    def __init__(self, file_path: str, streaming: bool = False, chunksize: int = 100_000,
+                 date_format: Optional[str] = None, arrow_dtypes: bool = False, **read_csv_kwargs):
         """
         Inicializa o extrator.
         
         Args:
             file_path: Caminho para o arquivo CSV
+            streaming: Se True, extract retorna um iterador de DataFrames em blocos
+            chunksize: Número de linhas por bloco no modo streaming
+            date_format: Formato fixo das colunas de data em parse_dates
+                (ex: "%Y-%m-%d"); sem ele o pandas infere o formato
+            arrow_dtypes: Se True (e com pyarrow instalado), as colunas usam
+                dtypes Arrow (strings Arrow e pd.NA no lugar de object e NaN)
             **read_csv_kwargs: Argumentos para pandas.read_csv
         """
         self.file_path = file_path
+        self.streaming = streaming
         self.read_csv_kwargs = read_csv_kwargs
-        self.logger = get_logger(f"extractor.csv.{file_path}")
+        self.date_format = date_format
+        if date_format is not None:
+            self.read_csv_kwargs["date_format"] = date_format
+        if streaming:
+            # O engine pyarrow não suporta leitura em blocos
+            self.read_csv_kwargs.setdefault("chunksize", chunksize)
+        if arrow_dtypes and _HAS_PYARROW:
+            # Colunas Arrow: seleção sem cópia e hashing vetorizado em drop_duplicates
+            self.read_csv_kwargs.setdefault("dtype_backend", "pyarrow")
+        if _HAS_PYARROW and "engine" not in self.read_csv_kwargs and _pyarrow_csv_supported(self.read_csv_kwargs):
+            # Leitura multithread, só quando nenhum argumento exige os engines C/Python
+            self.read_csv_kwargs["engine"] = "pyarrow"
+        self.logger = self._logger.with_context(target=file_path)
+        
+        if read_csv_kwargs.get("parse_dates") and "date_format" not in read_csv_kwargs:
+            self.logger.warning(
+                f"parse_dates sem date_format em {file_path}: a inferência do formato "
+                f"de data é muito mais lenta que um formato fixo"
+            )
     
-    def extract(self) -> pd.DataFrame:
+    def extract(self) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Extrai dados do arquivo CSV.
         
+        Caminhos .parquet e .feather (ver materialize_parquet) são lidos no
+        formato colunar correspondente.
+        
         Returns:
-            DataFrame com os dados do CSV
+            DataFrame com os dados do CSV, ou iterador de DataFrames
+            no modo streaming
         """
         self.logger.info(f"Extraindo dados do arquivo CSV: {self.file_path}")
         try:
-            df = pd.read_csv(self.file_path, **self.read_csv_kwargs)
+            df = _read_any(self.file_path, **self.read_csv_kwargs)
+            if self.streaming:
+                self.logger.info(f"Leitura em blocos iniciada: {self.read_csv_kwargs['chunksize']} linhas por bloco")
+                return df
             self.logger.info(f"Dados extraídos com sucesso: {len(df)} linhas, {len(df.columns)} colunas")
             return df
         except Exception as e:
             self.logger.error(f"Erro ao extrair dados do CSV: {str(e)}")
             raise
 
+class CSVRowExtractor(Extractor[Iterator[Dict[str, str]]]):
+    """
+    Extrai as linhas de um arquivo CSV uma a uma, sem passar pelo pandas.
+    
+    Para pipelines com lógica por linha: o arquivo é lido sob demanda, e
+    apenas a linha atual fica em memória.
+    """
+    
+    _logger = get_logger("extractor.csv_rows")
+    
+    def __init__(self, file_path: str, encoding: str = "utf-8", **reader_kwargs):
+        """
+        Inicializa o extrator.
+        
+        Args:
+            file_path: Caminho para o arquivo CSV
+            encoding: Codificação do arquivo
+            **reader_kwargs: Argumentos para csv.DictReader (ex: delimiter)
+        """
+        self.file_path = file_path
+        self.encoding = encoding
+        self.reader_kwargs = reader_kwargs
+        self.logger = self._logger.with_context(target=file_path)
+    
+    def extract(self) -> Iterator[Dict[str, str]]:
+        """
+        Extrai as linhas do arquivo CSV.
+        
+        Returns:
+            Iterador de dicionários {coluna: valor}, com os valores como texto;
+            o arquivo só é aberto quando a primeira linha é consumida
+        """
+        self.logger.info(f"Leitura por linhas do arquivo CSV: {self.file_path}")
+        return self._rows()
+    
+    def _rows(self) -> Iterator[Dict[str, str]]:
+        """Gera as linhas do arquivo, que fica aberto até o fim da leitura."""
+        with open(self.file_path, newline="", encoding=self.encoding) as f:
+            yield from csv.DictReader(f, **self.reader_kwargs)
+
 class JsonExtractor(Extractor[Dict[str, Any]]):
     """
     Extrai dados de um arquivo JSON.
     """
     
+    _logger = get_logger("extractor.json")
+    
     def __init__(self, file_path: str, **read_json_kwargs):
         """
         Inicializa o extrator.
@@ -466,7 +1183,7 @@ class JsonExtractor(Extractor[Dict[str, Any]]):
         """
         self.file_path = file_path
         self.read_json_kwargs = read_json_kwargs
-        self.logger = get_logger(f"extractor.json.{file_path}")
+        self.logger = self._logger.with_context(target=file_path)
     
     def extract(self) -> Dict[str, Any]:
         """
@@ -477,24 +1194,120 @@ class JsonExtractor(Extractor[Dict[str, Any]]):
         """
         self.logger.info(f"Extraindo dados do arquivo JSON: {self.file_path}")
         try:
-            import json
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.file_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             self.logger.info(f"Dados extraídos com sucesso")
             return data
         except Exception as e:
             self.logger.error(f"Erro ao extrair dados do JSON: {str(e)}")
             raise
 
+# Clientes HTTP compartilhados por origem (esquema + host), para que
+# extratores da mesma API reaproveitem conexões abertas
+_http_clients: Dict[str, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+# Clientes assíncronos ficam presos ao event loop em que foram criados
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+
+def _get_http_client(url: str) -> httpx.Client:
+    """
+    Obtém o cliente HTTP compartilhado da origem da URL.
+    
+    O cliente é compartilhado por extratores com timeouts diferentes, então
+    cada requisição informa o próprio timeout.
+    
+    Args:
+        url: URL da requisição
+        
+    Returns:
+        Cliente com pool de conexões keep-alive
+    """
+    origin = str(httpx.URL(url).copy_with(path="/", query=None, fragment=None))
+    client = _http_clients.get(origin)
+    if client is None:
+        with _http_clients_lock:
+            client = _http_clients.get(origin)
+            if client is None:
+                client = httpx.Client(http2=_HAS_H2)
+                _http_clients[origin] = client
+    return client
+
+def _get_async_http_client(url: str) -> httpx.AsyncClient:
+    """
+    Obtém o cliente HTTP assíncrono da origem da URL no event loop atual.
+    
+    Como no cliente síncrono, cada requisição informa o próprio timeout.
+    
+    Args:
+        url: URL da requisição
+        
+    Returns:
+        Cliente assíncrono com pool de conexões keep-alive
+    """
+    origin = str(httpx.URL(url).copy_with(path="/", query=None, fragment=None))
+    clients = _async_http_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(origin)
+    if client is None:
+        client = clients[origin] = httpx.AsyncClient(http2=_HAS_H2)
+    return client
+
+async def _close_loop_http_clients_after(main: Any) -> Any:
+    """
+    Aguarda uma corrotina e fecha os clientes assíncronos criados no loop atual.
+    
+    Args:
+        main: Corrotina a ser aguardada
+        
+    Returns:
+        Resultado da corrotina
+    """
+    try:
+        return await main
+    finally:
+        clients = _async_http_clients.pop(asyncio.get_running_loop(), None)
+        if clients:
+            await asyncio.gather(*(client.aclose() for client in clients.values()), return_exceptions=True)
+
+def _run_in_new_loop(main: Any) -> Any:
+    """
+    Executa uma corrotina em um novo event loop, como asyncio.run.
+    
+    Os clientes HTTP assíncronos do loop são fechados antes de ele ser
+    encerrado, em vez de ficarem com conexões abertas em _async_http_clients.
+    
+    Args:
+        main: Corrotina a ser executada
+        
+    Returns:
+        Resultado da corrotina
+    """
+    return asyncio.run(_close_loop_http_clients_after(main))
+
+def _close_http_clients() -> None:
+    """
+    Fecha os clientes HTTP síncronos compartilhados.
+    """
+    with _http_clients_lock:
+        for client in _http_clients.values():
+            client.close()
+        _http_clients.clear()
+
+atexit.register(_close_http_clients)
+
 class APIExtractor(Extractor[Dict[str, Any]]):
     """
     Extrai dados de uma API REST.
     """
     
+    _logger = get_logger("extractor.api")
+    
     def __init__(self, url: str, method: str = "GET", 
                  headers: Optional[Dict[str, str]] = None, 
                  params: Optional[Dict[str, Any]] = None, 
-                 json_body: Optional[Dict[str, Any]] = None):
+                 json_body: Optional[Dict[str, Any]] = None,
+                 timeout: float = 30.0):
         """
         Inicializa o extrator.
         
@@ -504,13 +1317,15 @@ class APIExtractor(Extractor[Dict[str, Any]]):
             headers: Cabeçalhos HTTP (opcional)
             params: Parâmetros de query string (opcional)
             json_body: Corpo da requisição em JSON (para POST, PUT, etc.) (opcional)
+            timeout: Timeout das requisições em segundos
         """
         self.url = url
         self.method = method.upper()
         self.headers = headers or {}
         self.params = params or {}
         self.json_body = json_body
-        self.logger = get_logger(f"extractor.api.{url}")
+        self.timeout = timeout
+        self.logger = self._logger.with_context(target=url)
     
     def extract(self) -> Dict[str, Any]:
         """
@@ -519,16 +1334,40 @@ class APIExtractor(Extractor[Dict[str, Any]]):
         Returns:
             Dados retornados pela API
         """
-        import requests
+        self.logger.info(f"Extraindo dados da API: {self.url} ({self.method})")
+        try:
+            response = _get_http_client(self.url).request(
+                method=self.method,
+                url=self.url,
+                headers=self.headers,
+                params=self.params,
+                json=self.json_body,
+                timeout=self.timeout
+            )
+            response.raise_for_status()  # Raise exception for 4xx/5xx responses
+            data = response.json()
+            self.logger.info(f"Dados extraídos com sucesso: status {response.status_code}")
+            return data
+        except Exception as e:
+            self.logger.error(f"Erro ao extrair dados da API: {str(e)}")
+            raise
+    
+    async def aextract(self) -> Dict[str, Any]:
+        """
+        Extrai dados da API sem bloquear o event loop.
         
+        Returns:
+            Dados retornados pela API
+        """
         self.logger.info(f"Extraindo dados da API: {self.url} ({self.method})")
         try:
-            response = requests.request(
+            response = await _get_async_http_client(self.url).request(
                 method=self.method,
                 url=self.url,
                 headers=self.headers,
                 params=self.params,
-                json=self.json_body
+                json=self.json_body,
+                timeout=self.timeout
             )
             response.raise_for_status()  # Raise exception for 4xx/5xx responses
             data = response.json()
@@ -538,11 +1377,158 @@ class APIExtractor(Extractor[Dict[str, Any]]):
             self.logger.error(f"Erro ao extrair dados da API: {str(e)}")
             raise
 
+class BatchingAPIExtractor:
+    """
+    Agrupa requisições a uma API em lotes enviados em uma única chamada.
+    
+    Requisições feitas dentro de uma janela curta (ou até completar o lote)
+    são enviadas em um único POST cujo corpo é a lista de parâmetros; a API
+    deve responder com uma lista de resultados na mesma ordem.
+    """
+    
+    _logger = get_logger("extractor.batch_api")
+    
+    def __init__(self, url: str, batch_size: int = 50, flush_interval_ms: int = 10,
+                 headers: Optional[Dict[str, str]] = None, timeout: float = 30.0):
+        """
+        Inicializa o extrator.
+        
+        Args:
+            url: URL do endpoint de lote da API
+            batch_size: Número máximo de requisições por lote
+            flush_interval_ms: Tempo máximo de espera para completar um lote
+            headers: Cabeçalhos HTTP (opcional)
+            timeout: Timeout das requisições em segundos
+        """
+        self.url = url
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.logger = self._logger.with_context(target=url)
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+    
+    async def fetch(self, params: Dict[str, Any]) -> Any:
+        """
+        Adiciona uma requisição ao lote atual e aguarda seu resultado.
+        
+        Args:
+            params: Parâmetros da requisição
+            
+        Returns:
+            Resultado correspondente a estes parâmetros
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((params, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_interval_ms / 1000, self._flush)
+        return await future
+    
+    def for_params(self, params: Dict[str, Any]) -> 'BatchedRequestExtractor':
+        """
+        Cria um extrator para uma requisição deste lote.
+        
+        Args:
+            params: Parâmetros da requisição
+            
+        Returns:
+            Extrator que pode ser usado em add_parallel_extractors
+        """
+        return BatchedRequestExtractor(self, params)
+    
+    def _flush(self) -> None:
+        """
+        Envia o lote pendente em segundo plano.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, batch: List[tuple]) -> None:
+        """
+        Envia um lote e distribui as respostas entre as requisições.
+        
+        Args:
+            batch: Lista de (parâmetros, future)
+        """
+        self.logger.info(f"Enviando lote de {len(batch)} requisições para a API: {self.url}")
+        try:
+            response = await _get_async_http_client(self.url).post(
+                self.url,
+                headers=self.headers,
+                json=[params for params, _ in batch],
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            results = response.json()
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise ValueError(f"Resposta do lote deveria ser uma lista com {len(batch)} itens")
+        except Exception as e:
+            self.logger.error(f"Erro ao enviar lote para a API: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+class BatchedRequestExtractor(Extractor[Any]):
+    """
+    Extrai o resultado de uma requisição agrupada por um BatchingAPIExtractor.
+    """
+    
+    def __init__(self, batcher: BatchingAPIExtractor, params: Dict[str, Any]):
+        """
+        Inicializa o extrator.
+        
+        Args:
+            batcher: Extrator responsável pelos lotes
+            params: Parâmetros da requisição
+        """
+        self.batcher = batcher
+        self.params = params
+    
+    def extract(self) -> Any:
+        """
+        Não suportado: fora de um event loop não há outras requisições com
+        as quais formar um lote.
+        
+        Raises:
+            RuntimeError: Sempre; use aextract ou Pipeline.aexecute
+        """
+        raise RuntimeError(
+            "BatchedRequestExtractor só agrupa requisições em um event loop: "
+            "use aextract() ou Pipeline.aexecute()"
+        )
+    
+    async def aextract(self) -> Any:
+        """
+        Extrai os dados aguardando o lote em que a requisição foi incluída.
+        
+        Returns:
+            Resultado da requisição
+        """
+        return await self.batcher.fetch(self.params)
+
 class WebScrapingExtractor(Extractor[Dict[str, Any]]):
     """
     Extrai dados de páginas web via web scraping.
     """
     
+    _logger = get_logger("extractor.scraping")
+    
     def __init__(self, url: str, scraping_function: Callable[[str], Dict[str, Any]]):
         """
         Inicializa o extrator.
@@ -553,7 +1539,7 @@ class WebScrapingExtractor(Extractor[Dict[str, Any]]):
         """
         self.url = url
         self.scraping_function = scraping_function
-        self.logger = get_logger(f"extractor.scraping.{url}")
+        self.logger = self._logger.with_context(target=url)
     
     def extract(self) -> Dict[str, Any]:
         """
@@ -584,6 +1570,8 @@ class DataFrameToCSVLoader(Loader[pd.DataFrame]):
     Carrega um DataFrame em um arquivo CSV.
     """
     
+    _logger = get_logger("loader.csv")
+    
     def __init__(self, file_path: str, **to_csv_kwargs):
         """
         Inicializa o loader.
@@ -594,7 +1582,7 @@ class DataFrameToCSVLoader(Loader[pd.DataFrame]):
         """
         self.file_path = file_path
         self.to_csv_kwargs = to_csv_kwargs
-        self.logger = get_logger(f"loader.csv.{file_path}")
+        self.logger = self._logger.with_context(target=file_path)
     
     def load(self, data: pd.DataFrame) -> str:
         """
@@ -615,11 +1603,107 @@ class DataFrameToCSVLoader(Loader[pd.DataFrame]):
             self.logger.error(f"Erro ao salvar CSV: {str(e)}")
             raise
 
+class DataFrameToParquetLoader(Loader[pd.DataFrame]):
+    """
+    Carrega um DataFrame em um arquivo Parquet (exige pyarrow).
+    """
+    
+    _logger = get_logger("loader.parquet")
+    
+    def __init__(self, file_path: str, compression: str = "snappy", **to_parquet_kwargs):
+        """
+        Inicializa o loader.
+        
+        Args:
+            file_path: Caminho para o arquivo Parquet
+            compression: Compressão do Parquet
+            **to_parquet_kwargs: Argumentos para DataFrame.to_parquet
+        """
+        self.file_path = file_path
+        self.to_parquet_kwargs = to_parquet_kwargs
+        self.to_parquet_kwargs.setdefault("compression", compression)
+        self.logger = self._logger.with_context(target=file_path)
+    
+    def load(self, data: pd.DataFrame) -> str:
+        """
+        Carrega o DataFrame em um arquivo Parquet.
+        
+        Args:
+            data: DataFrame a ser salvo
+            
+        Returns:
+            Caminho do arquivo salvo
+        """
+        self.logger.info(f"Salvando DataFrame em Parquet: {self.file_path}")
+        try:
+            data.to_parquet(self.file_path, **self.to_parquet_kwargs)
+            self.logger.info(f"Dados salvos com sucesso: {len(data)} linhas")
+            return self.file_path
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar Parquet: {str(e)}")
+            raise
+
+class DictToCSVLoader(Loader[Iterable[Dict[str, Any]]]):
+    """
+    Carrega linhas (dicionários) em um arquivo CSV à medida que são produzidas.
+    
+    Complementa CSVRowExtractor: as linhas são escritas uma a uma, sem
+    montar um DataFrame; as colunas são as chaves da primeira linha.
+    """
+    
+    _logger = get_logger("loader.csv_rows")
+    
+    def __init__(self, file_path: str, encoding: str = "utf-8", buffering: int = 1 << 20):
+        """
+        Inicializa o loader.
+        
+        Args:
+            file_path: Caminho para o arquivo CSV
+            encoding: Codificação do arquivo
+            buffering: Tamanho do buffer de escrita em bytes
+        """
+        self.file_path = file_path
+        self.encoding = encoding
+        self.buffering = buffering
+        self.logger = self._logger.with_context(target=file_path)
+    
+    def load(self, data: Iterable[Dict[str, Any]]) -> str:
+        """
+        Escreve as linhas no arquivo CSV.
+        
+        Args:
+            data: Linhas a serem salvas
+            
+        Returns:
+            Caminho do arquivo salvo
+        """
+        self.logger.info(f"Salvando linhas em CSV: {self.file_path}")
+        rows = iter(data)
+        count = 0
+        try:
+            with open(self.file_path, "w", newline="", encoding=self.encoding, buffering=self.buffering) as f:
+                first = next(rows, None)
+                if first is not None:
+                    writer = csv.DictWriter(f, fieldnames=list(first))
+                    writer.writeheader()
+                    writer.writerow(first)
+                    count = 1
+                    for row in rows:
+                        writer.writerow(row)
+                        count += 1
+            self.logger.info(f"Dados salvos com sucesso: {count} linhas")
+            return self.file_path
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar CSV: {str(e)}")
+            raise
+
 class JsonFileLoader(Loader[Dict[str, Any]]):
     """
     Carrega um dicionário em um arquivo JSON.
     """
     
+    _logger = get_logger("loader.json")
+    
     def __init__(self, file_path: str, indent: int = 2):
         """
         Inicializa o loader.
@@ -630,7 +1714,7 @@ class JsonFileLoader(Loader[Dict[str, Any]]):
         """
         self.file_path = file_path
         self.indent = indent
-        self.logger = get_logger(f"loader.json.{file_path}")
+        self.logger = self._logger.with_context(target=file_path)
     
     def load(self, data: Dict[str, Any]) -> str:
         """
@@ -644,24 +1728,55 @@ class JsonFileLoader(Loader[Dict[str, Any]]):
         """
         self.logger.info(f"Salvando dados em JSON: {self.file_path}")
         try:
-            import json
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=self.indent)
+            # orjson só indenta com 2 espaços; outras indentações usam o json padrão
+            if orjson is not None and self.indent in (None, 0, 2):
+                option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if self.indent else 0)
+                content = orjson.dumps(data, option=option)
+            else:
+                content = json.dumps(data, indent=self.indent).encode('utf-8')
+            with open(self.file_path, 'wb') as f:
+                f.write(content)
             self.logger.info(f"Dados salvos com sucesso")
             return self.file_path
         except Exception as e:
             self.logger.error(f"Erro ao salvar JSON: {str(e)}")
             raise
 
+# Event loop compartilhado para providers de cache apenas assíncronos; criado
+# uma única vez por processo, em uma thread daemon
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Obtém o event loop de fundo, iniciando-o na primeira chamada.
+    
+    Returns:
+        Event loop executando em uma thread daemon
+    """
+    global _background_loop
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="pipeline-cache-loop", daemon=True).start()
+                _background_loop = loop
+    return _background_loop
+
 class CacheLoader(Loader[Any]):
     """
     Carrega dados no sistema de cache.
     """
     
-    # Class-level cache dictionary as a fallback
-    _local_cache = {}
+    _logger = get_logger("loader.cache")
     
-    def __init__(self, key: str, ttl_seconds: int = 3600, tags: Optional[List[str]] = None):
+    # Cache local usado como fallback: {chave: (dados, expiração)}, em ordem
+    # de inserção e limitado a _local_cache_maxsize entradas
+    _local_cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+    _local_cache_maxsize = 4096
+    
+    def __init__(self, key: str, ttl_seconds: int = 3600, tags: Optional[List[str]] = None,
+                 provider: Optional[str] = None):
         """
         Inicializa o loader.
         
@@ -669,17 +1784,99 @@ class CacheLoader(Loader[Any]):
             key: Chave para o cache
             ttl_seconds: Tempo de vida em segundos
             tags: Tags para categorizar o cache (opcional)
+            provider: Nome do provider de cache (None = padrão da CacheFactory)
         """
         self.key = key
         self.ttl_seconds = ttl_seconds
         self.tags = tags or []
-        self.logger = get_logger(f"loader.cache.{key}")
+        self.provider = provider
+        self.logger = self._logger.with_context(target=key)
+    
+    def load(self, data: Any) -> bool:
+        """
+        Carrega os dados no cache.
+        
+        Providers com métodos síncronos (set_sync/set_with_tags_sync) são
+        chamados diretamente; os demais rodam no event loop de fundo.
+        
+        Args:
+            data: Dados a serem armazenados
+            
+        Returns:
+            True se os dados foram armazenados no provider, False se foi
+            usado o cache local
+        """
+        self.logger.info(f"Salvando dados no cache: {self.key}")
+        try:
+            cache = CacheFactory.get_instance().get_provider(self.provider)
+            if self.tags and hasattr(cache, "set_with_tags_sync"):
+                cache.set_with_tags_sync(self.key, data, self.tags, self.ttl_seconds)
+            elif not self.tags and hasattr(cache, "set_sync"):
+                cache.set_sync(self.key, data, self.ttl_seconds)
+            else:
+                if self.tags:
+                    coro = cache.set_with_tags(self.key, data, self.tags, self.ttl_seconds)
+                else:
+                    coro = cache.set(self.key, data, self.ttl_seconds)
+                asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+            self.logger.info(f"Dados salvos no cache com TTL: {self.ttl_seconds}s")
+            return True
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar no cache, usando cache local: {str(e)}")
+            self._store_local(self.key, data, self.ttl_seconds)
+            return False
+    
+    @classmethod
+    def _store_local(cls, key: str, data: Any, ttl_seconds: int) -> None:
+        """
+        Armazena dados no cache local, descartando entradas antigas.
+        
+        Args:
+            key: Chave para o cache
+            data: Dados a serem armazenados
+            ttl_seconds: Tempo de vida em segundos
+        """
+        now = time.time()
+        cache = cls._local_cache
+        cache[key] = (data, now + ttl_seconds)
+        cache.move_to_end(key)
+        
+        # Remover entradas expiradas do início e, se ainda acima do limite,
+        # as mais antigas
+        while cache:
+            oldest_key, (_, expiry) = next(iter(cache.items()))
+            if expiry > now and len(cache) <= cls._local_cache_maxsize:
+                break
+            del cache[oldest_key]
+    
+    @classmethod
+    def get_local(cls, key: str) -> Optional[Any]:
+        """
+        Obtém dados do cache local.
+        
+        Args:
+            key: Chave do cache
+            
+        Returns:
+            Dados armazenados ou None se ausentes ou expirados
+        """
+        entry = cls._local_cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            cls._local_cache.pop(key, None)
+            return None
+        return entry[0]
 
 class ModelLoader(Loader[Dict[str, Any]]):
     """
     Carrega dados em um modelo Pydantic.
+    
+    O validador do modelo é compilado uma única vez, na criação do loader.
     """
     
+    _logger = get_logger("loader.model")
+    
     def __init__(self, model_class: type):
         """
         Inicializa o loader.
@@ -688,7 +1885,9 @@ class ModelLoader(Loader[Dict[str, Any]]):
             model_class: Classe do modelo Pydantic
         """
         self.model_class = model_class
-        self.logger = get_logger(f"loader.model.{model_class.__name__}")
+        self._validator = TypeAdapter(model_class)
+        self._list_validator: Optional[TypeAdapter] = None
+        self.logger = self._logger.with_context(target=model_class.__name__)
     
     def load(self, data: Dict[str, Any]) -> BaseModel:
         """
@@ -702,9 +1901,30 @@ class ModelLoader(Loader[Dict[str, Any]]):
         """
         self.logger.info(f"Carregando dados no modelo {self.model_class.__name__}")
         try:
-            model = self.model_class(**data)
+            model = self._validator.validate_python(data)
             self.logger.info(f"Dados carregados com sucesso no modelo")
             return model
         except Exception as e:
             self.logger.error(f"Erro ao carregar dados no modelo: {str(e)}")
             raise
+    
+    def load_many(self, data: List[Dict[str, Any]]) -> List[BaseModel]:
+        """
+        Carrega uma lista de registros no modelo em uma única validação.
+        
+        Args:
+            data: Lista de dados a serem carregados
+            
+        Returns:
+            Lista de instâncias do modelo
+        """
+        self.logger.info(f"Carregando {len(data)} registros no modelo {self.model_class.__name__}")
+        try:
+            if self._list_validator is None:
+                self._list_validator = TypeAdapter(List[self.model_class])
+            models = self._list_validator.validate_python(data)
+            self.logger.info(f"Dados carregados com sucesso no modelo")
+            return models
+        except Exception as e:
+            self.logger.error(f"Erro ao carregar dados no modelo: {str(e)}")
+            raise
@@ -5,19 +5,14 @@ Simplifica a criação de pipelines ETL para os diferentes tipos de dados
 da API, reutilizando componentes e configurações comuns.
 """
 from typing import Dict, Any, List, Optional, Type, Union, Callable
-import pandas as pd
 import os
+import time
 
 from app.core.pipeline import (
     Pipeline, Extractor, Transformer, Loader, 
     CSVExtractor, JsonExtractor, APIExtractor, WebScrapingExtractor,
     DataFrameToCSVLoader, JsonFileLoader, ModelLoader
 )
-from app.transform.viticulture import (
-    ProductionDataTransformer, ImportExportTransformer, 
-    ProcessingTransformer, CommercializationTransformer,
-    DataFrameToDictTransformer
-)
 from app.core.logging import get_logger
 import app.core.cache as cache_module  # Import the entire module instead
 
@@ -27,12 +22,19 @@ logger = get_logger(__name__)
 class ConcreteCacheLoader(Loader[Any]):
     """
     Loader for saving data to cache.
+    
+    The global CACHE dict has no tag index, so tags are only kept for
+    compatibility with existing callers and are not used by load().
     """
+    _logger = get_logger("loader.cache")
+    
     def __init__(self, key: str, ttl_seconds: int = 3600, tags: Optional[List[str]] = None):
         self.key = key
         self.ttl_seconds = ttl_seconds
         self.tags = tags or []
-        self.logger = get_logger(f"loader.cache.{key}")
+        self.logger = self._logger.with_context(target=key)
+        # Referência direta ao dicionário global (limpo no lugar por clear_cache)
+        self._cache = cache_module.CACHE
         
     def load(self, data: Any) -> bool:
         """
@@ -47,14 +49,12 @@ class ConcreteCacheLoader(Loader[Any]):
         self.logger.info(f"Saving data to cache: {self.key}")
         
         try:
-            # Direct access to the global cache dictionary
-            from datetime import datetime, timedelta
-            
-            # Calculate expiry time
-            expiry_time = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
+            # Calculate expiry time as integer nanoseconds (monotonic clock,
+            # immune to wall-clock jumps; readers compare plain ints)
+            expiry_ns = time.monotonic_ns() + self.ttl_seconds * 1_000_000_000
             
-            # Store in the cache
-            cache_module.CACHE[self.key] = (data, expiry_time)
+            # Store in the global cache dictionary
+            self._cache[self.key] = (data, expiry_ns)
             
             self.logger.info(f"Data successfully cached with TTL: {self.ttl_seconds}s")
             return True
@@ -63,6 +63,30 @@ class ConcreteCacheLoader(Loader[Any]):
             self.logger.error(f"Failed to cache data: {str(e)}")
             return False
 
+class ScraperExtractor(Extractor[Dict[str, Any]]):
+    """
+    Extrator que usa um método de um scraper existente para obter dados.
+    """
+    _logger = get_logger("extractor.scraper")
+    
+    def __init__(self, scraper: Any, method_name: str, **kwargs):
+        self.scraper = scraper
+        self.method_name = method_name
+        self.kwargs = kwargs
+        # Método resolvido uma única vez, e não a cada extração
+        self._method = getattr(scraper, method_name)
+        self.logger = self._logger.with_context(target=method_name)
+    
+    def extract(self) -> Dict[str, Any]:
+        self.logger.info(f"Extraindo dados com scraper: {self.method_name}")
+        try:
+            data = self._method(**self.kwargs)
+            self.logger.info(f"Dados extraídos com sucesso")
+            return data
+        except Exception as e:
+            self.logger.error(f"Erro ao extrair com scraper: {str(e)}")
+            raise
+
 class ETLPipelineFactory:
     """
     Fábrica para criar pipelines ETL para diferentes tipos de dados.
@@ -97,48 +121,32 @@ class ETLPipelineFactory:
         Returns:
             Pipeline configurado
         """
-        # Criar o pipeline
-        pipeline = Pipeline(name=name)
-        
-        # Adicionar extrator CSV
-        pipeline.add_extractor(CSVExtractor(csv_path, **csv_kwargs))
+        # Importados aqui para não carregar os transformadores na importação do módulo
+        from app.transform.viticulture import ImportExportTransformer, DataFrameToDictTransformer
         
-        # Adicionar transformador de dados específico
-        transformer_kwargs = {}
-        if ano_filtro is not None:
-            transformer_kwargs["ano_filtro"] = ano_filtro
+        # Transformador de dados específico (todos aceitam ano_filtro=None)
+        transformer_kwargs = {"ano_filtro": ano_filtro}
         if pais_filtro is not None and transformer_class == ImportExportTransformer:
             transformer_kwargs["pais_filtro"] = pais_filtro
-            
-        pipeline.add_transformer(transformer_class(**transformer_kwargs))
         
-        # Adicionar transformador para o formato de API
-        df_to_dict_kwargs = {
-            "source": "csv",
-            "ano_filtro": ano_filtro,
-            "include_source_url": source_url is not None,
-            "source_url": source_url
-        }
-        if pais_filtro is not None:
-            df_to_dict_kwargs["pais_filtro"] = pais_filtro
-            
-        pipeline.add_transformer(DataFrameToDictTransformer(**df_to_dict_kwargs))
-        
-        # Adicionar cache se necessário
-        if cache_key:
-            tags = [name]
-            if ano_filtro:
-                tags.append(f"ano:{ano_filtro}")
-            if pais_filtro:
-                tags.append(f"pais:{pais_filtro}")
-                
-            pipeline.add_loader(ConcreteCacheLoader(
-                key=cache_key,
-                ttl_seconds=cache_ttl,
-                tags=tags
-            ))
-        
-        return pipeline
+        # Criar o pipeline com todos os passos de uma vez
+        return Pipeline.from_steps(
+            name,
+            extractors=(CSVExtractor(csv_path, **csv_kwargs),),
+            transformers=(
+                transformer_class(**transformer_kwargs),
+                # Transformador para o formato de API
+                DataFrameToDictTransformer(
+                    source="csv",
+                    ano_filtro=ano_filtro,
+                    pais_filtro=pais_filtro,
+                    include_source_url=source_url is not None,
+                    source_url=source_url
+                ),
+            ),
+            # Cache se necessário
+            loaders=(ConcreteCacheLoader(key=cache_key, ttl_seconds=cache_ttl),) if cache_key else ()
+        )
     
     @staticmethod
     def create_scraper_to_api_pipeline(
@@ -165,56 +173,23 @@ class ETLPipelineFactory:
         Returns:
             Pipeline configurado
         """
-        # Criar um extrator customizado que usa o scraper
-        class ScraperExtractor(Extractor[Dict[str, Any]]):
-            def __init__(self, scraper, method_name, **kwargs):
-                self.scraper = scraper
-                self.method_name = method_name
-                self.kwargs = kwargs
-                self.logger = get_logger(f"extractor.scraper.{method_name}")
-            
-            def extract(self) -> Dict[str, Any]:
-                self.logger.info(f"Extraindo dados com scraper: {self.method_name}")
-                try:
-                    method = getattr(self.scraper, self.method_name)
-                    data = method(**self.kwargs)
-                    self.logger.info(f"Dados extraídos com sucesso")
-                    return data
-                except Exception as e:
-                    self.logger.error(f"Erro ao extrair com scraper: {str(e)}")
-                    raise
-        
-        # Criar o pipeline
-        pipeline = Pipeline(name=name)
-        
-        # Adicionar extrator de scraper
-        scraper_kwargs = {}
-        if ano_filtro is not None:
-            scraper_kwargs["year"] = ano_filtro
+        # Extrator de scraper (os métodos aceitam year=None, mas nem todos
+        # aceitam country)
+        scraper_kwargs = {"year": ano_filtro}
         if pais_filtro is not None:
             scraper_kwargs["country"] = pais_filtro
-            
-        pipeline.add_extractor(ScraperExtractor(
-            scraper=scraper_instance,
-            method_name=scraper_method_name,
-            **scraper_kwargs
-        ))
-        
-        # Adicionar cache se necessário
-        if cache_key:
-            tags = [name]
-            if ano_filtro:
-                tags.append(f"ano:{ano_filtro}")
-            if pais_filtro:
-                tags.append(f"pais:{pais_filtro}")
-                
-            pipeline.add_loader(ConcreteCacheLoader(
-                key=cache_key,
-                ttl_seconds=cache_ttl,
-                tags=tags
-            ))
         
-        return pipeline
+        # Criar o pipeline com todos os passos de uma vez
+        return Pipeline.from_steps(
+            name,
+            extractors=(ScraperExtractor(
+                scraper=scraper_instance,
+                method_name=scraper_method_name,
+                **scraper_kwargs
+            ),),
+            # Cache se necessário
+            loaders=(ConcreteCacheLoader(key=cache_key, ttl_seconds=cache_ttl),) if cache_key else ()
+        )
     
     @staticmethod
     def create_api_to_model_pipeline(
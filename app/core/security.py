@@ -1,10 +1,16 @@
-from datetime import datetime, timedelta
-from jose import JWTError, jwt
+from collections import OrderedDict
+from datetime import timedelta
+from functools import partial
+import jwt
+from jwt.exceptions import InvalidTokenError
 from passlib.context import CryptContext
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+from typing import Optional, Tuple
+from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 import logging
+import math
+import threading
+import time
 
 from app.core.config import settings
 
@@ -29,23 +35,119 @@ http_bearer = HTTPBearer(
 # Manter OAuth2PasswordBearer como referência, mas não usar no Swagger UI
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/token")
 
+# Cabeçalho das respostas 401. As exceções são criadas apenas quando levantadas:
+# reutilizar a mesma instância acumularia tracebacks e contexto entre requisições
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+def _credentials_exception() -> HTTPException:
+    """
+    Cria a exceção de credenciais inválidas.
+    
+    Returns:
+        HTTPException 401 com o desafio Bearer
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Credenciais inválidas",
+        headers=_BEARER_CHALLENGE,
+    )
+
+# Chave e algoritmo são fixos durante a vida do processo: o encoder já os
+# traz ligados, e a validade padrão dos tokens é de 15 minutos (em segundos)
+_jwt_encode = partial(jwt.encode, key=settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+_DEFAULT_TTL = 900
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
-    to_encode.update({"exp": expire})
+    # "exp" em segundos epoch, calculado sem passar por datetime
+    to_encode["exp"] = int(time.time()) + (int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_TTL)
     # Cada token gerado tem um valor único devido ao timestamp e dados específicos
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return _jwt_encode(to_encode)
+
+def _decode(token: str) -> dict:
+    """
+    Verifica a assinatura e a expiração de um token JWT.
+    
+    Args:
+        token: Token JWT
+        
+    Returns:
+        Payload do token
+        
+    Raises:
+        InvalidTokenError: Se o token for inválido ou estiver expirado
+    """
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+# Tokens já verificados: {token: (usuário, expiração em epoch)}, em ordem LRU
+_TOKEN_CACHE: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+_TOKEN_CACHE_MAXSIZE = 4096
+_token_cache_lock = threading.Lock()
+
+def _decode_cached(token: str) -> Tuple[Optional[str], float]:
+    """
+    Decodifica um token JWT, reaproveitando verificações anteriores.
+    
+    A assinatura só é verificada na primeira vez em que o token é visto;
+    depois disso, enquanto o token não expirar, basta uma consulta ao cache.
+    
+    Args:
+        token: Token JWT
+        
+    Returns:
+        Tupla (usuário do campo "sub", expiração em epoch)
+        
+    Raises:
+        InvalidTokenError: Se o token for inválido ou estiver expirado
+    """
+    with _token_cache_lock:
+        entry = _TOKEN_CACHE.get(token)
+        if entry is not None:
+            if entry[1] > time.time():
+                _TOKEN_CACHE.move_to_end(token)
+                return entry
+            # Expirado: remover e deixar o decode abaixo gerar o erro
+            del _TOKEN_CACHE[token]
+    
+    payload = _decode(token)
+    username = payload.get("sub")
+    exp = payload.get("exp")
+    entry = (username, float(exp) if exp is not None else math.inf)
+    
+    # Tokens sem usuário não são cacheados (são rejeitados por quem chama)
+    if username is not None:
+        with _token_cache_lock:
+            _TOKEN_CACHE[token] = entry
+            if len(_TOKEN_CACHE) > _TOKEN_CACHE_MAXSIZE:
+                _TOKEN_CACHE.popitem(last=False)
+    return entry
+
+def _username_from_token(token: str) -> str:
+    """
+    Obtém o usuário de um token, convertendo falhas em HTTP 401.
+    
+    Args:
+        token: Token JWT
+        
+    Returns:
+        Usuário do campo "sub"
+        
+    Raises:
+        HTTPException: 401 se o token for inválido, expirado ou sem "sub"
+    """
+    try:
+        username, _ = _decode_cached(token)
+    except InvalidTokenError as e:
+        logger.error(f"Erro ao verificar token JWT: {str(e)}")
+        raise _credentials_exception()
+    if username is None:
+        logger.error("Token inválido: 'sub' ausente no payload")
+        raise _credentials_exception()
+    return str(username)
 
 # Função principal para verificação de token usando HTTPBearer
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(http_bearer)):
+def verify_token(credentials: HTTPAuthorizationCredentials = Security(http_bearer)):
     """Verifica o token de autenticação"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Credenciais inválidas",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     # Se não recebeu credenciais, retorna erro imediatamente
     if not credentials:
         logger.error("Nenhum token de autenticação fornecido")
@@ -54,46 +156,21 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(http_bearer
             detail="Não autenticado"
         )
     
-    try:
-        # Remover a referência específica ao year=2022
-        logger.info(f"Verificando token: {credentials.credentials[:10]}...")
-        
-        payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
-        username = payload.get("sub")
-        if username is None:
-            logger.error("Token inválido: 'sub' ausente no payload")
-            raise credentials_exception
-            
-        logger.info(f"Token válido para usuário: {username}")
-        return str(username)
-    except JWTError as e:
-        logger.error(f"Erro ao verificar token JWT: {str(e)}")
-        raise credentials_exception
-    except Exception as e:
-        # Adicionar captura genérica para registrar todos os erros possíveis
-        logger.error(f"Erro não esperado na verificação do token: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Erro no processamento da autenticação: {str(e)}"
-        )
+    # Erros inesperados não são capturados aqui: o handler global de
+    # exceções (app.main) registra e responde com 500
+    
+    # Logs do caminho feliz só em DEBUG; o prefixo do token só é fatiado se for registrado
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Verificando token: %s...", credentials.credentials[:10])
+    
+    username = _username_from_token(credentials.credentials)
+    
+    if debug:
+        logger.debug("Token válido para usuário: %s", username)
+    return username
 
 # Função de fallback que usa OAuth2PasswordBearer (manter para compatibilidade)
 def verify_oauth2_token(token: str = Depends(oauth2_scheme)):
     """Verificação de token usando OAuth2PasswordBearer (função legada)"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Credenciais inválidas",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        return str(username)
-    except JWTError:
-        raise credentials_exception
+    return _username_from_token(token)
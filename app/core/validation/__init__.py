@@ -2,89 +2,121 @@
 Sistema de validação de dados.
 
 Fornece interfaces e implementações para validação de dados.
-"""
-from app.core.validation.interface import (
-    ValidationSeverity,
-    ValidationIssue,
-    ValidationResult,
-    Validator,
-    Normalizer,
-    ValidatingTransformer,
-    validate_common
-)
-
-from app.core.validation.validators import (
-    StringValidator,
-    NumericValidator,
-    DateValidator,
-    DictValidator,
-    ListValidator,
-    DataFrameValidator
-)
-
-from app.core.validation.normalizer import (
-    StringNormalizer,
-    NumericNormalizer,
-    DateNormalizer,
-    DictNormalizer,
-    DataFrameColumnNormalizer
-)
 
-from app.core.validation.reporter import (
-    ValidationReporter,
-    DataQualityMonitor
-)
-
-from app.core.validation.pipeline import (
-    ValidatingPipelineTransformer,
-    NormalizingPipelineTransformer,
-    ValidatingDataFrameTransformer,
-    NormalizingDataFrameTransformer,
-    ValidationPipelineFactory
-)
+Os nomes exportados são carregados sob demanda (PEP 562): importar um
+validador carrega apenas o submódulo que o define.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from app.core.validation.schema import (
-    ValidationSchemas,
-    create_validator_from_schema
-)
+if TYPE_CHECKING:
+    from app.core.validation.interface import (
+        ValidationSeverity,
+        ValidationIssue,
+        ValidationResult,
+        Validator,
+        MemoizedValidator,
+        Normalizer,
+        ValidatingTransformer,
+        validate_common
+    )
+    from app.core.validation.validators import (
+        StringValidator,
+        NumericValidator,
+        DateValidator,
+        DictValidator,
+        ListValidator,
+        DataFrameValidator
+    )
+    from app.core.validation.vectorized import VectorizedDataFrameValidator
+    from app.core.validation.normalizer import (
+        StringNormalizer,
+        NumericNormalizer,
+        DateNormalizer,
+        DictNormalizer,
+        DataFrameColumnNormalizer
+    )
+    from app.core.validation.reporter import (
+        ValidationReporter,
+        DataQualityMonitor
+    )
+    from app.core.validation.pipeline import (
+        ValidatingPipelineTransformer,
+        NormalizingPipelineTransformer,
+        ValidatingDataFrameTransformer,
+        NormalizingDataFrameTransformer,
+        ValidationPipelineFactory
+    )
+    from app.core.validation.schema import (
+        ValidationSchemas,
+        create_validator_from_schema
+    )
 
-__all__ = [
+# Submódulo que define cada nome exportado
+_SUBMODULES = {
     # Interfaces
-    'ValidationSeverity',
-    'ValidationIssue',
-    'ValidationResult',
-    'Validator',
-    'Normalizer',
-    'ValidatingTransformer',
-    'validate_common',  # Adicionar a nova função utilitária
+    'ValidationSeverity': 'interface',
+    'ValidationIssue': 'interface',
+    'ValidationResult': 'interface',
+    'Validator': 'interface',
+    'MemoizedValidator': 'interface',
+    'Normalizer': 'interface',
+    'ValidatingTransformer': 'interface',
+    'validate_common': 'interface',  # Adicionar a nova função utilitária
     
     # Validators
-    'StringValidator',
-    'NumericValidator',
-    'DateValidator',
-    'DictValidator',
-    'ListValidator',
-    'DataFrameValidator',
+    'StringValidator': 'validators',
+    'NumericValidator': 'validators',
+    'DateValidator': 'validators',
+    'DictValidator': 'validators',
+    'ListValidator': 'validators',
+    'DataFrameValidator': 'validators',
+    'VectorizedDataFrameValidator': 'vectorized',
     
     # Normalizers
-    'StringNormalizer',
-    'NumericNormalizer',
-    'DateNormalizer',
-    'DictNormalizer',
-    'DataFrameColumnNormalizer',
+    'StringNormalizer': 'normalizer',
+    'NumericNormalizer': 'normalizer',
+    'DateNormalizer': 'normalizer',
+    'DictNormalizer': 'normalizer',
+    'DataFrameColumnNormalizer': 'normalizer',
     
     # Reporters
-    'ValidationReporter',
-    'DataQualityMonitor',
+    'ValidationReporter': 'reporter',
+    'DataQualityMonitor': 'reporter',
     
     # Pipeline Integration
-    'ValidatingPipelineTransformer',
-    'NormalizingPipelineTransformer',
-    'ValidatingDataFrameTransformer',
-    'NormalizingDataFrameTransformer',
-    'ValidationPipelineFactory',
+    'ValidatingPipelineTransformer': 'pipeline',
+    'NormalizingPipelineTransformer': 'pipeline',
+    'ValidatingDataFrameTransformer': 'pipeline',
+    'NormalizingDataFrameTransformer': 'pipeline',
+    'ValidationPipelineFactory': 'pipeline',
     
     # Schema
-    'ValidationSchemas',
-    'create_validator_from_schema'
-]
+    'ValidationSchemas': 'schema',
+    'create_validator_from_schema': 'schema'
+}
+
+__all__ = tuple(_SUBMODULES)
+
+def __getattr__(name: str) -> Any:
+    """
+    Carrega um nome exportado a partir do seu submódulo.
+    
+    Args:
+        name: Nome do atributo
+        
+    Returns:
+        Objeto exportado, que fica guardado no módulo para os próximos acessos
+        
+    Raises:
+        AttributeError: Se o nome não for exportado pelo pacote
+    """
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
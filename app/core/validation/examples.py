@@ -3,11 +3,14 @@ Exemplos de uso do sistema de validação.
 
 Demonstra como utilizar os componentes de validação em conjunto com o pipeline.
 """
+from abc import abstractmethod
+
 import pandas as pd
 import numpy as np  # Import não utilizado diretamente
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Union  # Union não é utilizado
+from typing import Dict, Iterator, List, Any, Optional, Set, Union  # Union não é utilizado
 import os
+import re
 import logging
 
 # Configurar logging
@@ -22,6 +25,7 @@ from app.core.validation.validators import (
     DictValidator, ListValidator, StringValidator, NumericValidator,
     DateValidator, DataFrameValidator
 )
+from app.core.validation.vectorized import VectorizedDataFrameValidator
 from app.core.validation import (
     # Interfaces
     ValidationSeverity, ValidationIssue, ValidationResult, Validator,
@@ -40,10 +44,16 @@ from app.core.validation import (
 
 # Import necessary pipeline components
 from app.core.pipeline import (
-    DataFrameTransformer, CSVExtractor, DataFrameToCSVLoader
+    Transformer, DataFrameTransformer, CSVExtractor, DataFrameToCSVLoader,
+    DataFrameToParquetLoader, CSVRowExtractor, DictToCSVLoader
 )
 
 
+# Nome de vinho: letras (com acentos), espaços e hífens. Uma única classe de
+# caracteres, sem alternativas, ancorada com \A...\Z (rejeita "\n" final)
+NOME_VINHO_PATTERN = re.compile(r'\A[a-zA-ZáàâãéèêíóôõúçÁÀÂÃÉÈÍÓÔÕÚÇ\s\-]+\Z')
+
+
 def exemplo_validacao_dados_simples():
     """Exemplo simples de validação de dados."""
     # Criar um validador de strings
@@ -51,7 +61,7 @@ def exemplo_validacao_dados_simples():
         field_name="nome_vinho",
         min_length=3,
         max_length=50,
-        pattern=r'^[a-zA-ZáàâãéèêíóôõúçÁÀÂÃÉÈÍÓÔÕÚÇ\s\-]+$',
+        pattern=NOME_VINHO_PATTERN,
         required=True
     )
     
@@ -124,8 +134,8 @@ def exemplo_validacao_dataframe():
         'area_hectares': NumericValidator('area_hectares', min_value=1)
     }
     
-    # Criar validador de DataFrame
-    df_validator = DataFrameValidator(
+    # Criar validador de DataFrame (regras avaliadas sobre cada coluna inteira)
+    df_validator = VectorizedDataFrameValidator(
         field_name="dados_producao",
         column_validators=column_validators,
         min_rows=1
@@ -168,6 +178,179 @@ class LimpezaDadosTransformer(DataFrameTransformer):
         return data
 
 
+def _parse_number(value: Any) -> Any:
+    """Converte um número lido do CSV; vazio vira None e texto não numérico é mantido."""
+    if not isinstance(value, str):
+        return value
+    if value.strip() == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+class LimpezaLinhasTransformer(Transformer[Iterator[Dict[str, Any]], Iterator[Dict[str, Any]]]):
+    """
+    Row-by-row counterpart of LimpezaDadosTransformer, for streaming pipelines.
+    
+    Duplicates are detected with a set holding the values of each row
+    already seen. Missing prices are filled with the running mean of the prices read
+    so far, not the mean of the whole file, so that a single pass suffices.
+    """
+    
+    def __init__(self, price_column='preco'):
+        self.price_column = price_column
+    
+    def transform(self, data: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        return self._rows(data)
+    
+    def _rows(self, rows: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        seen: Set[tuple] = set()
+        count = 0
+        mean = 0.0
+        
+        for row in rows:
+            # Remove duplicate rows (the values themselves, so hash collisions
+            # between distinct rows do not drop any of them)
+            values = tuple(row.values())
+            if values in seen:
+                continue
+            seen.add(values)
+            
+            # Fill missing prices with the running mean (incremental update)
+            if self.price_column in row:
+                price = _parse_number(row[self.price_column])
+                if price is None:
+                    if count:
+                        row[self.price_column] = mean
+                elif isinstance(price, (int, float)):
+                    count += 1
+                    mean += (price - mean) / count
+            
+            yield row
+
+
+class _ReportingRowTransformer(Transformer[Iterator[Dict[str, Any]], Iterator[Dict[str, Any]]]):
+    """Base for streaming transformers that report issues once all rows were read."""
+    
+    def __init__(self, name: str, report_path: Optional[str] = None):
+        self.name = name
+        self.report_path = report_path
+        self.reporter = ValidationReporter(name)
+        self.logger = logging.getLogger(f"transformer.rows.{name}")
+    
+    def transform(self, data: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        return self._rows(data, ValidationResult())
+    
+    @abstractmethod
+    def _rows(self, rows: Iterator[Dict[str, Any]], result: ValidationResult) -> Iterator[Dict[str, Any]]:
+        """Yields the processed rows, recording the issues found in result."""
+    
+    def _report(self, result: ValidationResult) -> None:
+        # Issues are kept in memory; the rows themselves are not
+        if self.report_path:
+            self.reporter.to_json(result, self.report_path)
+        if result.has_issues():
+            self.logger.warning(f"Row processing found {len(result.issues)} issues")
+
+
+class ValidacaoLinhasTransformer(_ReportingRowTransformer):
+    """
+    Validates each row with the column validators, for streaming pipelines.
+    
+    Values of columns with a NumericValidator are converted from text before
+    validation (and kept converted in the row); empty values count as missing.
+    With fail_on_invalid, processing stops at the first invalid row.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        column_validators: Dict[str, Validator[Any]],
+        required_columns: Optional[List[str]] = None,
+        fail_on_invalid: bool = False,
+        report_path: Optional[str] = None
+    ):
+        super().__init__(name, report_path)
+        self.column_validators = column_validators
+        self.required_columns = required_columns or list(column_validators)
+        self.fail_on_invalid = fail_on_invalid
+        self.numeric_columns = {
+            col for col, validator in column_validators.items() if isinstance(validator, NumericValidator)
+        }
+    
+    def _rows(self, rows: Iterator[Dict[str, Any]], result: ValidationResult) -> Iterator[Dict[str, Any]]:
+        try:
+            for idx, row in enumerate(rows):
+                if idx == 0:
+                    missing_columns = [col for col in self.required_columns if col not in row]
+                    if missing_columns:
+                        result.add_issue(ValidationIssue(
+                            field=self.name,
+                            message=f"Colunas obrigatórias ausentes: {', '.join(missing_columns)}",
+                            severity=ValidationSeverity.ERROR,
+                            details={"missing_columns": missing_columns}
+                        ))
+                
+                for col, validator in self.column_validators.items():
+                    if col not in row:
+                        continue
+                    
+                    if col in self.numeric_columns:
+                        value = row[col] = _parse_number(row[col])
+                        if isinstance(value, str):
+                            result.add_issue(ValidationIssue(
+                                field=f"{self.name}[{idx}].{col}",
+                                message="Valor não numérico",
+                                severity=ValidationSeverity.ERROR,
+                                value=value
+                            ))
+                            continue
+                    else:
+                        value = row[col] if row[col] != "" else None
+                    
+                    for issue in validator.validate(value).issues:
+                        issue.field = f"{self.name}[{idx}].{col}"
+                        result.add_issue(issue)
+                
+                if self.fail_on_invalid and not result.is_valid:
+                    raise ValueError(f"Row validation failed with {len(result.issues)} issues")
+                
+                yield row
+        finally:
+            self._report(result)
+
+
+class NormalizacaoLinhasTransformer(_ReportingRowTransformer):
+    """Normalizes each row with the column normalizers, for streaming pipelines."""
+    
+    def __init__(
+        self,
+        name: str,
+        column_normalizers: Dict[str, Any],
+        report_path: Optional[str] = None
+    ):
+        super().__init__(name, report_path)
+        self.column_normalizers = column_normalizers
+    
+    def _rows(self, rows: Iterator[Dict[str, Any]], result: ValidationResult) -> Iterator[Dict[str, Any]]:
+        try:
+            for idx, row in enumerate(rows):
+                for col, normalizer in self.column_normalizers.items():
+                    if col in row:
+                        row[col], val_result = normalizer.normalize(row[col])
+                        for issue in val_result.issues:
+                            issue.field = f"{col}[{idx}]"
+                            result.add_issue(issue)
+                yield row
+        finally:
+            self._report(result)
+
+
 def create_wine_validators():
     """Create validators for wine data columns."""
     return {
@@ -191,9 +374,22 @@ def create_validation_pipeline(
     input_file="data/raw/vinhos.csv",
     output_file="data/processed/vinhos_validados.csv",
     report_dir="reports/validation",
-    fail_on_invalid=False
+    fail_on_invalid=False,
+    streaming=False
 ):
-    """Create a complete validation pipeline for wine data."""
+    """
+    Create a complete validation pipeline for wine data.
+    
+    With streaming=True the CSV is read and written row by row with the csv
+    module (no DataFrame), so memory use does not grow with the file size.
+    
+    For repeated runs, convert the input once with materialize_parquet and
+    pass the .parquet path: typed columnar files skip CSV parsing. An output
+    path ending in .parquet is written as Parquet (both need pyarrow).
+    """
+    if streaming:
+        return create_streaming_validation_pipeline(input_file, output_file, report_dir, fail_on_invalid)
+    
     # Create extractor
     extractor = CSVExtractor(input_file)
     
@@ -216,8 +412,11 @@ def create_validation_pipeline(
         report_dir=report_dir
     )
     
-    # Create loader
-    loader = DataFrameToCSVLoader(output_file)
+    # Create loader (format chosen by the output file extension)
+    if output_file.endswith(".parquet"):
+        loader = DataFrameToParquetLoader(output_file)
+    else:
+        loader = DataFrameToCSVLoader(output_file)
     
     # Build complete pipeline
     pipeline = Pipeline()
@@ -231,6 +430,41 @@ def create_validation_pipeline(
     return pipeline
 
 
+def create_streaming_validation_pipeline(
+    input_file="data/raw/vinhos.csv",
+    output_file="data/processed/vinhos_validados.csv",
+    report_dir="reports/validation",
+    fail_on_invalid=False
+):
+    """Create the row-by-row variant of the wine data validation pipeline."""
+    validation_report = normalization_report = None
+    if report_dir:
+        os.makedirs(report_dir, exist_ok=True)
+        validation_report = os.path.join(report_dir, "validacao_vinhos_rows_validation.json")
+        normalization_report = os.path.join(report_dir, "normalizacao_vinhos_rows_normalization.json")
+    
+    return Pipeline.from_steps(
+        "validacao_vinhos_streaming",
+        extractors=(CSVRowExtractor(input_file),),
+        transformers=(
+            LimpezaLinhasTransformer(),
+            ValidacaoLinhasTransformer(
+                name="validacao_vinhos",
+                column_validators=create_wine_validators(),
+                required_columns=['nome', 'tipo', 'safra', 'preco'],
+                fail_on_invalid=fail_on_invalid,
+                report_path=validation_report
+            ),
+            NormalizacaoLinhasTransformer(
+                name="normalizacao_vinhos",
+                column_normalizers=create_wine_normalizers(),
+                report_path=normalization_report
+            ),
+        ),
+        loaders=(DictToCSVLoader(output_file),)
+    )
+
+
 def exemplo_pipeline_com_validacao():
     """Exemplo de pipeline com validação integrada."""
     # Usar imports diretos já estão no topo do arquivo
@@ -10,11 +10,15 @@ Classes:
     ValidationIssue: Representa um problema encontrado na validação
     ValidationResult: Agrega os problemas encontrados durante uma validação
     Validator: Interface base para validadores
+    MemoizedValidator: Mixin que memoriza resultados de validação por valor
     Normalizer: Interface para normalizadores de dados
     ValidatingTransformer: Interface para transformadores com validação
 """
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
+import copy
+import hashlib
 from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
 
 # Tipos genéricos para dados de entrada/saída
@@ -36,6 +40,30 @@ class ValidationSeverity(Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
+@lru_cache(maxsize=4096)
+def _cached_code(field: str, message: str, severity: str, value: Optional[str]) -> str:
+    """
+    Gera o código de um problema de validação.
+    
+    Problemas idênticos (comuns em erros sistemáticos de uma coluna) têm o
+    hash calculado uma única vez e compartilham a mesma string de código.
+    
+    Args:
+        field: Nome do campo
+        message: Mensagem do problema
+        severity: Valor da severidade
+        value: Valor do problema convertido em string, ou None
+        
+    Returns:
+        Código alfanumérico único para o problema
+    """
+    # Usar um hash dos atributos para gerar um código único
+    base_string = f"{field}:{message}:{severity}"
+    if value is not None:
+        base_string += f":{value}"
+        
+    return f"VAL-{hashlib.md5(base_string.encode()).hexdigest()[:6]}"
+
 class ValidationIssue:
     """
     Representa um problema identificado durante validação.
@@ -75,9 +103,24 @@ class ValidationIssue:
         self.message = message
         self.severity = severity
         self.value = value
-        self.code = code or self._generate_code()
+        # Código informado; sem ele, o código só é gerado quando lido (ver code),
+        # mas a partir do campo original, já que os validadores compostos
+        # reescrevem field ao incorporar os problemas dos validadores internos
+        self._code = code
+        self._code_field = field
         self.details = details or {}
         
+    @property
+    def code(self) -> str:
+        """Código único do problema, gerado a partir dos atributos se não informado."""
+        if not self._code:
+            self._code = self._generate_code()
+        return self._code
+    
+    @code.setter
+    def code(self, value: Optional[str]) -> None:
+        self._code = value
+        
     def _generate_code(self) -> str:
         """
         Gera um código único para o problema baseado em seus atributos.
@@ -85,14 +128,12 @@ class ValidationIssue:
         Returns:
             Código alfanumérico único para o problema
         """
-        import hashlib
-        
-        # Usar um hash dos atributos para gerar um código único
-        base_string = f"{self.field}:{self.message}:{self.severity.value}"
-        if self.value is not None:
-            base_string += f":{str(self.value)}"
-            
-        return f"VAL-{hashlib.md5(base_string.encode()).hexdigest()[:6]}"
+        return _cached_code(
+            self._code_field,
+            self.message,
+            self.severity.value,
+            None if self.value is None else str(self.value)
+        )
         
     def __str__(self) -> str:
         """
@@ -299,6 +340,77 @@ class Validator(Generic[T], ABC):
         """
         pass
 
+class MemoizedValidator:
+    """
+    Mixin que memoriza os resultados de validate por valor validado.
+    
+    Deve preceder o validador na herança, por exemplo
+    ``class CachedStringValidator(MemoizedValidator, StringValidator)``.
+    Em colunas com poucos valores distintos (tipos, regiões, unidades), cada
+    valor repetido reaproveita o resultado já calculado. As regras do
+    validador não mudam: valores não hasheáveis (dict, list, DataFrame) são
+    sempre validados, e cada chamada recebe cópias dos problemas, que podem
+    ser alteradas sem afetar o cache.
+    
+    Example:
+        >>> class CachedNumericValidator(MemoizedValidator, NumericValidator):
+        ...     pass
+        >>> validator = CachedNumericValidator("safra", min_value=1900, cache_size=256)
+        >>> validator.validate(1850).is_valid
+        False
+    """
+    def __init__(self, *args: Any, cache_size: int = 1024, **kwargs: Any):
+        """
+        Inicializa o validador com um cache LRU próprio.
+        
+        Args:
+            *args: Argumentos do validador
+            cache_size: Número máximo de valores memorizados
+            **kwargs: Argumentos nomeados do validador
+        """
+        super().__init__(*args, **kwargs)
+        # typed=True: 1, 1.0 e True são validados separadamente
+        self._cached_validate = lru_cache(maxsize=cache_size, typed=True)(self._validate_uncached)
+    
+    def _validate_uncached(self, data: Any) -> ValidationResult:
+        """
+        Valida um valor com as regras do validador, sem cache.
+        
+        Args:
+            data: Dados a serem validados
+            
+        Returns:
+            Resultado da validação
+        """
+        return super().validate(data)  # type: ignore[misc]
+    
+    def validate(self, data: Any) -> ValidationResult:
+        """
+        Valida um valor, reaproveitando o resultado de valores já validados.
+        
+        Args:
+            data: Dados a serem validados
+            
+        Returns:
+            Resultado da validação, com problemas próprios desta chamada
+        """
+        try:
+            cached = self._cached_validate(data)
+        except TypeError:
+            # Valores não hasheáveis não passam pelo cache
+            return self._validate_uncached(data)
+        
+        result = ValidationResult()
+        for issue in cached.issues:
+            issue_copy = copy.copy(issue)
+            issue_copy.details = dict(issue.details)
+            result.add_issue(issue_copy)
+        return result
+    
+    def cache_info(self):
+        """Estatísticas do cache (acertos, falhas, tamanho)."""
+        return self._cached_validate.cache_info()
+
 class Normalizer(Generic[T, U], ABC):
     """
     Interface para normalizadores de dados.
@@ -28,7 +28,7 @@ class StringNormalizer(Normalizer[str, str]):
         lowercase: bool = False,
         uppercase: bool = False,
         remove_accents: bool = False,
-        replace_pattern: Optional[Tuple[str, str]] = None,
+        replace_pattern: Optional[Tuple[Union[str, Pattern[str]], str]] = None,
         validator: Optional[StringValidator] = None
     ):
         """
@@ -49,6 +49,8 @@ class StringNormalizer(Normalizer[str, str]):
         self.uppercase = uppercase
         self.remove_accents = remove_accents
         self.replace_pattern = replace_pattern
+        # Padrão de substituição compilado uma única vez, e não a cada normalização
+        self._replace_re = re.compile(replace_pattern[0]) if replace_pattern else None
         self.validator = validator or StringValidator(field_name)
     
     def _remove_accents_from_string(self, text: str) -> str:
@@ -91,9 +93,8 @@ class StringNormalizer(Normalizer[str, str]):
         if self.remove_accents:
             normalized_data = self._remove_accents_from_string(normalized_data)
         
-        if self.replace_pattern:
-            pattern, replacement = self.replace_pattern
-            normalized_data = re.sub(pattern, replacement, normalized_data)
+        if self._replace_re is not None:
+            normalized_data = self._replace_re.sub(self.replace_pattern[1], normalized_data)
         
         # Validar após normalização
         result = self.validator.validate(normalized_data)
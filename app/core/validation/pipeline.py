@@ -208,10 +208,11 @@ class ValidatingDataFrameTransformer(Transformer[pd.DataFrame, pd.DataFrame]):
             fail_on_invalid: Se deve falhar em caso de dados inválidos
             report_path: Caminho para salvar relatórios de validação
         """
-        from app.core.validation.validators import DataFrameValidator
+        from app.core.validation.vectorized import VectorizedDataFrameValidator
         
         self.name = name
-        self.validator = DataFrameValidator(
+        # Mesmos problemas da validação valor a valor, com as regras avaliadas por coluna
+        self.validator = VectorizedDataFrameValidator(
             field_name=name,
             column_validators=column_validators,
             required_columns=required_columns,
@@ -51,7 +51,7 @@ class StringValidator(Validator[str]):
         field_name: str,
         min_length: Optional[int] = None,
         max_length: Optional[int] = None,
-        pattern: Optional[str] = None,
+        pattern: Optional[Union[str, Pattern[str]]] = None,
         required: bool = True,
         allow_empty: bool = False,
         allowed_values: Optional[List[str]] = None
@@ -63,7 +63,7 @@ class StringValidator(Validator[str]):
             field_name: Nome do campo sendo validado
             min_length: Comprimento mínimo (opcional)
             max_length: Comprimento máximo (opcional)
-            pattern: Padrão regex para validação (opcional)
+            pattern: Padrão regex para validação, em texto ou já compilado (opcional)
             required: Se a string é obrigatória
             allow_empty: Se strings vazias são permitidas
             allowed_values: Lista de valores permitidos (opcional)
@@ -71,6 +71,7 @@ class StringValidator(Validator[str]):
         self.field_name = field_name
         self.min_length = min_length
         self.max_length = max_length
+        # Compilado uma única vez; um padrão já compilado é reutilizado como está
         self.pattern = re.compile(pattern) if pattern else None
         self.required = required
         self.allow_empty = allow_empty
@@ -631,12 +632,34 @@ class DataFrameValidator(Validator[pd.DataFrame]):
         # Validar cada coluna com seu respectivo validador
         for col_name, validator in self.column_validators.items():
             if col_name in data.columns:
-                for idx, value in enumerate(data[col_name]):
-                    val_result = validator.validate(value)
-                    
-                    # Adicionar informações de linha/coluna aos problemas
-                    for issue in val_result.issues:
-                        issue.field = f"{self.field_name}[{idx}].{col_name}"
-                        result.add_issue(issue)
+                result.add_issues(self._validate_column(col_name, validator, data[col_name]))
         
         return result
+    
+    def _validate_column(
+        self,
+        col_name: str,
+        validator: Validator[Any],
+        column: pd.Series
+    ) -> List[ValidationIssue]:
+        """
+        Valida os valores de uma coluna, um a um.
+        
+        Args:
+            col_name: Nome da coluna
+            validator: Validador da coluna
+            column: Valores da coluna
+            
+        Returns:
+            Problemas encontrados, na ordem das linhas
+        """
+        issues = []
+        for idx, value in enumerate(column):
+            val_result = validator.validate(value)
+            
+            # Adicionar informações de linha/coluna aos problemas
+            for issue in val_result.issues:
+                issue.field = f"{self.field_name}[{idx}].{col_name}"
+                issues.append(issue)
+        
+        return issues
@@ -0,0 +1,244 @@
+"""
+Validação vetorizada de DataFrames.
+
+Este módulo fornece um validador de DataFrames que avalia as regras dos
+validadores de coluna sobre a coluna inteira, com operações do pandas e do
+numpy, criando problemas de validação apenas para as linhas que falham.
+
+Classes:
+    VectorizedDataFrameValidator: Validador de DataFrames com regras avaliadas por coluna
+"""
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.validation.interface import Validator, ValidationIssue, ValidationSeverity
+from app.core.validation.validators import DataFrameValidator, NumericValidator, StringValidator
+
+# Problemas de uma coluna acompanhados da posição da linha que os gerou
+RowIssues = List[Tuple[int, ValidationIssue]]
+
+class VectorizedDataFrameValidator(DataFrameValidator):
+    """
+    Validador para DataFrames do pandas com regras avaliadas por coluna.
+    
+    As regras de StringValidator e NumericValidator são traduzidas em máscaras
+    booleanas sobre a coluna inteira, e os problemas gerados são os mesmos da
+    validação valor a valor de DataFrameValidator, na mesma ordem. Outros
+    validadores, e colunas cujo tipo não corresponde ao do validador, continuam
+    sendo validados valor a valor.
+    
+    Valores ausentes (None/NaN) em colunas de texto são tratados como campo
+    não fornecido.
+    
+    Example:
+        >>> validator = VectorizedDataFrameValidator(
+        ...     "producao", {"producao_ton": NumericValidator("producao_ton", min_value=0)}
+        ... )
+        >>> validator.validate(pd.DataFrame({"producao_ton": [10, -1]})).is_valid
+        False
+    """
+    
+    def _validate_column(
+        self,
+        col_name: str,
+        validator: Validator[Any],
+        column: pd.Series
+    ) -> List[ValidationIssue]:
+        """
+        Valida uma coluna com operações vetorizadas, quando possível.
+        
+        Args:
+            col_name: Nome da coluna
+            validator: Validador da coluna
+            column: Valores da coluna
+            
+        Returns:
+            Problemas encontrados, na ordem das linhas
+        """
+        # Subclasses dos validadores podem ter regras próprias: só os tipos exatos são traduzidos
+        if (
+            type(validator) is NumericValidator
+            and isinstance(column.dtype, np.dtype)
+            and column.dtype.kind in "iuf"
+        ):
+            row_issues = self._numeric_issues(col_name, validator, column)
+        elif (
+            type(validator) is StringValidator
+            and pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty")
+        ):
+            row_issues = self._string_issues(col_name, validator, column)
+        else:
+            return super()._validate_column(col_name, validator, column)
+        
+        # Ordenação estável: dentro de uma linha, os problemas seguem a ordem das regras
+        row_issues.sort(key=itemgetter(0))
+        return [issue for _, issue in row_issues]
+    
+    def _row_issues(
+        self,
+        col_name: str,
+        validator: Validator[Any],
+        mask: np.ndarray,
+        message: str,
+        value_of: Optional[Callable[[int], Any]] = None,
+        details_of: Optional[Callable[[int], Dict[str, Any]]] = None
+    ) -> RowIssues:
+        """
+        Cria um problema para cada linha em que a regra falhou.
+        
+        Args:
+            col_name: Nome da coluna
+            validator: Validador da coluna
+            mask: Máscara booleana das linhas que falharam
+            message: Mensagem do problema
+            value_of: Função que retorna o valor do problema de uma linha (opcional)
+            details_of: Função que retorna os detalhes do problema de uma linha (opcional)
+            
+        Returns:
+            Problemas com a posição da linha correspondente
+        """
+        row_issues: RowIssues = []
+        for pos in np.flatnonzero(mask).tolist():
+            # Criado com o campo do validador e depois renomeado, como na validação
+            # valor a valor, para que o código do problema seja o mesmo
+            issue = ValidationIssue(
+                field=validator.field_name,
+                message=message,
+                severity=ValidationSeverity.ERROR,
+                value=value_of(pos) if value_of else None,
+                details=details_of(pos) if details_of else None
+            )
+            issue.field = f"{self.field_name}[{pos}].{col_name}"
+            row_issues.append((pos, issue))
+        return row_issues
+    
+    def _numeric_issues(self, col_name: str, validator: NumericValidator, column: pd.Series) -> RowIssues:
+        """
+        Aplica as regras de um NumericValidator a uma coluna numérica.
+        
+        Args:
+            col_name: Nome da coluna
+            validator: Validador numérico da coluna
+            column: Coluna com dtype inteiro ou de ponto flutuante
+            
+        Returns:
+            Problemas com a posição da linha correspondente
+        """
+        values = column.to_numpy()
+        value_of = column.tolist().__getitem__
+        
+        # NaN encerra a validação da linha; nas demais regras, comparações com NaN são falsas
+        nan = np.isnan(values) if values.dtype.kind == "f" else np.zeros(len(values), dtype=bool)
+        row_issues = self._row_issues(
+            col_name, validator, nan, "Valor numérico contém NaN (não é um número)", lambda pos: "NaN"
+        )
+        
+        if validator.is_integer and values.dtype.kind == "f":
+            with np.errstate(invalid="ignore"):
+                row_issues += self._row_issues(
+                    col_name, validator, ~nan & (np.mod(values, 1) != 0), "Valor deve ser um número inteiro", value_of
+                )
+        
+        if not validator.allow_zero:
+            row_issues += self._row_issues(col_name, validator, values == 0, "Valor zero não permitido", value_of)
+        
+        if not validator.allow_negative:
+            row_issues += self._row_issues(col_name, validator, values < 0, "Valor negativo não permitido", value_of)
+        
+        if validator.min_value is not None:
+            row_issues += self._row_issues(
+                col_name,
+                validator,
+                values < validator.min_value,
+                f"Valor menor que o mínimo permitido ({validator.min_value})",
+                value_of,
+                lambda pos: {"min_value": validator.min_value}
+            )
+        
+        if validator.max_value is not None:
+            row_issues += self._row_issues(
+                col_name,
+                validator,
+                values > validator.max_value,
+                f"Valor maior que o máximo permitido ({validator.max_value})",
+                value_of,
+                lambda pos: {"max_value": validator.max_value}
+            )
+        
+        return row_issues
+    
+    def _string_issues(self, col_name: str, validator: StringValidator, column: pd.Series) -> RowIssues:
+        """
+        Aplica as regras de um StringValidator a uma coluna de texto.
+        
+        Args:
+            col_name: Nome da coluna
+            validator: Validador de strings da coluna
+            column: Coluna cujos valores presentes são todos strings
+            
+        Returns:
+            Problemas com a posição da linha correspondente
+        """
+        value_of = column.tolist().__getitem__
+        missing = column.isna().to_numpy()
+        
+        row_issues: RowIssues = []
+        if validator.required:
+            row_issues += self._row_issues(col_name, validator, missing, "Campo obrigatório não fornecido")
+        
+        # Linhas sujeitas às regras de comprimento, padrão e valores permitidos
+        checked = ~missing
+        if not validator.allow_empty:
+            empty = (column == "").to_numpy(dtype=bool, na_value=False)
+            row_issues += self._row_issues(col_name, validator, empty, "String vazia não permitida", value_of)
+            checked &= ~empty
+        
+        if validator.min_length is not None or validator.max_length is not None:
+            lengths = column.str.len().to_numpy(dtype=float, na_value=np.nan)
+            
+            if validator.min_length is not None:
+                row_issues += self._row_issues(
+                    col_name,
+                    validator,
+                    checked & (lengths < validator.min_length),
+                    f"String tem comprimento menor que o mínimo permitido ({validator.min_length})",
+                    value_of,
+                    lambda pos: {"min_length": validator.min_length, "actual_length": int(lengths[pos])}
+                )
+            
+            if validator.max_length is not None:
+                row_issues += self._row_issues(
+                    col_name,
+                    validator,
+                    checked & (lengths > validator.max_length),
+                    f"String excede o comprimento máximo permitido ({validator.max_length})",
+                    value_of,
+                    lambda pos: {"max_length": validator.max_length, "actual_length": int(lengths[pos])}
+                )
+        
+        if validator.pattern:
+            matches = column.str.match(validator.pattern, na=False).to_numpy(dtype=bool)
+            row_issues += self._row_issues(
+                col_name,
+                validator,
+                checked & ~matches,
+                "String não corresponde ao padrão exigido",
+                value_of,
+                lambda pos: {"pattern": validator.pattern.pattern}
+            )
+        
+        if validator.allowed_values:
+            allowed = column.isin(validator.allowed_values).to_numpy(dtype=bool)
+            row_issues += self._row_issues(
+                col_name,
+                validator,
+                checked & ~allowed,
+                "Valor não está entre os valores permitidos",
+                value_of,
+                lambda pos: {"allowed_values": validator.allowed_values}
+            )
+        
+        return row_issues
@@ -13,7 +13,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 # List of required packages to check
 REQUIRED_PACKAGES = [
     "fastapi", "uvicorn", "pandas", "requests", "bs4",  # bs4 is the import name for beautifulsoup4
-    "dotenv", "jose", "passlib"  # dotenv is the import name for python-dotenv
+    "dotenv", "jwt", "passlib"  # dotenv is the import name for python-dotenv, jwt for PyJWT
 ]
 
 # Check if dependencies are installed
@@ -25,7 +25,8 @@ for package in REQUIRED_PACKAGES:
         # Map import names to PyPI package names for clear error messages
         package_mapping = {
             "bs4": "beautifulsoup4",
-            "dotenv": "python-dotenv"
+            "dotenv": "python-dotenv",
+            "jwt": "PyJWT"
         }
         # Use the PyPI package name in the error message if available
         missing_packages.append(package_mapping.get(package, package))
@@ -177,6 +177,51 @@ async def test_get_cache_info():
     assert cache_info["valid_entries"] == 0
     assert cache_info["expired_entries"] == 1
 
+@pytest.mark.asyncio
+async def test_request_scoped_cache():
+    """Testa se o cache da requisição atende leituras repetidas e respeita invalidações"""
+    from app.core.cache import MemoryCacheProvider, REQ_CACHE
+    
+    provider = MemoryCacheProvider()
+    await provider.set("chave", "valor")
+    
+    token = REQ_CACHE.set({})
+    try:
+        assert await provider.get("chave") == "valor"
+        
+        # Alterar o cache do processo diretamente: a requisição continua vendo o valor já lido
+        provider._cache["chave"] = "alterado"
+        assert await provider.get("chave") == "valor"
+        
+        # Escritas e remoções invalidam o valor da requisição
+        await provider.set("chave", "novo")
+        assert await provider.get("chave") == "novo"
+        await provider.delete("chave")
+        assert await provider.get("chave") is None
+    finally:
+        REQ_CACHE.reset(token)
+    
+    # Fora de uma requisição o cache do processo é consultado diretamente
+    await provider.set("chave", "valor")
+    provider._cache["chave"] = "alterado"
+    assert await provider.get("chave") == "alterado"
+
+def test_memory_provider_counts_hits_and_misses():
+    """Ler as estatísticas não altera os contadores de hits e misses"""
+    from app.core.cache import MemoryCacheProvider
+    
+    provider = MemoryCacheProvider()
+    provider.set_sync("chave", "valor")
+    
+    provider.get_sync("chave")
+    assert provider.get_info_sync().hits == 1
+    
+    provider.get_sync("chave")
+    provider.get_sync("ausente")
+    info = provider.get_info_sync()
+    assert info.hits == 2
+    assert info.misses == 1
+
 # Adicionar este código ao final do arquivo para permitir execução direta
 if __name__ == "__main__":
     import pytest
@@ -0,0 +1,73 @@
+import logging
+import os
+import sys
+
+from app.core.exceptions import BaseAppException, NotFoundException, handle_exception
+
+
+def _raise_value_error():
+    raise ValueError("bad")
+
+
+def test_handle_exception_keeps_traceback_while_handling():
+    """O traceback da exceção original continua disponível durante o tratamento"""
+    try:
+        _raise_value_error()
+    except ValueError as exc:
+        app_exception = handle_exception(exc)
+
+        assert isinstance(app_exception, BaseAppException)
+        assert sys.exc_info()[2] is not None
+        assert "_raise_value_error" in app_exception.traceback_info
+
+
+def test_release_traceback_keeps_formatted_text():
+    """release_traceback libera os frames, mas traceback_info mantém o texto"""
+    try:
+        _raise_value_error()
+    except ValueError as exc:
+        app_exception = handle_exception(exc)
+        app_exception.release_traceback()
+
+        assert exc.__traceback__ is None
+
+    # Fora do bloco except, o texto guardado continua disponível
+    assert "_raise_value_error" in app_exception.traceback_info
+    assert "ValueError: bad" in app_exception.traceback_info
+
+
+def test_traceback_info_outside_except_uses_original_exception():
+    """Sem exceção em tratamento, traceback_info usa a exceção original"""
+    try:
+        _raise_value_error()
+    except ValueError as exc:
+        original = exc
+
+    app_exception = BaseAppException("wrapped", original_exception=original)
+    assert "_raise_value_error" in app_exception.traceback_info
+
+
+def _create_not_found():
+    return NotFoundException("missing")
+
+
+def test_exception_log_has_origin_without_source_info(caplog, monkeypatch):
+    """Sem include_source_info, o log da exceção ainda indica onde ela foi criada"""
+    monkeypatch.setattr(logging, "_srcfile", None)
+    with caplog.at_level(logging.INFO, logger="app.core.exceptions"):
+        _create_not_found()
+
+    record = caplog.records[-1]
+    assert record._extras["function"] == "_create_not_found"
+    assert record._extras["file"] == __file__
+
+
+def test_exception_log_origin_with_source_info(caplog, monkeypatch):
+    """Com include_source_info, a origem vem do próprio registro de log"""
+    monkeypatch.setattr(logging, "_srcfile", os.path.normcase(logging.addLevelName.__code__.co_filename))
+    with caplog.at_level(logging.INFO, logger="app.core.exceptions"):
+        _create_not_found()
+
+    record = caplog.records[-1]
+    assert record.funcName == "_create_not_found"
+    assert not hasattr(record, "_extras")
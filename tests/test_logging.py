@@ -0,0 +1,66 @@
+import inspect
+import io
+import logging
+import queue
+import time
+
+import app.core.logging as app_logging
+from app.core.logging import (
+    _BufferedQueueListener,
+    _BufferedStreamHandler,
+    _FLUSH_INTERVAL,
+    _apply_source_info,
+)
+
+
+def _record(msg):
+    return logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+
+def test_queue_listener_flushes_while_queue_is_busy():
+    """O buffer é gravado a cada _FLUSH_INTERVAL mesmo sem a fila esvaziar"""
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8")
+    handler = _BufferedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = _BufferedQueueListener(log_queue, handler)
+    listener.start()
+    try:
+        # Mantém a fila ocupada: nunca fica vazia por _FLUSH_INTERVAL
+        deadline = time.monotonic() + _FLUSH_INTERVAL * 10
+        flushed = False
+        while time.monotonic() < deadline and not flushed:
+            log_queue.put(_record("busy"))
+            time.sleep(_FLUSH_INTERVAL / 10)
+            flushed = b"busy" in raw.getvalue()
+        assert flushed
+    finally:
+        listener.stop()
+
+
+def test_source_info_is_restored(monkeypatch):
+    """include_source_info=True desfaz os ajustes de uma configuração anterior"""
+    for name in ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, name, getattr(logging, name))
+    monkeypatch.setattr(app_logging, "_saved_source_info", None)
+
+    _apply_source_info(False)
+    assert logging._srcfile is None
+    assert not logging.logThreads
+
+    _apply_source_info(True)
+    assert logging._srcfile is not None
+    assert logging.logThreads
+    assert logging.logProcesses
+
+
+def test_source_info_untouched_by_default(monkeypatch):
+    """Por padrão, setup_logging não altera os ajustes globais do logging"""
+    monkeypatch.setattr(logging, "logThreads", False)
+    monkeypatch.setattr(app_logging, "_saved_source_info", None)
+
+    assert inspect.signature(app_logging.setup_logging).parameters["include_source_info"].default is True
+    _apply_source_info(True)
+
+    assert logging.logThreads is False
@@ -1,7 +1,10 @@
+import logging
+
 import pytest
 from fastapi import FastAPI, Response
 from fastapi.testclient import TestClient
-from app.core.middleware import CacheControlMiddleware
+from app.core.logging import TextFormatter
+from app.core.middleware import CacheControlMiddleware, RequestLoggingMiddleware
 
 # Cria um app FastAPI simples para testar o middleware
 app = FastAPI()
@@ -51,3 +54,25 @@ def test_cache_headers_not_added_for_post():
     assert response.status_code == 405  # Method not allowed
     # Se houver um handler para POST, o teste deve verificar:
     # assert "Cache-Control" not in response.headers
+
+def test_request_logging_details_in_text_logs(caplog):
+    """Os detalhes da requisição aparecem nos logs em texto (LOG_JSON=false)"""
+    logging_app = FastAPI()
+    logging_app.add_middleware(RequestLoggingMiddleware)
+
+    @logging_app.get("/logged")
+    async def logged_endpoint():
+        return {"message": "ok"}
+
+    with caplog.at_level(logging.INFO):
+        TestClient(logging_app).get("/logged?ano=2020", headers={"X-Request-ID": "req-123"})
+
+    formatter = TextFormatter("%(levelname)s - %(message)s")
+    lines = [formatter.format(record) for record in caplog.records]
+    received = next(line for line in lines if "Request received" in line)
+    sent = next(line for line in lines if "Response sent" in line)
+
+    assert '"id":"req-123"' in received.replace(" ", "")
+    assert "ano=2020" in received
+    assert "process_time_ms" in sent
+    assert "content_type" in sent
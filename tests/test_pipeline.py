@@ -0,0 +1,245 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pandas as pd
+import pytest
+
+from app.core import pipeline as pipeline_module
+from app.core.pipeline import (
+    _pyarrow_csv_supported,
+    APIExtractor,
+    BatchingAPIExtractor,
+    CacheLoader,
+    CSVExtractor,
+    DataFrameTransformer,
+    Extractor,
+    LazyDataFrameStep,
+    Pipeline,
+    StreamingPipeline,
+)
+
+
+class StaticExtractor(Extractor):
+    """Extrator que retorna um valor fixo"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def extract(self):
+        return self.value
+
+
+def _parallel_pipeline():
+    return Pipeline("parallel").add_parallel_extractors(
+        StaticExtractor("a"), StaticExtractor("b")
+    ).add_step(lambda data: "".join(data))
+
+
+def test_parallel_extractors_execute():
+    """Sem event loop, execute retorna os dados de todos os extratores"""
+    assert _parallel_pipeline().execute() == "ab"
+
+
+async def test_parallel_extractors_execute_inside_running_loop():
+    """execute chamado dentro de um event loop não passa a corrotina adiante"""
+    asyncio.get_running_loop()
+    assert _parallel_pipeline().execute() == "ab"
+
+
+async def test_parallel_extractors_aexecute():
+    """aexecute aguarda as extrações no event loop atual"""
+    assert await _parallel_pipeline().aexecute() == "ab"
+
+
+class APIHandler(BaseHTTPRequestHandler):
+    """API de teste: GET responde devagar; POST responde a cada lote com o id
+    de cada requisição e o tamanho do lote"""
+
+    def do_GET(self):
+        # Resposta lenta, para os testes de timeout
+        time.sleep(0.3)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        batch = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps([{"id": params["id"], "batch_size": len(batch)} for params in batch]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), APIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _batched_pipeline(url):
+    batcher = BatchingAPIExtractor(url, batch_size=10, flush_interval_ms=20)
+    return Pipeline("batched").add_parallel_extractors(
+        *(batcher.for_params({"id": i}) for i in range(3))
+    )
+
+
+def test_batching_extractor_execute_sends_one_batch(api_url):
+    """As requisições paralelas vão em um único lote e os clientes do loop são fechados"""
+    result = _batched_pipeline(f"{api_url}/batch").execute()
+
+    assert result == [{"id": i, "batch_size": 3} for i in range(3)]
+    assert len(pipeline_module._async_http_clients) == 0
+
+
+async def test_batching_extractor_aexecute(api_url):
+    """aexecute agrupa as requisições no event loop atual"""
+    result = await _batched_pipeline(f"{api_url}/batch").aexecute()
+
+    assert result == [{"id": i, "batch_size": 3} for i in range(3)]
+
+
+def test_batched_request_extract_requires_event_loop(api_url):
+    """extract síncrono não forma lotes e indica o caminho assíncrono"""
+    extractor = BatchingAPIExtractor(f"{api_url}/batch").for_params({"id": 1})
+
+    with pytest.raises(RuntimeError, match="aexecute"):
+        extractor.extract()
+
+
+def test_api_extractor_timeout_is_per_extractor(api_url):
+    """Extratores da mesma origem compartilham o cliente, mas não o timeout"""
+    slow_url = f"{api_url}/slow"
+    assert APIExtractor(slow_url, timeout=5.0).extract() == {}
+
+    with pytest.raises(httpx.TimeoutException):
+        APIExtractor(slow_url, timeout=0.05).extract()
+
+
+async def test_api_extractor_async_timeout_is_per_extractor(api_url):
+    """O mesmo vale para o cliente assíncrono"""
+    slow_url = f"{api_url}/slow"
+    assert await APIExtractor(slow_url, timeout=5.0).aextract() == {}
+
+    with pytest.raises(httpx.TimeoutException):
+        await APIExtractor(slow_url, timeout=0.05).aextract()
+
+
+def test_streaming_pipeline_processes_each_chunk(tmp_path):
+    """Cada bloco do CSV passa pelos passos seguintes, na ordem de leitura"""
+    csv_path = tmp_path / "producao.csv"
+    pd.DataFrame({"ano": range(10), "valor": range(10)}).to_csv(csv_path, index=False)
+
+    pipeline = StreamingPipeline("blocos", max_queue_size=2)
+    pipeline.add_extractor(CSVExtractor(str(csv_path), streaming=True, chunksize=4))
+    pipeline.add_step(lambda chunk: int(chunk["valor"].sum()))
+
+    assert pipeline.execute() == [6, 22, 17]
+
+
+def test_lazy_steps_match_eager_operations():
+    """Passos lazy consecutivos, fundidos, dão o mesmo resultado das operações do pandas"""
+    df = pd.DataFrame({"ano": [1999, 2005, 2010, 2020], "valor": [1.0, 2.0, 3.0, 4.0]})
+    pipeline = Pipeline("lazy")
+    pipeline.add_step(lambda: df)
+    for step in (
+        LazyDataFrameStep.filter("ano > 2000"),
+        LazyDataFrameStep.filter("valor < 4"),
+        LazyDataFrameStep.assign(dobro="valor * 2"),
+        LazyDataFrameStep.select(["ano", "dobro"]),
+    ):
+        pipeline.add_transformer(step)
+
+    expected = df.query("ano > 2000 and valor < 4").assign(dobro=lambda d: d["valor"] * 2)[["ano", "dobro"]]
+    pd.testing.assert_frame_equal(pipeline.execute(), expected)
+    pd.testing.assert_frame_equal(LazyDataFrameStep.filter("ano > 2000").transform(df), df[df["ano"] > 2000])
+
+
+def test_cache_loader_stores_in_provider():
+    """CacheLoader grava no provider padrão, com tags quando informadas"""
+    from app.core.cache.factory import CacheFactory
+
+    provider = CacheFactory.get_instance().get_provider(None)
+    assert CacheLoader("pipeline:teste", ttl_seconds=60).load({"a": 1}) is True
+    assert CacheLoader("pipeline:tags", ttl_seconds=60, tags=["pipeline"]).load([1]) is True
+
+    assert asyncio.run(provider.get("pipeline:teste")) == {"a": 1}
+    assert asyncio.run(provider.get("pipeline:tags")) == [1]
+
+
+def test_cache_loader_falls_back_to_local_cache(monkeypatch):
+    """Se o provider falha, os dados ficam no cache local"""
+    from app.core.cache.factory import CacheFactory
+
+    def failing_provider(self, name=None):
+        raise RuntimeError("provider indisponível")
+
+    monkeypatch.setattr(CacheFactory, "get_provider", failing_provider)
+
+    assert CacheLoader("pipeline:local", ttl_seconds=60).load("dados") is False
+    assert CacheLoader.get_local("pipeline:local") == "dados"
+
+
+def test_dataframe_transformer_updates_integer_column_labels():
+    """apply_function e fill_na funcionam com rótulos de coluna que não são strings"""
+    df = pd.DataFrame({0: [1.0, None], 1: [2, 3]})
+    transformer = DataFrameTransformer()
+
+    filled = transformer.fill_na(df, 0, columns=[0])
+    doubled = transformer.apply_function(df, lambda value: value * 2, columns=[1])
+
+    assert filled[0].tolist() == [1.0, 0.0]
+    assert doubled[1].tolist() == [4, 6]
+    assert df[0].isna().sum() == 1
+    assert df[1].tolist() == [2, 3]
+
+
+def test_csv_extractor_keeps_numpy_dtypes_by_default(tmp_path):
+    """Sem arrow_dtypes, o CSV é lido com os dtypes padrão do pandas"""
+    csv_path = tmp_path / "vinhos.csv"
+    csv_path.write_text("nome,preco\nMerlot,10.5\nSyrah,\n", encoding="utf-8")
+
+    extractor = CSVExtractor(str(csv_path))
+    df = extractor.extract()
+
+    assert "dtype_backend" not in extractor.read_csv_kwargs
+    assert df["preco"].dtype == "float64"
+    assert pd.isna(df["preco"].iloc[1]) and df["preco"].iloc[1] is not pd.NA
+
+
+def test_pyarrow_engine_only_for_supported_options():
+    """O engine pyarrow só é escolhido quando aceita todos os argumentos do read_csv"""
+    assert _pyarrow_csv_supported({})
+    assert _pyarrow_csv_supported({"sep": ";", "encoding": "latin-1", "skiprows": 1})
+    assert not _pyarrow_csv_supported({"sep": ";", "thousands": "."})
+    assert not _pyarrow_csv_supported({"skipfooter": 1})
+    assert not _pyarrow_csv_supported({"nrows": 10})
+    assert not _pyarrow_csv_supported({"converters": {"ano": int}})
+    assert not _pyarrow_csv_supported({"sep": r"\s+"})
+    assert not _pyarrow_csv_supported({"chunksize": 100})
+
+
+def test_csv_extractor_reads_thousands_separator(tmp_path):
+    """Argumentos que o engine pyarrow rejeita continuam funcionando"""
+    csv_path = tmp_path / "producao.csv"
+    csv_path.write_text("ano;litros\n2020;1.234.567\n", encoding="utf-8")
+
+    extractor = CSVExtractor(str(csv_path), sep=";", thousands=".")
+
+    assert extractor.read_csv_kwargs.get("engine") != "pyarrow"
+    assert extractor.extract()["litros"].tolist() == [1234567]
@@ -0,0 +1,137 @@
+import csv
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.validation.examples import (
+    LimpezaLinhasTransformer,
+    _ReportingRowTransformer,
+    create_validation_pipeline,
+)
+from app.core.validation.interface import MemoizedValidator, ValidationIssue, ValidationSeverity
+from app.core.validation.validators import DataFrameValidator, NumericValidator, StringValidator
+from app.core.validation.vectorized import VectorizedDataFrameValidator
+
+
+def _expected_code(field, message, severity, value=None):
+    base_string = f"{field}:{message}:{severity}"
+    if value is not None:
+        base_string += f":{value}"
+    return f"VAL-{hashlib.md5(base_string.encode()).hexdigest()[:6]}"
+
+
+def test_issue_code_uses_field_at_creation():
+    """O código não muda quando field é reescrito antes da primeira leitura"""
+    issue = ValidationIssue("ano", "Valor negativo não permitido", ValidationSeverity.ERROR, value=-1)
+    expected = _expected_code("ano", "Valor negativo não permitido", "error", -1)
+
+    issue.field = "producao[0].ano"
+
+    assert issue.code == expected
+    assert issue.to_dict()["field"] == "producao[0].ano"
+
+
+def test_issue_code_is_stable_after_field_rewrite():
+    """Ler o código antes ou depois de reescrever field dá o mesmo resultado"""
+    before = ValidationIssue("ano", "Campo obrigatório não fornecido")
+    after = ValidationIssue("ano", "Campo obrigatório não fornecido")
+
+    code_before = before.code
+    before.field = after.field = "producao.ano"
+
+    assert after.code == code_before
+    assert ValidationIssue("ano", "msg", code="VAL-custom").code == "VAL-custom"
+
+
+def test_reporting_row_transformer_is_abstract():
+    """Transformadores de linhas precisam implementar _rows"""
+    with pytest.raises(TypeError):
+        _ReportingRowTransformer("linhas")
+
+
+def test_limpeza_linhas_removes_only_identical_rows():
+    """Linhas duplicadas são removidas; linhas distintas são mantidas"""
+    rows = [
+        {"nome": "Merlot", "preco": "10"},
+        {"nome": "Merlot", "preco": "10"},
+        {"nome": "Merlot", "preco": "12"},
+        {"nome": "Syrah", "preco": ""},
+    ]
+
+    result = list(LimpezaLinhasTransformer().transform(iter(rows)))
+
+    assert [row["nome"] for row in result] == ["Merlot", "Merlot", "Syrah"]
+    assert result[2]["preco"] == 11
+
+
+def test_streaming_validation_pipeline(tmp_path):
+    """O pipeline em linhas valida, normaliza e grava o CSV de saída"""
+    input_file = tmp_path / "vinhos.csv"
+    input_file.write_text(
+        "nome,tipo,safra,preco\n"
+        "  Merlot ,Tinto,2015,10.456\n"
+        "  Merlot ,Tinto,2015,10.456\n"
+        "X,Tinto,1800,-1\n",
+        encoding="utf-8"
+    )
+    output_file = tmp_path / "saida.csv"
+    report_dir = tmp_path / "reports"
+
+    create_validation_pipeline(
+        str(input_file), str(output_file), str(report_dir), streaming=True
+    ).execute()
+
+    with open(output_file, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == 2
+    assert rows[0]["nome"] == "Merlot"
+    assert rows[0]["tipo"] == "TINTO"
+    assert float(rows[0]["preco"]) == 10.46
+    report = json.loads((report_dir / "validacao_vinhos_rows_validation.json").read_text(encoding="utf-8"))
+    assert "validacao_vinhos[1].safra" in json.dumps(report)
+
+
+class CachedNumericValidator(MemoizedValidator, NumericValidator):
+    pass
+
+
+def test_memoized_validator_reuses_results():
+    """Valores repetidos reaproveitam o resultado, com problemas independentes"""
+    validator = CachedNumericValidator("safra", min_value=1900, cache_size=16)
+
+    first = validator.validate(1850)
+    first.issues[0].field = "vinhos[0].safra"
+    second = validator.validate(1850)
+
+    assert not second.is_valid
+    assert second.issues[0].field == "safra"
+    assert second.issues[0].code == first.issues[0].code
+    assert validator.cache_info().hits == 1
+
+
+def _issue_dicts(result):
+    return [issue.to_dict() for issue in result.issues]
+
+
+def test_vectorized_dataframe_validator_matches_row_by_row():
+    """A validação vetorizada gera os mesmos problemas, na mesma ordem"""
+    column_validators = {
+        "nome": StringValidator("nome", min_length=2, pattern=r"[A-Z]", allowed_values=["Merlot", "Syrah", "x"]),
+        "safra": NumericValidator("safra", min_value=1900, max_value=2024, is_integer=True),
+        "preco": NumericValidator("preco", allow_zero=False),
+    }
+    df = pd.DataFrame({
+        "nome": ["Merlot", "x", "", "syrah", "Cabernet"],
+        "safra": [2015.0, 1850.0, 2015.5, np.nan, 2030.0],
+        "preco": [10, 0, -1, 5, 3],
+    })
+
+    expected = DataFrameValidator("vinhos", column_validators).validate(df)
+    result = VectorizedDataFrameValidator("vinhos", column_validators).validate(df)
+
+    assert _issue_dicts(result) == _issue_dicts(expected)
+    assert len(result.issues) > 0